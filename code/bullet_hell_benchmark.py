@@ -0,0 +1,114 @@
+import os
+import sys
+import time
+import random
+
+#Run headless: no window and no audio device are needed
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+import pygame as pg
+
+from resources.projectile import ProjectileGroup, DIRECTIONS
+from resources.planet import PlanetGroup
+from resources.spatial_hash import SpatialHash
+from resources.alien_hunt.ah_settings import AHSettings
+from resources.alien_hunt.ufo import RedUfoFleet, GreenUfoFleet, BlueUfoFleet
+
+class BulletHellBenchmark:
+    """A headless stress scenario measuring how the projectile system scales."""
+
+    phases = ("spawn", "update", "cull", "collide", "draw")
+
+    def __init__(self, pg, width=1920, height=1080):
+        """Builds the screen, the planets and a full UFO fleet."""
+        self.pg = pg
+        self.pg.init()
+
+        self.screen = pg.display.set_mode((width, height))
+        self.screen_rect = self.screen.get_rect()
+
+        #Settings of a late Alien Hunt level
+        self.settings = AHSettings()
+        self.settings.red_ufo_limit = 40
+        self.settings.green_ufo_limit = 30
+        self.settings.blue_ufo_limit = 30
+
+        self.planets = PlanetGroup(self)
+        self.planets.create_planets()
+
+        self.fleets = (RedUfoFleet(self), GreenUfoFleet(self), BlueUfoFleet(self))
+        obstacles = self.planets.boxes()
+        for fleet in self.fleets:
+            fleet.create_fleet(obstacles)
+            obstacles = np.concatenate((obstacles, fleet.boxes()))
+
+        self.projectiles = ProjectileGroup(self, 'resources/images/star_red.bmp')
+        self.spatial_hash = SpatialHash(self.screen_rect)
+        self.directions = list(DIRECTIONS)
+
+    def _spawn(self, count):
+        """Adds projectiles at random positions, cycling through the eight directions."""
+        for n in range(count):
+            position = random.randrange(0, self.screen_rect.width), random.randrange(0, self.screen_rect.height)
+            self.projectiles.add(self.projectiles.create_projectile(position, self.directions[n % 8]))
+
+    def run(self, projectile_count, frames, dt=1 / 60):
+        """
+        Keeps the pool filled with projectile_count projectiles for a number of frames.
+        Returns the average time of each phase in milliseconds per frame.
+        """
+        self.projectiles.clear_projectiles()
+        self._spawn(projectile_count)
+
+        timings = dict.fromkeys(self.phases, 0.0)
+        for _ in range(frames):
+            start = time.perf_counter()
+            self._spawn(projectile_count - len(self.projectiles))
+            spawned = time.perf_counter()
+
+            self.projectiles.update(dt, self.settings.projectile_speed)
+            updated = time.perf_counter()
+
+            self.projectiles.retire_expired()
+            culled = time.perf_counter()
+
+            self.spatial_hash.rebuild({fleet.kind: (fleet.boxes(), fleet.row_sprites[:fleet.count]) for fleet in self.fleets})
+            self.projectiles.swept_pairs(self.spatial_hash, *(fleet.kind for fleet in self.fleets))
+            collided = time.perf_counter()
+
+            self.projectiles.blit_projectile()
+            drawn = time.perf_counter()
+
+            timings["spawn"] += spawned - start
+            timings["update"] += updated - spawned
+            timings["cull"] += culled - updated
+            timings["collide"] += collided - culled
+            timings["draw"] += drawn - collided
+
+        return {phase: total / frames * 1000 for phase, total in timings.items()}
+
+    def report(self, projectile_counts, frames):
+        """Prints the per-phase cost for each projectile count."""
+        ufo_count = sum(len(fleet) for fleet in self.fleets)
+        print(f"Bullet hell benchmark: {ufo_count} UFOs, {frames} frames per run, ms per frame")
+        print(f"{'projectiles':>12}" + "".join(f"{phase:>10}" for phase in self.phases) + f"{'total':>10}{'max fps':>10}")
+
+        #Compile the kernels before timing anything
+        self.run(100, 2)
+
+        for projectile_count in projectile_counts:
+            timings = self.run(projectile_count, frames)
+            total = sum(timings.values())
+            print(f"{projectile_count:>12}" + "".join(f"{timings[phase]:>10.3f}" for phase in self.phases) +
+                  f"{total:>10.3f}{1000 / total:>10.1f}")
+
+if __name__ == '__main__':
+    #Usage: python bullet_hell_benchmark.py [frames] [projectile counts...]
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    projectile_counts = [int(count) for count in sys.argv[2:]] or [1_000, 10_000, 100_000]
+
+    random.seed(0)
+    benchmark = BulletHellBenchmark(pg=pg)
+    benchmark.report(projectile_counts, frames)
@@ -0,0 +1,5 @@
+import os
+
+#The tests never open a window or play a sound
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
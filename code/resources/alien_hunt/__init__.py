@@ -4,6 +4,7 @@ from .alien_hunt import AlienHunt
 from .rocket import Rocket
 from ..projectile import ProjectileGroup
 from .ufo import RedUfoFleet, GreenUfoFleet, BlueUfoFleet
+from .flow_field import FlowField
 from .gamestats import GameStats
 from ..explosion import ExplosionGroup
 from ..planet import PlanetGroup
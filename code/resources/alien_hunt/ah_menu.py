@@ -19,6 +19,11 @@ class AlienHuntStaticMenu:
         self.play_button.rect.midtop = self.game_instance.screen_rect.midtop
         self.play_button.rect.y = self.game_instance.screen_rect.height/4
 
+        #HORDE button
+        self.horde_button = Button(self.game_instance, 300, 100, 'purple', 'yellow')
+        self.horde_button.rect.midtop = self.game_instance.screen_rect.midtop
+        self.horde_button.rect.y = self.game_instance.screen_rect.height*3/8
+
         #BACK button 
         self.back_button = Button(self.game_instance, 300, 100, 'red', 'white')
         self.back_button.rect.midtop = self.game_instance.screen_rect.midtop
@@ -44,6 +49,10 @@ class AlienHuntStaticMenu:
         self.play_button._prep_text('PLAY', 56)
         self.play_button.draw_button()
 
+        #Draw HORDE button
+        self.horde_button._prep_text('HORDE', 56)
+        self.horde_button.draw_button()
+
         #Draw BACK button 
         self.back_button._prep_text('BACK', 56)
         self.back_button.draw_button()
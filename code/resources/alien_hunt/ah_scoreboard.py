@@ -1,8 +1,6 @@
 import pygame
-from pygame.sprite import Group
 
 from resources.button import Button
-from resources.alien_hunt.rocket import Rocket
 
 class ScoreBoard:
     """A class to report scoring information."""
@@ -33,6 +31,16 @@ class ScoreBoard:
         self.game_over_button = Button(self, 500, 150, 'red', 'white')
         self.game_over_button.rect.center = self.screen_rect.center
 
+        #Icon for the rockets left
+        self.rocket_icon = pygame.image.load('resources/images/rocket_up.bmp')
+
+        #Font for the level
+        self.font = pygame.font.Font('resources/font/Dune_Rise.otf', 40)
+        self.font.set_underline(True)
+
+        #Font for the performance report
+        self.performance_font = pygame.font.Font('resources/font/SEGA.TTF', 16)
+
     def draw_board(self):
         """Draws the buttons of the scoreboard."""
         self.timer_button._prep_text(str(self.settings.counter), 50)
@@ -48,25 +56,29 @@ class ScoreBoard:
         
         #Button for level
         pygame.draw.circle(self.screen, 'white', (self.screen_rect.width -110, 190), 50, 2)
-        self.font = pygame.font.Font('resources/font/Dune_Rise.otf', 40)
-        self.font.set_underline(True)
         self.text_image = self.font.render(str(self.stats.level), True, 'red', None)
         self.text_image_rect = self.text_image.get_rect()
         self.text_image_rect.center = (self.screen_rect.width -110, 190)
         self.screen.blit(self.text_image, self.text_image_rect)
 
         #Rockets left
-        self.rockets = Group()
-        for rocket_number in range(self.stats.rocket_left):
-            rocket = Rocket(self.game_instance)
-            rocket.image = rocket.up_image
-            rocket.rect = rocket.up_image_rect
-            rocket.rect.x = 20 + rocket_number * rocket.rect.width
-            rocket.rect.y = 150
-            self.rockets.add(rocket)
-            self.rockets.draw(self.screen)
+        icon_width = self.rocket_icon.get_width()
+        self.screen.blits(
+            [(self.rocket_icon, (20 + rocket_number * icon_width, 150)) for rocket_number in range(self.stats.rocket_left)],
+            doreturn=False)
 
         #if self.game_instance.game_over:
             #Draw game over button
             #self.game_over_button._prep_text('GAME OVER!', 56)
             #self.game_over_button.draw_button()
+
+    def draw_performance(self, entity_counts, section_times, fps):
+        """Draws the entity counts and the time per subsystem at the bottom of the screen."""
+        counts = "  ".join(f"{name} {count:,}" for name, count in entity_counts.items())
+        times = "  ".join(f"{name} {time:.1f} ms" for name, time in section_times.items())
+        report = f"{counts}   {times}   frame {sum(section_times.values()):.1f} ms   {fps:.0f} fps"
+
+        text_image = self.performance_font.render(report, True, 'white', 'black')
+        text_image_rect = text_image.get_rect()
+        text_image_rect.bottomleft = (20, self.screen_rect.bottom - 20)
+        self.screen.blit(text_image, text_image_rect)
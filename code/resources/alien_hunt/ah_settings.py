@@ -18,6 +18,13 @@ class AHSettings:
         self.green_ufo_increase = 2
         self.green_ufo_speed = 150
 
+        #Green ufos swarm instead of shuttling when set, and always in horde mode
+        self.green_ufo_swarm = False
+        self.swarm_radius = 60
+        self.swarm_separation = 1.5
+        self.swarm_alignment = 1.0
+        self.swarm_cohesion = 0.8
+
         #Blue ufos settings
         self.blue_ufo_increase = 3
 
@@ -34,6 +41,20 @@ class AHSettings:
         self.boost_level_1 = 1
         self.boost_level_2 = 1
 
+        #Red ufos chase the rocket from this level on, and always in horde mode
+        self.pursuit_level = 4
+        self.pursuit_speed = 60
+
+        #Horde mode settings: extra ufos spawned per second each level and the most on screen at once
+        self.horde_spawn_increase = 20
+        self.horde_ufo_limit = 2000
+
+        #Share of red, green and blue ufos in the horde
+        self.horde_shares = (0.5, 0.35, 0.15)
+
+        #Ufos never spawn this close to the rocket
+        self.horde_safe_distance = 200
+
         self.initialize_dynamic_settings()
 
     def initialize_dynamic_settings(self):
@@ -51,6 +72,8 @@ class AHSettings:
         self.red_ufo_points = 20
         self.green_ufo_points = 30
         self.blue_ufo_points = 50
+        self.horde_mode = False
+        self.horde_spawn_rate = 40
     
     def increase_difficulty(self):
         """Increases speed settings the number of ufos generated."""
@@ -67,4 +90,12 @@ class AHSettings:
         self.planet_counter = 0
         self.red_ufo_points = int(self.red_ufo_points * self.score_scale)
         self.green_ufo_points = int(self.green_ufo_points * self.score_scale)
-        self.blue_ufo_points = int(self.blue_ufo_points * self.score_scale)
\ No newline at end of file
+        self.blue_ufo_points = int(self.blue_ufo_points * self.score_scale)
+
+    def increase_horde_difficulty(self):
+        """Makes the horde spawn faster and score more, the playtime starts over."""
+        self.horde_spawn_rate += self.horde_spawn_increase
+        self.counter = self.playtime
+        self.red_ufo_points = int(self.red_ufo_points * self.score_scale)
+        self.green_ufo_points = int(self.green_ufo_points * self.score_scale)
+        self.blue_ufo_points = int(self.blue_ufo_points * self.score_scale)
@@ -1,18 +1,22 @@
 import sys
 from pathlib import Path
 import json
-import random
 import threading
+import numpy as np
 
 from .ah_menu import AlienHuntStaticMenu, AlienHuntDynamicMenu
 from .rocket import Rocket
-from ..projectile import ProjectileGroup
+from ..projectile import ProjectileGroup, DIRECTION_NAMES
 from .ufo import RedUfoFleet, GreenUfoFleet, BlueUfoFleet
+from .flow_field import FlowField
 from .ah_settings import AHSettings
 from .gamestats import GameStats
 from .ah_scoreboard import ScoreBoard
 from ..explosion import ExplosionGroup
 from ..planet import PlanetGroup
+from ..frame_profiler import FrameProfiler
+from ..spatial_hash import SpatialHash
+from ..collision_events import CollisionEvents
 
 class AlienHunt:
     """
@@ -33,7 +37,7 @@ class AlienHunt:
         #Load the background image and center it
         self.bg_image = self.pg.image.load('resources/images/pia23865-2.webp')
         self.bg_image = self.pg.transform.scale(
-            self.bg_image, (game_instance.window_width, game_instance.window_height))
+            self.bg_image, (game_instance.window_width, game_instance.window_height)).convert()
         self.bg_image_rect = self.bg_image.get_rect()
         self.bg_image_rect.center = self.screen_rect.center
 
@@ -63,6 +67,18 @@ class AlienHunt:
         self.red_ufos = RedUfoFleet(self)
         self.green_ufos = GreenUfoFleet(self)
         self.blue_ufos = BlueUfoFleet(self)
+
+        #Shared map that leads chasing ufos to the rocket around the planets
+        self.flow_field = FlowField(self)
+
+        #Broadphase for every collision check, rebuilt once per frame
+        self.spatial_hash = SpatialHash(self.screen_rect)
+
+        #What the collision queries found this frame, consumed in bulk once they are all done
+        self.collision_events = CollisionEvents((
+            "rocket_ufo", "rocket_projectile_ufo", "rocket_projectile_planet",
+            "ufo_projectile_planet", "ufo_projectile_rocket", "ufo_projectile_ufo",
+            ))
         
         #Set up a TIMER_EVENT
         self.timer_event = self.pg.USEREVENT + 1
@@ -87,6 +103,20 @@ class AlienHunt:
         #Explosion animations
         self.explosions = ExplosionGroup(self)
 
+        #Preloaded sounds
+        self.fire_sound = self.pg.mixer.Sound('resources/sounds/hit_sound.mp3')
+        self.explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
+
+        #Random generator for the blue UFOs' volleys and the horde
+        self.rng = np.random.default_rng()
+
+        #Ufos owed to the horde, spawned once they add up to whole ones
+        self.horde_spawn_budget = 0.0
+
+        #Time spent in each subsystem, shown with F3 and always in horde mode
+        self.profiler = FrameProfiler(("update", "collide", "draw"))
+        self.show_performance = False
+
     def _create_planets_group(self):
         """Creates a group of planets randomly placed over the screen."""
         #Empty the group of previous elems
@@ -95,6 +125,9 @@ class AlienHunt:
     
         self.planets.create_planets()
 
+        #Ufo centers must keep half a ufo away from planets
+        self.flow_field.set_obstacles(self.planets.boxes(), margin=max(self.red_ufos.size) // 2)
+
     def _create_fleet(self):
         """Creates a fleet of ufos."""
         #Empty the groups of the previous elems
@@ -105,11 +138,12 @@ class AlienHunt:
         if self.blue_ufos:
             self.blue_ufos.clear_all()
 
-        self.red_ufos.create_fleet(self.planets.positions, self.planets.sizes)
+        #Each fleet avoids the planets and the fleets placed before it
+        self.red_ufos.create_fleet(self.planets.boxes())
 
-        self.green_ufos.create_fleet(self.planets.positions, self.planets.sizes)
+        self.green_ufos.create_fleet(np.concatenate((self.planets.boxes(), self.red_ufos.boxes())))
 
-        self.blue_ufos.create_fleet(self.planets.positions, self.planets.sizes)
+        self.blue_ufos.create_fleet(np.concatenate((self.planets.boxes(), self.red_ufos.boxes(), self.green_ufos.boxes())))
 
     def run_game(self):
         """Starts the main loop for the game."""
@@ -142,11 +176,16 @@ class AlienHunt:
             elif event.type == self.pg.MOUSEBUTTONDOWN and not self.game_active and not self.game_pause:
                 mouse_position = self.pg.mouse.get_pos()
                 self._check_static_play_button(mouse_position)
+                self._check_static_horde_button(mouse_position)
                 self._check_static_back_button(mouse_position)
             elif event.type == self.timer_event and self.game_active:
                 self.timer_clocked = True
                 self.settings.counter -= 1
-                if self.settings.counter == 0:
+                if self.settings.counter == 0 and self.settings.horde_mode:
+                    #The horde never ends, it just gets thicker
+                    self.stats.level += 1
+                    self.settings.increase_horde_difficulty()
+                elif self.settings.counter == 0:
                     game_over_thread = threading.Thread(target=self.manage_game_over)
                     game_over_thread.daemon = True
                     game_over_thread.start()
@@ -166,6 +205,10 @@ class AlienHunt:
             self.game_pause = False
             self.static_menu.open_alien_hunt_static_menu()
 
+        #Show or hide the entity counts and frame times
+        elif event.key == self.pg.K_F3:
+            self.show_performance = not self.show_performance
+
         #Return to the Space Pursuit menu if the player presses ESC while in the static menu
         elif event.key == self.pg.K_ESCAPE and not self.game_active and not self.game_over:
             self.main_game_instance.open_alien_hunt = False
@@ -222,24 +265,15 @@ class AlienHunt:
 
     def _fire_projectile(self, group, obj, direction_flag, double_fire):
         """Creates a new projectile and adds it to the projectile's group."""
-        fire_sound = self.pg.mixer.Sound('resources/sounds/hit_sound.mp3')
-        self.pg.mixer.Sound.play(fire_sound)
-        new_projectile_1 = group.create_projectile(obj.rect.center)
-        if double_fire:
-            if direction_flag in ("fire_right", "fire_left"):
-                new_projectile_1.y = float(obj.rect.top)
-            else:
-                new_projectile_1.x = float(obj.rect.left)
-        setattr(new_projectile_1, direction_flag, True)
-        group.add(new_projectile_1)
-        if double_fire:
-            new_projectile_2 = group.create_projectile(obj.rect.center)
-            setattr(new_projectile_2, direction_flag, True)
-            if direction_flag in ("fire_right", "fire_left"):
-                new_projectile_2.y = float(obj.rect.bottom)
-            else:
-                new_projectile_2.x = float(obj.rect.right)
-            group.add(new_projectile_2)
+        self.fire_sound.play()
+        if not double_fire:
+            group.add(group.create_projectile(obj.rect.center, direction_flag))
+        elif direction_flag in ("fire_right", "fire_left"):
+            group.add(group.create_projectile((obj.rect.centerx, obj.rect.top), direction_flag))
+            group.add(group.create_projectile((obj.rect.centerx, obj.rect.bottom), direction_flag))
+        else:
+            group.add(group.create_projectile((obj.rect.left, obj.rect.centery), direction_flag))
+            group.add(group.create_projectile((obj.rect.right, obj.rect.centery), direction_flag))
 
     def _check_keyup_events(self, event):
         """Manages key releases."""
@@ -269,15 +303,26 @@ class AlienHunt:
     def _check_static_play_button(self, mouse_position):
         """Starts the game if the player clicks Play"""
         if self.static_menu.play_button.rect.collidepoint(mouse_position):
-            self.pg.mouse.set_visible(False)
-            self.stats.reset_stats()
-            self.settings.initialize_dynamic_settings()
-            self.rocket_projectiles.clear_projectiles()
-            self.ufo_projectiles.clear_projectiles()
-            self._create_planets_group()
-            self._create_fleet()
-            self.rocket.place_initial()
-            self.game_active = True
+            self._start_game(horde_mode=False)
+
+    def _check_static_horde_button(self, mouse_position):
+        """Starts the endless horde if the player clicks Horde"""
+        if self.static_menu.horde_button.rect.collidepoint(mouse_position):
+            self._start_game(horde_mode=True)
+
+    def _start_game(self, horde_mode):
+        """Resets the game and starts either the levels or the horde."""
+        self.pg.mouse.set_visible(False)
+        self.stats.reset_stats()
+        self.settings.initialize_dynamic_settings()
+        self.settings.horde_mode = horde_mode
+        self.rocket_projectiles.clear_projectiles()
+        self.ufo_projectiles.clear_projectiles()
+        self._create_planets_group()
+        self._create_fleet()
+        self.rocket.place_initial()
+        self.horde_spawn_budget = 0.0
+        self.game_active = True
 
     def _check_static_back_button(self, mouse_position):
         """Returns to the main menu if the player clicks Back"""
@@ -288,30 +333,31 @@ class AlienHunt:
     def _update_screen(self):
         """Updates images on the screen."""
         if self.game_active:
-            #Move and draw the bg_image to create a dynamic background effect
-            self.screen.blit(self.bg_image, self.bg_image_rect)
-
-            #Draw the scoreboard
-            self.sb.draw_board()
+            self.profiler.start_frame()
 
             #Update rocket's position
             self.rocket.update(self.dt)
 
+            #Spawn the horde
+            if self.settings.horde_mode:
+                self._spawn_horde()
+
             #Update UFOs
             self._update_ufos()
 
-            #Update and draw projectiles (get rid of old ones)
+            #Update projectiles (get rid of old ones)
             self._update_projectiles()
 
-            #Draw the rocket
-            self.rocket.blit_rocket()
-            
-            #draw planets
-            self.planets.draw(self.screen)
-
-            #Draw explosions
-            self.explosions.draw(self.screen)
+            #Step explosions
             self.explosions.update()
+            self.profiler.lap("update")
+
+            self._check_collisions()
+            self.profiler.lap("collide")
+
+            self._draw_game()
+            self.profiler.lap("draw")
+            self.profiler.end_frame()
 
         elif self.game_over:
             game_over_surf = self.pg.Surface(self.screen.get_size())
@@ -323,265 +369,254 @@ class AlienHunt:
 
     def _check_rocket_planet_collisions(self):
         """Manages collisions between rocket and planets."""
-        planets = self.pg.sprite.spritecollide(self.rocket, self.planets, False, self.pg.sprite.collide_mask)
-        if planets:
-            for planet in planets:
-                if self.rocket.moving_right:
-                    self.rocket.moving_right = False
-                if self.rocket.moving_left:
-                    self.rocket.moving_left = False
-                if self.rocket.moving_up:
-                    self.rocket.moving_up = False
-                if self.rocket.moving_down:
-                    self.rocket.moving_down = False
+        if self.planets.planet_under(self.rocket.mask, self.rocket.rect.topleft):
+            if self.rocket.moving_right:
+                self.rocket.moving_right = False
+            if self.rocket.moving_left:
+                self.rocket.moving_left = False
+            if self.rocket.moving_up:
+                self.rocket.moving_up = False
+            if self.rocket.moving_down:
+                self.rocket.moving_down = False
 
     def _update_ufos(self):
-        """Updates and draws UFOs"""
-        #Make green UFOs move acroos the screen 
-        if self.stats.level % 2 == 0:
-            for green_ufo in self.green_ufos:
-                green_ufo.move_horizontal = 1 * green_ufo.direction 
-        elif self.stats.level % 2 == 1:
-            for green_ufo in self.green_ufos:
-                green_ufo.move_vertical = 1 * green_ufo.direction
-
-        self.red_ufos.update()
+        """Updates UFOs"""
+        #Make green UFOs move acroos the screen, or swarm
+        if self.settings.horde_mode or self.settings.green_ufo_swarm:
+            self.green_ufos.flock(self.dt)
+        else:
+            self.green_ufos.set_axis(horizontal=self.stats.level % 2 == 0)
+
+        #Make red UFOs chase the rocket
+        if self.settings.horde_mode or self.stats.level >= self.settings.pursuit_level:
+            self.flow_field.update(self.rocket.rect.center)
+            self.red_ufos.pursue(self.flow_field, self.settings.pursuit_speed)
+
+        self.red_ufos.update(self.dt)
         self.green_ufos.update(self.dt)
-        self.blue_ufos.update()
+        self.blue_ufos.update(self.dt)
+
+        #Make blue UFOs fire projectiles at a certain rate
+        if self.settings.counter % 4 == 0 and len(self.ufo_projectiles) < len(self.blue_ufos) and self.timer_clocked:
+            self._fire_blue_volley(double_fire=self.stats.level >= self.settings.boost_level_2)
+            self.timer_clocked = False
+
+    def _spawn_horde(self):
+        """Spawns the ufos the horde owes since the last frame, split among the three fleets."""
+        self.horde_spawn_budget += self.settings.horde_spawn_rate * self.dt
+        fleets = (self.red_ufos, self.green_ufos, self.blue_ufos)
+        room = self.settings.horde_ufo_limit - sum(fleet.count for fleet in fleets)
+        count = min(int(self.horde_spawn_budget), room)
+        if count <= 0:
+            return
+        self.horde_spawn_budget -= count
+
+        #Keep the planets and the space around the rocket clear
+        safe_area = self.rocket.rect.inflate(2 * self.settings.horde_safe_distance, 2 * self.settings.horde_safe_distance)
+        obstacles = np.concatenate((self.planets.boxes(), [[safe_area.left, safe_area.top, safe_area.right, safe_area.bottom]]))
+
+        counts = self.rng.multinomial(count, self.settings.horde_shares)
+        for fleet, fleet_count in zip(fleets, counts.tolist()):
+            fleet.spawn_ufos(fleet_count, obstacles, self.rng)
+
+    def _check_collisions(self):
+        """Runs every collision query of the frame, then resolves what they found in one go."""
+        self._rebuild_spatial_hash()
+
+        #Bouncing is movement, not damage, so green UFOs turn before anything is destroyed
+        self._check_green_ufo_collisions()
+
+        self._detect_collisions()
+        self._resolve_collisions()
+        self._check_fleet_destroyed()
+
+    def _draw_game(self):
+        """Draws the frame."""
+        #Move and draw the bg_image to create a dynamic background effect
+        self.screen.blit(self.bg_image, self.bg_image_rect)
+
+        #Draw the scoreboard
+        self.sb.draw_board()
 
         #Draw ufos' fleet (draws every ufo.image at ufo.rect location)
         self.red_ufos.draw(self.screen)
         self.green_ufos.draw(self.screen)
         self.blue_ufos.draw(self.screen)
 
-        #Make blue UFOs fire projectiles at a certain rate
-        if self.settings.counter % 4 == 0 and len(self.ufo_projectiles) < len(self.blue_ufos) and self.timer_clocked:
-            for blue_ufo in self.blue_ufos:
-                number = random.randrange(1, 9)
-                if self.stats.level >= self.settings.boost_level_2:
-                    double_fire = True
-                else:
-                    double_fire = False
-                if number == 1:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_right", double_fire
-                    )
-                elif number == 2:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_left", double_fire
-                    )
-                elif number == 3:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_up", double_fire
-                    )
-                elif number == 4:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_down", double_fire
-                    )
-                elif number == 5:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_northwest", double_fire=False
-                    )
-                elif number == 6:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_northeast", double_fire=False
-                    )
-                elif number == 7:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_southwest", double_fire=False
-                    )
-                elif number == 8:
-                    self._fire_projectile(
-                        self.ufo_projectiles, blue_ufo, "fire_southeast", double_fire=False
-                    )
-                
-            self.timer_clocked = False
-        
-        self._check_green_ufo_collisions()
-        self._check_rocket_ufo_collisions()
+        #Draw projectiles
+        self.rocket_projectiles.blit_projectile()
+        self.ufo_projectiles.blit_projectile()
+
+        #Draw the rocket
+        self.rocket.blit_rocket()
+
+        #draw planets
+        self.planets.draw(self.screen)
+
+        #Draw explosions
+        self.explosions.draw(self.screen)
+
+        if self.show_performance or self.settings.horde_mode:
+            self._draw_performance()
+
+    def _draw_performance(self):
+        """Shows the entity counts and where the frame time goes."""
+        entity_counts = {
+            "ufos": len(self.red_ufos) + len(self.green_ufos) + len(self.blue_ufos),
+            "projectiles": len(self.rocket_projectiles) + len(self.ufo_projectiles),
+            "explosions": len(self.explosions),
+            }
+        self.sb.draw_performance(entity_counts, self.profiler.averages(), self.clock.get_fps())
         
+    def _fire_blue_volley(self, double_fire):
+        """Makes every blue UFO fire in a random direction, all in one batch."""
+        count = self.blue_ufos.count
+        if not count:
+            return
+
+        #One direction code per UFO, indexing DIRECTION_NAMES
+        direction_codes = self.rng.integers(0, len(DIRECTION_NAMES), count)
+
+        width, height = self.blue_ufos.size
+        topleft = self.blue_ufos.rect_positions[:count]
+        centers = topleft + (width // 2, height // 2)
+        if not double_fire:
+            positions, codes = centers, direction_codes
+        else:
+            #Diagonal shots stay single, straight shots come in pairs side by side
+            single = direction_codes >= 4
+            horizontal = direction_codes < 2
+            vertical = ~single & ~horizontal
+
+            firsts = centers.copy()
+            seconds = centers.copy()
+            firsts[horizontal, 1] = topleft[horizontal, 1]
+            seconds[horizontal, 1] = topleft[horizontal, 1] + height
+            firsts[vertical, 0] = topleft[vertical, 0]
+            seconds[vertical, 0] = topleft[vertical, 0] + width
+
+            positions = np.concatenate((firsts, seconds[~single]))
+            codes = np.concatenate((direction_codes, direction_codes[~single]))
+
+        self.ufo_projectiles.create_projectiles(positions, codes)
+
+        #A single sound for the whole volley
+        self.fire_sound.play()
+
+    def _rebuild_spatial_hash(self):
+        """Indexes everything that can be hit this frame, straight from the position arrays."""
+        rocket_rect = self.rocket.rect
+        self.spatial_hash.rebuild({
+            "planets": (self.planets.boxes(), self.planets.sprites()),
+            "red": (self.red_ufos.boxes(), self.red_ufos.row_sprites[:self.red_ufos.count]),
+            "green": (self.green_ufos.boxes(), self.green_ufos.row_sprites[:self.green_ufos.count]),
+            "blue": (self.blue_ufos.boxes(), self.blue_ufos.row_sprites[:self.blue_ufos.count]),
+            "rocket": ([[rocket_rect.left, rocket_rect.top, rocket_rect.right, rocket_rect.bottom]], [self.rocket]),
+            })
+
+    def _query_rocket(self, *layer_names):
+        """Returns the sprites of the given layers touching the rocket."""
+        rocket_rect = self.rocket.rect
+        _, entry_indices = self.spatial_hash.query(
+            [[rocket_rect.left, rocket_rect.top, rocket_rect.right, rocket_rect.bottom]], *layer_names
+            )
+        return [self.spatial_hash.sprites[entry] for entry in entry_indices.tolist()]
+
     def _check_green_ufo_collisions(self):
         """Invert a green UFO's direction if it collides with an element of the game"""
-        
-        ufos_against_planets = self.pg.sprite.groupcollide(self.green_ufos, self.planets, False, False, self.pg.sprite.collide_mask)
-        ufos_against_red = self.pg.sprite.groupcollide(self.green_ufos, self.red_ufos, False, False)
-        ufos_against_blue = self.pg.sprite.groupcollide(self.green_ufos, self.blue_ufos, False, False)
-        
-        if ufos_against_planets:
-            for green_ufo in ufos_against_planets.keys():
-                for planet in ufos_against_planets[green_ufo]:
-                    if green_ufo.move_horizontal == 1:
-                        green_ufo.x = float(planet.rect.x - green_ufo.rect.width - 1)
-                    elif green_ufo.move_horizontal == -1:
-                        green_ufo.x = float(planet.rect.right + 1)
-                    elif green_ufo.move_vertical == 1:
-                        green_ufo.y = float(planet.rect.top - green_ufo.rect.height - 1)
-                    elif green_ufo.move_vertical == -1:
-                        green_ufo.y = float(planet.rect.bottom + 1)
-                    
-                    green_ufo.direction *= -1
-        
-        if ufos_against_red:  
-            for green_ufo in ufos_against_red.keys():
-                for red_ufo in ufos_against_red[green_ufo]:
-                    if green_ufo.move_horizontal == 1:
-                        green_ufo.x = float(red_ufo.rect.x - green_ufo.rect.width - 1)
-                    elif green_ufo.move_horizontal == -1:
-                        green_ufo.x = float(red_ufo.rect.right + 1)
-                    elif green_ufo.move_vertical == 1:
-                        green_ufo.y = float(red_ufo.rect.top - green_ufo.rect.height - 1)
-                    elif green_ufo.move_vertical == -1:
-                        green_ufo.y = float(red_ufo.rect.bottom + 1)
-
-                    green_ufo.direction *= -1
-
-        if ufos_against_blue:
-            for green_ufo in ufos_against_blue.keys():
-                for blue_ufo in ufos_against_blue[green_ufo]:
-                    if green_ufo.move_horizontal == 1:
-                        green_ufo.x = float(blue_ufo.rect.x - green_ufo.rect.width - 1)
-                    elif green_ufo.move_horizontal == -1:
-                        green_ufo.x = float(blue_ufo.rect.right + 1)
-                    elif green_ufo.move_vertical == 1:
-                        green_ufo.y = float(blue_ufo.rect.top - green_ufo.rect.height - 1)
-                    elif green_ufo.move_vertical == -1:
-                        green_ufo.y = float(blue_ufo.rect.bottom + 1)
-
-                    green_ufo.direction *= -1
-
-        for green_ufo in self.green_ufos:
-            if green_ufo.x < 0:
-                green_ufo.x = 1.0
-                green_ufo.direction *= -1
-            elif green_ufo.x > self.screen_rect.width - green_ufo.rect.width:
-                green_ufo.x = float(self.screen_rect.width - green_ufo.rect.width - 1)
-                green_ufo.direction *= -1
-            elif green_ufo.y < 0:
-                green_ufo.y = 1.0
-                green_ufo.direction *= -1
-            elif green_ufo.y > self.screen_rect.height - green_ufo.rect.height:
-                green_ufo.y = float(self.screen_rect.height - green_ufo.rect.height - 1)
-                green_ufo.direction *= -1
-
-    def _check_rocket_ufo_collisions(self):
-        """Manages crashes against the UFOs"""
-        red_ufos_hit = self.pg.sprite.spritecollide(self.rocket, self.red_ufos, False)
-        green_ufos_hit = self.pg.sprite.spritecollide(self.rocket, self.green_ufos, False)
-        blue_ufos_hit = self.pg.sprite.spritecollide(self.rocket, self.blue_ufos, False)
-        for red_ufo_hit in red_ufos_hit:
-            self.red_ufos.remove_ufo(red_ufo_hit)
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            explosion = self.explosions.create_explosion(red_ufo_hit.rect.center)
-            self.explosions.add(explosion)
-            self._rocket_hit()
-        for green_ufo_hit in green_ufos_hit:
-            self.green_ufos.remove_ufo(green_ufo_hit)
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            explosion = self.explosions.create_explosion(green_ufo_hit.rect.center)
-            self.explosions.add(explosion)
+        self.green_ufos.bounce(self.spatial_hash, "planets", "red", "blue")
+
+    def _detect_collisions(self):
+        """
+        Runs every collision query against the same snapshot of the frame and records
+        what they found as events. Nothing is removed, scored or played here.
+        """
+        events = self.collision_events
+        events.clear()
+
+        ufos = self._query_rocket("red", "green", "blue")
+        events.add("rocket_ufo", [self.rocket] * len(ufos), ufos)
+
+        #Rocket projectiles go through UFOs, only planets stop them
+        events.add("rocket_projectile_ufo", *self.rocket_projectiles.swept_pairs(self.spatial_hash, "red", "green", "blue"))
+        events.add("rocket_projectile_planet", *self.rocket_projectiles.planet_pairs(self.planets))
+
+        #Blue UFOs' projectiles fly through their own fleet
+        events.add("ufo_projectile_planet", *self.ufo_projectiles.planet_pairs(self.planets))
+        events.add("ufo_projectile_rocket", *self.ufo_projectiles.swept_pairs(self.spatial_hash, "rocket"))
+        events.add("ufo_projectile_ufo", *self.ufo_projectiles.swept_pairs(self.spatial_hash, "red", "green"))
+
+    def _resolve_collisions(self):
+        """Applies the events of the frame in bulk, so each side effect happens once."""
+        events = self.collision_events
+        if not events:
+            return
+
+        #A UFO hit several times still goes down once; crashing into it gives no points
+        crashed_ufos = list(dict.fromkeys(events.of("rocket_ufo")[1]))
+        crashed = set(crashed_ufos)
+        shot_ufos = [ufo for ufo in dict.fromkeys(events.of("rocket_projectile_ufo")[1]) if ufo not in crashed]
+
+        score = self.stats.score
+        fleets = (
+            (self.red_ufos, self.settings.red_ufo_points),
+            (self.green_ufos, self.settings.green_ufo_points),
+            (self.blue_ufos, self.settings.blue_ufo_points),
+            )
+        for fleet, points in fleets:
+            fleet_shot_ufos = [ufo for ufo in shot_ufos if ufo in fleet]
+            fleet.remove(*[ufo for ufo in crashed_ufos if ufo in fleet], *fleet_shot_ufos)
+            self.stats.score += points * len(fleet_shot_ufos)
+
+        explosion_centers = [ufo.rect.center for ufo in crashed_ufos + shot_ufos]
+
+        #The rocket loses a life per crash, and one for all the projectiles that reached it this frame
+        for _ in crashed_ufos:
             self._rocket_hit()
-        for blue_ufo_hit in blue_ufos_hit:
-            self.blue_ufos.remove_ufo(blue_ufo_hit)
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            explosion = self.explosions.create_explosion(blue_ufo_hit.rect.center)
-            self.explosions.add(explosion)
+        if events.of("ufo_projectile_rocket")[0]:
+            explosion_centers.append(self.rocket.rect.center)
             self._rocket_hit()
 
-    def _update_projectiles(self):
-        """Updates the position, gets rid of the old ones and draws projectiles."""
-        #Update projectile's position
-        self.rocket_projectiles.update(self.dt, self.settings.projectile_speed)
-        self.ufo_projectiles.update(self.dt, self.settings.projectile_speed)
-
-        #Delete out-of-boundaries projectiles and blit projectiles all in one loop
-        for projectile in self.rocket_projectiles:
-            if (projectile.rect.bottom <= 0 or projectile.rect.left >= self.screen_rect.width or
-                projectile.rect.top >= self.screen_rect.height or projectile.rect.right <= 0):
-                self.rocket_projectiles.remove_projectile(projectile)
-            else:
-                self.screen.blit(projectile.image, projectile.rect)
-
-        for projectile in self.ufo_projectiles:
-            if (projectile.rect.bottom <= 0 or projectile.rect.left >= self.screen_rect.width or
-                projectile.rect.top >= self.screen_rect.height or projectile.rect.right <= 0):
-                self.ufo_projectiles.remove_projectile(projectile)
-            else:
-                self.screen.blit(projectile.image, projectile.rect)
-
-        self._check_rocket_projectile_ufo_collisions()
-        self._check_projectile_planet_collisions(self.rocket_projectiles)
-        self._check_projectile_planet_collisions(self.ufo_projectiles)
-        self._check_ufo_projectile_rocket_collisions()
-        self._check_ufo_projectile_ufo_collisions()
-
-    def _check_rocket_projectile_ufo_collisions(self):
-        """Responds to projectile-ufos collisions."""
-        #Remove any ufos hit
-        red_collisions = self.pg.sprite.groupcollide(self.rocket_projectiles, self.red_ufos, False, False)
-        green_collisions = self.pg.sprite.groupcollide(self.rocket_projectiles, self.green_ufos, False, False)
-        blue_collisions = self.pg.sprite.groupcollide(self.rocket_projectiles, self.blue_ufos, False, False)
-        if red_collisions:
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            for redufos in red_collisions.values():
-                for redufo in redufos:
-                    self.red_ufos.remove_ufo(redufo)
-                    explosion = self.explosions.create_explosion(redufo.rect.center)
-                    self.explosions.add(explosion)
-                self.stats.score += self.settings.red_ufo_points * len(redufos)
-        if green_collisions:
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            for greenufos in green_collisions.values():
-                for greenufo in greenufos:
-                    self.green_ufos.remove_ufo(greenufo)
-                    explosion = self.explosions.create_explosion(greenufo.rect.center)
-                    self.explosions.add(explosion)
-                self.stats.score += self.settings.green_ufo_points * len(greenufos)
-        if blue_collisions:
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            for blueufos in blue_collisions.values():
-                for blueufo in blueufos:
-                    self.blue_ufos.remove_ufo(blueufo)
-                    explosion = self.explosions.create_explosion(blueufo.rect.center)
-                    self.explosions.add(explosion)
-                self.stats.score += self.settings.blue_ufo_points * len(blueufos)
-        if self.stats.score >= self.stats.record:
+        #Retire the projectiles that were stopped
+        self.rocket_projectiles.remove(*events.of("rocket_projectile_planet")[0])
+        self.ufo_projectiles.remove(
+            *events.of("ufo_projectile_planet")[0],
+            *events.of("ufo_projectile_rocket")[0],
+            *events.of("ufo_projectile_ufo")[0],
+            )
+
+        #One explosion per destroyed object, but a single sound for the whole frame
+        if explosion_centers:
+            self.explosions.add(*[self.explosions.create_explosion(center) for center in explosion_centers])
+            self.explosion_sound.play()
+
+        #Write the record only when it actually moved
+        if self.stats.score != score and self.stats.score >= self.stats.record:
             path = Path('resources/alien_hunt/record.json')
             new_record = json.dumps(self.stats.score)
             path.write_text(new_record)
 
-        #If all the ufos have been destroyed, restart the game 
-        if not self.red_ufos and not self.green_ufos and not self.blue_ufos:
+    def _check_fleet_destroyed(self):
+        """Moves on to the next level once every UFO is gone."""
+        #The horde keeps coming instead
+        if not self.red_ufos and not self.green_ufos and not self.blue_ufos and not self.settings.horde_mode:
             self.stats.level += 1
             self.settings.increase_difficulty()
-            self.ufo_projectiles.empty()
-            self.rocket_projectiles.empty()
+            self.ufo_projectiles.clear_projectiles()
+            self.rocket_projectiles.clear_projectiles()
             self.rocket.place_initial()
             self._create_planets_group()
             self._create_fleet()
 
-    def _check_projectile_planet_collisions(self, group):
-        """Deletes the projectile if it hits a planet"""
-        projectiles = self.pg.sprite.groupcollide(group, self.planets, False, False)
-        for projectile in projectiles:
-            group.remove_projectile(projectile)
-        
-    def _check_ufo_projectile_rocket_collisions(self):
-        """Manages collisions between ufo projectiles and rocket."""
-        projectiles = self.pg.sprite.spritecollide(self.rocket, self.ufo_projectiles, False)
-        if projectiles:
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            explosion = self.explosions.create_explosion(self.rocket.rect.center)
-            self.explosions.add(explosion)
-            self._rocket_hit()
-            for projectile in projectiles:
-                self.ufo_projectiles.remove_projectile(projectile)
+    def _update_projectiles(self):
+        """Updates the position and gets rid of the old projectiles."""
+        #Update projectile's position
+        self.rocket_projectiles.update(self.dt, self.settings.projectile_speed)
+        self.ufo_projectiles.update(self.dt, self.settings.projectile_speed)
+
+        #Retire projectiles that flew past their exit time
+        self.rocket_projectiles.retire_expired()
+        self.ufo_projectiles.retire_expired()
 
     def _rocket_hit(self):
         """Responds to the ship crashing against an UFOs or being hit by projectiles."""
@@ -593,15 +628,6 @@ class AlienHunt:
             game_over_thread.start()
         self.settings.counter += 5
 
-    def _check_ufo_projectile_ufo_collisions(self):
-        """"Remove a projectile fired by a blue UFO if it hits another UFO"""
-        projectiles_against_red = self.pg.sprite.groupcollide(self.ufo_projectiles, self.red_ufos, False, False)
-        projectiles_against_green = self.pg.sprite.groupcollide(self.ufo_projectiles, self.green_ufos, False, False)
-        for projectile in projectiles_against_red:
-            self.ufo_projectiles.remove_projectile(projectile)
-        for projectile in projectiles_against_green:
-            self.ufo_projectiles.remove_projectile(projectile)
-
     def manage_game_over(self):
         """Handles the end of the game. Updates the game state and flags for main thread."""
         # Set the game as inactive
@@ -0,0 +1,105 @@
+from numba import njit
+import numpy as np
+
+#Neighbour offsets (row, column): the four sides first, then the diagonals
+NEIGHBOURS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)], dtype=np.int64)
+
+@njit
+def calculate_flow_field(blocked, target_row, target_column, neighbours):
+    """
+    Breadth-first search from the target cell over the free cells of the grid.
+    Returns the unit vector (x, y) every cell should follow to reach the target;
+    blocked cells point to their closest free neighbour so nothing gets stuck.
+    """
+    rows, columns = blocked.shape
+    distances = np.full((rows, columns), np.inf)
+    queue_rows = np.empty(rows * columns, dtype=np.int64)
+    queue_columns = np.empty(rows * columns, dtype=np.int64)
+
+    distances[target_row, target_column] = 0
+    queue_rows[0], queue_columns[0] = target_row, target_column
+    head, tail = 0, 1
+    while head < tail:
+        row, column = queue_rows[head], queue_columns[head]
+        head += 1
+        for k in range(4):
+            next_row, next_column = row + neighbours[k, 0], column + neighbours[k, 1]
+            if 0 <= next_row < rows and 0 <= next_column < columns:
+                if not blocked[next_row, next_column] and distances[next_row, next_column] == np.inf:
+                    distances[next_row, next_column] = distances[row, column] + 1
+                    queue_rows[tail], queue_columns[tail] = next_row, next_column
+                    tail += 1
+
+    field = np.zeros((rows, columns, 2), dtype=np.float32)
+    for row in range(rows):
+        for column in range(columns):
+            best = distances[row, column]
+            best_k = -1
+            for k in range(8):
+                next_row, next_column = row + neighbours[k, 0], column + neighbours[k, 1]
+                if not (0 <= next_row < rows and 0 <= next_column < columns):
+                    continue
+                #No cutting corners around a blocked cell
+                if k >= 4 and (blocked[row + neighbours[k, 0], column] or blocked[row, column + neighbours[k, 1]]):
+                    continue
+                if distances[next_row, next_column] < best:
+                    best = distances[next_row, next_column]
+                    best_k = k
+            if best_k >= 0:
+                x, y = neighbours[best_k, 1], neighbours[best_k, 0]
+                length = np.sqrt(x * x + y * y)
+                field[row, column, 0] = x / length
+                field[row, column, 1] = y / length
+
+    return field
+
+class FlowField:
+    """A coarse grid over the screen telling every ufo which way leads to the rocket."""
+
+    def __init__(self, game_instance, cell_size=40):
+        """Initializes an empty grid covering the screen."""
+        self.screen_rect = game_instance.screen_rect
+        self.cell_size = cell_size
+        self.rows = -(-self.screen_rect.height // cell_size)
+        self.columns = -(-self.screen_rect.width // cell_size)
+
+        self.blocked = np.zeros((self.rows, self.columns), dtype=np.bool_)
+        self.field = np.zeros((self.rows, self.columns, 2), dtype=np.float32)
+
+        #Cell the field currently leads to, None forces a rebuild
+        self.target_cell = None
+
+    def set_obstacles(self, boxes, margin=0):
+        """
+        Blocks every cell touched by an obstacle box (left, top, right, bottom) grown by margin.
+        """
+        self.blocked[:] = False
+        for left, top, right, bottom in np.asarray(boxes).reshape(-1, 4).tolist():
+            first_column = max((left - margin) // self.cell_size, 0)
+            last_column = min((right + margin - 1) // self.cell_size, self.columns - 1)
+            first_row = max((top - margin) // self.cell_size, 0)
+            last_row = min((bottom + margin - 1) // self.cell_size, self.rows - 1)
+            self.blocked[first_row:last_row + 1, first_column:last_column + 1] = True
+
+        self.target_cell = None
+
+    def _cell_of(self, x, y):
+        """Returns the (row, column) of the cell containing a point."""
+        row = min(max(int(y) // self.cell_size, 0), self.rows - 1)
+        column = min(max(int(x) // self.cell_size, 0), self.columns - 1)
+
+        return row, column
+
+    def update(self, target):
+        """Rebuilds the field only when the target point moved to another cell."""
+        target_cell = self._cell_of(*target)
+        if target_cell != self.target_cell:
+            self.field = calculate_flow_field(self.blocked, target_cell[0], target_cell[1], NEIGHBOURS)
+            self.target_cell = target_cell
+
+    def sample(self, points):
+        """Returns the field vector under each point, one grid lookup per point."""
+        rows = np.clip(points[:, 1] // self.cell_size, 0, self.rows - 1)
+        columns = np.clip(points[:, 0] // self.cell_size, 0, self.columns - 1)
+
+        return self.field[rows, columns]
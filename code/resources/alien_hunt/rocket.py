@@ -2,6 +2,8 @@ from pygame.sprite import Sprite
 from numba import njit
 import numpy as np
 
+from ..mask_cache import cached_mask
+
 @njit
 def calculate_new_position(position, moving_right, moving_left, moving_up, moving_down, speed, dt):
     """Calculate the new position based on movement flags and elapsed time."""
@@ -74,7 +76,7 @@ class Rocket(Sprite):
 
         #Start with the rocket pointing down next to the timer button 
         self.image = self.down_image
-        self.mask = self.pg.mask.from_surface(self.image)
+        self.mask = cached_mask(self.image)
         self.rect = self.down_image_rect
         self.position = np.array([self.screen_rect.width/2 + 70, 0.0], dtype=np.float32)
 
@@ -107,7 +109,7 @@ class Rocket(Sprite):
             
             self.rect.x, self.rect.y = new_rect_x, new_rect_y
 
-            self.mask = self.pg.mask.from_surface(self.image)
+            self.mask = cached_mask(self.image)
             
             # Update all image rects
             for img_rect in [self.right_image_rect, self.left_image_rect, self.up_image_rect, self.down_image_rect]:
@@ -1,358 +1,562 @@
 import pygame
-from pygame.sprite import Group, Sprite
+from pygame.sprite import Group
 import random
-from numba import njit, prange
+from numba import njit
 import numpy as np
 
+from ..animation import FrameTimeline, Animator
+
+#Swarm: a ufo at rest with nothing around sets off at its row times the golden angle, so the fleet fans out evenly
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+@njit
+def advance_fleet(exact_positions, rect_positions, velocities, directions, count, speed, dt):
+    """
+    Moves the first count ufos of a fleet in a single pass.
+    Returns a mask of the rows whose rect position changed.
+    """
+    moved = np.zeros(count, dtype=np.bool_)
+    step = np.float32(speed * dt)
+    for i in range(count):
+        exact_positions[i, 0] += velocities[i, 0] * directions[i] * step
+        exact_positions[i, 1] += velocities[i, 1] * directions[i] * step
+
+        new_rect_x = np.int32(round(exact_positions[i, 0]))
+        new_rect_y = np.int32(round(exact_positions[i, 1]))
+        if rect_positions[i, 0] != new_rect_x or rect_positions[i, 1] != new_rect_y:
+            rect_positions[i, 0] = new_rect_x
+            rect_positions[i, 1] = new_rect_y
+            moved[i] = True
+
+    return moved
+
+@njit
+def resolve_green_bounces(exact_positions, velocities, directions, count, width, height, obstacles, hit_obstacles, screen_width, screen_height):
+    """
+    Moves every green ufo out of the obstacle box (left, top, right, bottom) it hit, if any,
+    or back inside the screen, and inverts its direction, all in a single pass.
+    hit_obstacles holds one obstacle index per ufo, -1 for none; one bounce per frame,
+    since a second obstacle or a screen edge would undo the flip.
+    Returns a mask of the ufos that bounced.
+    """
+    bounced = np.zeros(count, dtype=np.bool_)
+    for i in range(count):
+        move_horizontal = velocities[i, 0] * directions[i]
+        move_vertical = velocities[i, 1] * directions[i]
+
+        j = hit_obstacles[i]
+        if j >= 0:
+            if move_horizontal > 0:
+                exact_positions[i, 0] = obstacles[j, 0] - width - 1
+            elif move_horizontal < 0:
+                exact_positions[i, 0] = obstacles[j, 2] + 1
+            elif move_vertical > 0:
+                exact_positions[i, 1] = obstacles[j, 1] - height - 1
+            elif move_vertical < 0:
+                exact_positions[i, 1] = obstacles[j, 3] + 1
+            directions[i] = -directions[i]
+            bounced[i] = True
+
+            #An obstacle against an edge can push the ufo off screen: keep it inside without flipping back
+            exact_positions[i, 0] = min(max(exact_positions[i, 0], 1), screen_width - width - 1)
+            exact_positions[i, 1] = min(max(exact_positions[i, 1], 1), screen_height - height - 1)
+            continue
+
+        x, y = exact_positions[i, 0], exact_positions[i, 1]
+        if x < 0:
+            exact_positions[i, 0] = 1
+        elif x > screen_width - width:
+            exact_positions[i, 0] = screen_width - width - 1
+        elif y < 0:
+            exact_positions[i, 1] = 1
+        elif y > screen_height - height:
+            exact_positions[i, 1] = screen_height - height - 1
+        else:
+            continue
+        directions[i] = -directions[i]
+        bounced[i] = True
+
+    return bounced
+
 @njit
-def calculate_new_position(x, y, speed, move_horizontal, move_vertical, dt):
-    """Calculate the new position based on movement flags and elapsed time."""
-    direction = np.array([0.0, 0.0], dtype=np.float32)
-    direction[0] += move_horizontal
-    direction[1] += move_vertical
-    
-    # Normalize the direction vector and scale by speed
-    if np.linalg.norm(direction) > 0:
-        direction = direction / np.linalg.norm(direction) * np.float32(speed)
-    
-    # Calculate new position based on direction and delta time
-    
-    new_position = np.array([0, 0], dtype=np.float32)
-    new_position[0] = x + direction[0] * np.float32(dt)
-    new_position[1] = y + direction[1] * np.float32(dt)
-
-    return new_position
-
-@njit(parallel=True)
-def check_overlap(ufo_size, ufo_position, planets_positions, planets_sizes):
+def calculate_flock_headings(exact_positions, headings, count, radius, separation, alignment, cohesion, screen_width, screen_height, dt):
+    """
+    Steers every ufo of a swarm by separation, alignment and cohesion with the ufos within radius.
+    Neighbours are found through a uniform grid of radius-sized cells, so each ufo only looks
+    at the 3x3 cells around it. Returns the new unit headings.
+    """
+    columns = int(screen_width // radius) + 1
+    rows = int(screen_height // radius) + 1
+
+    #Counting sort of the ufos by cell
+    cells = np.empty(count, dtype=np.int64)
+    cell_starts = np.zeros(columns * rows + 1, dtype=np.int64)
+    for i in range(count):
+        column = min(max(int(exact_positions[i, 0] // radius), 0), columns - 1)
+        row = min(max(int(exact_positions[i, 1] // radius), 0), rows - 1)
+        cells[i] = row * columns + column
+        cell_starts[cells[i] + 1] += 1
+    for cell in range(columns * rows):
+        cell_starts[cell + 1] += cell_starts[cell]
+    fill = cell_starts[:-1].copy()
+    ordered = np.empty(count, dtype=np.int64)
+    for i in range(count):
+        ordered[fill[cells[i]]] = i
+        fill[cells[i]] += 1
+
+    new_headings = np.empty((count, 2), dtype=np.float32)
+    for i in range(count):
+        x, y = exact_positions[i, 0], exact_positions[i, 1]
+        away_x = away_y = 0.0
+        heading_x = heading_y = 0.0
+        center_x = center_y = 0.0
+        neighbours = 0
+
+        row, column = cells[i] // columns, cells[i] % columns
+        for next_row in range(max(row - 1, 0), min(row + 2, rows)):
+            for next_column in range(max(column - 1, 0), min(column + 2, columns)):
+                cell = next_row * columns + next_column
+                for k in range(cell_starts[cell], cell_starts[cell + 1]):
+                    j = ordered[k]
+                    if j == i:
+                        continue
+                    dx, dy = x - exact_positions[j, 0], y - exact_positions[j, 1]
+                    distance_squared = dx * dx + dy * dy
+                    if distance_squared >= radius * radius:
+                        continue
+                    #Push apart harder the closer they are
+                    if distance_squared > 0:
+                        away_x += dx / distance_squared * radius
+                        away_y += dy / distance_squared * radius
+                    heading_x += headings[j, 0]
+                    heading_y += headings[j, 1]
+                    center_x += exact_positions[j, 0]
+                    center_y += exact_positions[j, 1]
+                    neighbours += 1
+
+        steer_x = separation * away_x
+        steer_y = separation * away_y
+        if neighbours:
+            steer_x += alignment * heading_x / neighbours + cohesion * (center_x / neighbours - x) / radius
+            steer_y += alignment * heading_y / neighbours + cohesion * (center_y / neighbours - y) / radius
+
+        #Turn back before reaching the screen edges
+        if x < radius:
+            steer_x += 1.0
+        elif x > screen_width - radius:
+            steer_x -= 1.0
+        if y < radius:
+            steer_y += 1.0
+        elif y > screen_height - radius:
+            steer_y -= 1.0
+
+        new_x = headings[i, 0] + steer_x * dt
+        new_y = headings[i, 1] + steer_y * dt
+        length = np.sqrt(new_x * new_x + new_y * new_y)
+        if length == 0:
+            #A ufo at rest with nothing around sets off along a spread of angles
+            angle = i * GOLDEN_ANGLE
+            new_x, new_y, length = np.cos(angle), np.sin(angle), 1.0
+        new_headings[i, 0] = new_x / length
+        new_headings[i, 1] = new_y / length
+
+    return new_headings
+
+@njit
+def find_free_cells(area_left, area_top, columns, rows, cell_width, cell_height, obstacles):
+    """
+    Checks every cell of a grid against the obstacle boxes (left, top, right, bottom).
+    Returns a mask of the cells, row by row, that touch no obstacle.
+    """
+    free = np.ones(columns * rows, dtype=np.bool_)
+    for row in range(rows):
+        top = area_top + row * cell_height
+        for column in range(columns):
+            left = area_left + column * cell_width
+            for j in range(obstacles.shape[0]):
+                if left < obstacles[j, 2] and left + cell_width > obstacles[j, 0] and top < obstacles[j, 3] and top + cell_height > obstacles[j, 1]:
+                    free[row * columns + column] = False
+                    break
+
+    return free
+
+@njit
+def find_clear_positions(positions, width, height, obstacles):
+    """
+    Checks a batch of candidate positions against the obstacle boxes (left, top, right, bottom).
+    Returns a mask of the positions where a ufo would touch no obstacle.
+    """
+    clear = np.ones(positions.shape[0], dtype=np.bool_)
+    for i in range(positions.shape[0]):
+        left, top = positions[i, 0], positions[i, 1]
+        for j in range(obstacles.shape[0]):
+            if left < obstacles[j, 2] and left + width > obstacles[j, 0] and top < obstacles[j, 3] and top + height > obstacles[j, 1]:
+                clear[i] = False
+                break
+
+    return clear
+
+class UfoFleet(Group):
     """
-    Checks for overlapping with planets.
+    A structure-of-arrays store shared by the three kinds of ufo fleet.
+    Rows [0, count) hold the alive ufos; removal swaps the last row into the hole.
     """
-    overlaps = False  # Initialize the overlap flag
-    for i in prange(len(planets_positions)): 
-        pos = planets_positions[i]
-        size = planets_sizes[i]
 
-        x1_min, y1_min = pos[0], pos[1]
-        x1_max, y1_max = x1_min + size[0], y1_min + size[1]
-        x2_min, y2_min = ufo_position[0], ufo_position[1]
-        x2_max, y2_max = x2_min + ufo_size[0], y2_min + ufo_size[1]
+    #Overridden by each kind of fleet
+    kind = None
+    image_right_path = None
+    image_left_path = None
+    limit_setting = None
 
-        x_overlap = (x1_min <= x2_max) & (x1_max >= x2_min)
-        y_overlap = (y1_min <= y2_max) & (y1_max >= y2_min)
+    #Number of rows the store starts with, doubled whenever it runs out
+    initial_capacity = 100
 
-        if x_overlap and y_overlap:
-            overlaps = True
+    #Spawn area starts below the scoreboard
+    spawn_top = 250
 
-    return overlaps
+    #Free space around each ufo in its placement cell, shared out as random jitter
+    placement_gap = 10
 
-class RedUfoFleet(Group):
-    """A class o represent a single red ufo in the fleet."""
+    #Speed set by pursue, still ufos stay still until they are told to chase
+    pursuit_speed = 0
 
     def __init__(self, game_instance):
-        """Initializes the ufo and set its starting position."""
+        """Initializes the fleet store and preloads the images."""
         super().__init__()
         self.screen = game_instance.screen
         self.screen_rect = game_instance.screen_rect
         self.game_instance = game_instance
         self.pg = game_instance.pg
         self.settings = game_instance.settings
-        self.positions = np.zeros((100, 2), dtype=np.int32)
 
-        # Usage
-        self.red_image_right, self.red_image_left, self.red_rect_right, self.red_rect_left = self.preload_images()
+        self.image_right, self.image_left, self.rect_right, self.rect_left = self.preload_images()
 
-        #Default image and rect
-        self.size = self.red_rect_right.size
+        self.size = self.rect_right.size
+
+        self._reset_store(self.initial_capacity)
 
     def preload_images(self):
         """
         Preloads images to prevent repeated slow disk access.
         """
-        self.red_image_right = pygame.image.load('resources/images/red_ufo_right.bmp')
-        self.red_rect_right = self.red_image_right.get_rect()
+        self.image_right = pygame.image.load(self.image_right_path)
+        self.rect_right = self.image_right.get_rect()
 
-        self.red_image_left = pygame.image.load('resources/images/red_ufo_left.bmp')
-        self.red_rect_left = self.red_image_left.get_rect()
+        self.image_left = pygame.image.load(self.image_left_path)
+        self.rect_left = self.image_left.get_rect()
 
-        return self.red_image_right, self.red_image_left, self.red_rect_right, self.red_rect_left
+        return self.image_right, self.image_left, self.rect_right, self.rect_left
 
-    def create_fleet(self, planets_positions, planets_sizes):
+    def _reset_store(self, capacity):
         """
-        Create a specified number of ufos and add them to the group.
+        Allocates the fleet columns, all rows empty.
         """
-        n = 0
-        while n < self.settings.red_ufo_limit:
-            ufo_position = random.randrange(0, self.screen_rect.width - self.red_rect_right.width), random.randrange(250, self.screen_rect.height - self.red_rect_right.height)
-            if not check_overlap(ufo_position=ufo_position, ufo_size=self.size, planets_positions=planets_positions, planets_sizes=planets_sizes):
-                self.positions[n] = ufo_position
-                self.add(self._create_ufo(ufo_position))
-                n += 1
-            else:
-                continue
-
-    def _create_ufo(self, ufo_position):
+        self.capacity = capacity
+        self.count = 0
+        self.exact_positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.rect_positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.directions = np.ones(capacity, dtype=np.float32)
+        self.row_sprites = [None] * capacity
+
+    def _grow_store(self):
         """
-        Create a single ufo sprite.
+        Doubles the fleet columns when every row is taken.
         """
-        red_ufo = self.pg.sprite.Sprite()
-        red_ufo.red_image_right = self.red_image_right
-        red_ufo.red_rect_right = self.red_rect_right
-        red_ufo.red_image_left = self.red_image_left
-        red_ufo.red_rect_left = self.red_rect_left
-
-        for rect in (red_ufo.red_rect_right, red_ufo.red_rect_left):
-            rect.x, rect.y = ufo_position
-
-        red_ufo.image = red_ufo.red_image_right
-        red_ufo.rect = red_ufo.red_rect_right
-
-        return red_ufo
-
-    def update(self):
-        """Updates the image and position of each UFO."""
-        for i, sprite in enumerate(self.sprites()):
-            # Update the sprite image and rect based on the counter
-            if self.game_instance.settings.counter % 2 == 0:
-                sprite.image = sprite.red_image_right
-                sprite.rect = sprite.red_rect_right.copy()  # Use a copy to avoid shared reference issues
-            else:
-                sprite.image = sprite.red_image_left
-                sprite.rect = sprite.red_rect_left.copy()
-
-            # Update the rect position from self.positions
-            sprite.rect.topleft = (int(self.positions[i][0]), int(self.positions[i][1])) 
+        extra = self.capacity
+        self.capacity *= 2
 
-    def remove_ufo(self, ufo):
+        self.exact_positions = np.concatenate((self.exact_positions, np.zeros((extra, 2), dtype=np.float32)))
+        self.rect_positions = np.concatenate((self.rect_positions, np.zeros((extra, 2), dtype=np.int32)))
+        self.velocities = np.concatenate((self.velocities, np.zeros((extra, 2), dtype=np.float32)))
+        self.directions = np.concatenate((self.directions, np.ones(extra, dtype=np.float32)))
+        self.row_sprites.extend([None] * extra)
+
+    def _columns(self):
         """
-        Remove a specific ufo from the group.
+        Returns the per-row columns that move together on a swap-remove.
         """
-        try:
-            index = self.sprites().index(ufo)  # Find the index of the UFO in the group
-        except ValueError:
-            pass
-        else:
-            self.positions = np.delete(self.positions, index, axis=0)  # Remove position from array
-            self.remove(ufo)
+        return (self.exact_positions, self.rect_positions, self.velocities, self.directions)
 
-    def clear_all(self):
+    def create_fleet(self, obstacles):
         """
-        Remove all ufos from the group.
+        Create a specified number of ufos and add them to the group.
+        obstacles holds the (left, top, right, bottom) boxes the fleet must not overlap.
         """
-        self.empty()
-        self.positions = np.zeros((100, 2), dtype=np.int32)
-
-class GreenUfoFleet(Group):
-    """A class o represent a single green ufo in the fleet."""
+        self.add(*[self._create_ufo(ufo_position) for ufo_position in self.place_fleet(obstacles)])
 
-    def __init__(self, game_instance):
-        """Initializes the ufo and set its starting position."""
-        super().__init__()
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.game_instance = game_instance
-        self.settings = game_instance.settings
-        self.pg = game_instance.pg
-        self.rect_positions = np.zeros((100, 2), dtype=np.int32)
-        self.exact_positions = np.zeros((100, 2), dtype=np.float32)
-
-        self.green_image_right, self.green_image_left, self.green_rect_right, self.green_rect_left = self.preload_images()
-
-        self.size = self.green_rect_right.size
-
-    def preload_images(self):
+    def place_fleet(self, obstacles):
         """
-        Preloads images to prevent repeated slow disk access.
+        Picks the positions of the whole fleet at once from a grid of ufo-sized cells.
+        Each ufo gets its own cell free of obstacles, so ufos never overlap anything.
+        If the free cells run out the fleet is smaller than the limit, never slower.
         """
-        self.green_image_right = pygame.image.load('resources/images/green_ufo_right.bmp')
-        self.green_rect_right = self.green_image_right.get_rect()
-
-        self.green_image_left = pygame.image.load('resources/images/green_ufo_left.bmp')
-        self.green_rect_left = self.green_image_left.get_rect()
-
-        return self.green_image_right, self.green_image_left, self.green_rect_right, self.green_rect_left
-
-    def create_fleet(self, planets_positions, planets_sizes):
+        cell_width, cell_height = self.size[0] + self.placement_gap, self.size[1] + self.placement_gap
+        area_width = self.screen_rect.width
+        area_height = self.screen_rect.height - self.spawn_top
+
+        #Shift the grid randomly so fleets do not line up level after level
+        area_left = random.randrange(0, area_width % cell_width + 1)
+        area_top = self.spawn_top + random.randrange(0, area_height % cell_height + 1)
+        columns, rows = area_width // cell_width, area_height // cell_height
+
+        free = find_free_cells(area_left, area_top, columns, rows, cell_width, cell_height, np.asarray(obstacles, dtype=np.int32).reshape(-1, 4))
+        free_cells = np.flatnonzero(free).tolist()
+        cells = random.sample(free_cells, min(getattr(self.settings, self.limit_setting), len(free_cells)))
+
+        return [
+            (area_left + cell % columns * cell_width + random.randrange(0, self.placement_gap + 1),
+             area_top + cell // columns * cell_height + random.randrange(0, self.placement_gap + 1))
+            for cell in cells
+            ]
+
+    def spawn_ufos(self, count, obstacles, rng):
         """
-        Create a specified number of ufos and add them to the group.
+        Drops up to count ufos at random places clear of the obstacle boxes, in one batch.
+        Used by the horde, where ufos may overlap each other; candidates that land on an
+        obstacle are dropped rather than redrawn, so the cost never grows.
         """
-        n = 0
-        while n < self.settings.green_ufo_limit:
-            ufo_position = random.randrange(0, self.screen_rect.width - self.green_rect_right.width), random.randrange(250, self.screen_rect.height - self.green_rect_right.height)
-            if not check_overlap(ufo_position=ufo_position, ufo_size=self.size, planets_positions=planets_positions, planets_sizes=planets_sizes):
-                self.rect_positions[n] = ufo_position
-                self.exact_positions[n] = np.float32(ufo_position)
-                self.add(self._create_ufo(ufo_position))
-                n += 1
-            else:
-                continue
+        if count <= 0:
+            return
+
+        width, height = self.size
+        positions = np.column_stack((
+            rng.integers(0, self.screen_rect.width - width, count),
+            rng.integers(self.spawn_top, self.screen_rect.height - height, count),
+            )).astype(np.int32)
+        clear = find_clear_positions(positions, width, height, np.asarray(obstacles, dtype=np.int32).reshape(-1, 4))
+
+        self.add(*[self._create_ufo(ufo_position) for ufo_position in map(tuple, positions[clear].tolist())])
 
     def _create_ufo(self, ufo_position):
         """
-        Create a single ufo sprite.
+        Create a single ufo sprite and append its row to the store.
         """
-        green_ufo = self.pg.sprite.Sprite()
-        green_ufo.green_image_right = self.green_image_right
-        green_ufo.green_rect_right = self.green_rect_right
-        green_ufo.green_image_left = self.green_image_left
-        green_ufo.green_rect_left = self.green_rect_left
-
-        for rect in (green_ufo.green_rect_right, green_ufo.green_rect_left):
-            rect.x, rect.y = ufo_position
-
-        green_ufo.x, green_ufo.y = float(ufo_position[0]), float(ufo_position[1])
+        if self.count == self.capacity:
+            self._grow_store()
 
-        green_ufo.image = green_ufo.green_image_right
-        green_ufo.rect = green_ufo.green_rect_right
+        ufo = self.pg.sprite.Sprite()
+        ufo.index = self.count
+        self.count += 1
 
-        green_ufo.move_horizontal = 0
-        green_ufo.move_vertical = 0
+        self.exact_positions[ufo.index] = np.float32(ufo_position)
+        self.rect_positions[ufo.index] = ufo_position
+        self.velocities[ufo.index] = 0
+        self.directions[ufo.index] = 1
+        self.row_sprites[ufo.index] = ufo
 
-        green_ufo.direction = 1
+        ufo.image = self.image_right
+        ufo.rect = self.rect_right.copy()
+        ufo.rect.topleft = ufo_position
 
-        green_ufo.mask = self.pg.mask.from_surface(green_ufo.image)
+        return ufo
 
-        return green_ufo
+    def remove_internal(self, sprite):
+        """
+        Swaps the last row into the removed ufo's row in O(1) (remove, kill or empty).
+        """
+        super().remove_internal(sprite)
+
+        last = self.count - 1
+        index = sprite.index
+        if index != last:
+            for column in self._columns():
+                column[index] = column[last]
+            moved_ufo = self.row_sprites[last]
+            moved_ufo.index = index
+            self.row_sprites[index] = moved_ufo
+
+        self.row_sprites[last] = None
+        self.count = last
+
+    def boxes(self):
+        """Returns the (left, top, right, bottom) box of every ufo."""
+        lefts_tops = self.rect_positions[:self.count]
+        return np.hstack((lefts_tops, lefts_tops + np.array(self.size, dtype=np.int32)))
+
+    def pursue(self, flow_field, speed):
+        """Points every ufo along the flow field under its center; the next update moves them."""
+        centers = self.rect_positions[:self.count] + np.array(self.size, dtype=np.int32) // 2
+        self.velocities[:self.count] = flow_field.sample(centers)
+        self.directions[:self.count] = 1
+        self.pursuit_speed = speed
+
+    def _speed(self):
+        """The speed ufos of this kind move at."""
+        return self.pursuit_speed
 
     def update(self, dt):
-        """Updates the image."""
-        for i, sprite in enumerate(self.sprites()):
-            # Update position
-            self.exact_positions[i] = calculate_new_position(
-                self.exact_positions[i][0], self.exact_positions[i][1], self.settings.green_ufo_speed, sprite.move_horizontal, sprite.move_vertical, dt
+        """Moves the whole fleet with one kernel call and syncs the rects that changed."""
+        speed = self._speed()
+        if speed and self.count:
+            moved = advance_fleet(
+                self.exact_positions, self.rect_positions, self.velocities, self.directions, self.count, speed, dt
                 )
-            
-            self.rect_positions[i] = np.round(self.exact_positions[i])
-            
-            if sprite.direction == 1:
-                sprite.image = sprite.green_image_right
-                sprite.rect = sprite.green_rect_right.copy()
-            elif sprite.direction == -1:
-                sprite.image = sprite.green_image_left
-                sprite.rect = sprite.green_rect_left.copy()
-            
-            sprite.x, sprite.y = float(self.exact_positions[i][0]), float(self.exact_positions[i][1])
-
-            # Update rect position
-            sprite.rect.topleft = (int(self.rect_positions[i][0]), int(self.rect_positions[i][1]))
-
-            sprite.mask = pygame.mask.from_surface(sprite.image)
-
-            # Update all image rects
-            for img_rect in [sprite.green_rect_right, sprite.green_rect_left]:
-                img_rect.center = sprite.rect.center
+            moved_rows = np.flatnonzero(moved)
+            for index, topleft in zip(moved_rows.tolist(), self.rect_positions[moved_rows].tolist()):
+                self.row_sprites[index].rect.topleft = topleft
+
+        self._update_images()
+
+    def _update_images(self):
+        """Swaps the images of the ufos whose look changed."""
+
+    def draw(self, surface):
+        """Draws every ufo with a single blits call."""
+        surface.blits([(sprite.image, sprite.rect) for sprite in self.row_sprites[:self.count]], doreturn=False)
 
     def remove_ufo(self, ufo):
         """
         Remove a specific ufo from the group.
         """
-        try:
-            index = self.sprites().index(ufo)  # Find the index of the UFO in the group
-        except ValueError:
-            pass
-        else:
-            self.rect_positions = np.delete(self.rect_positions, index, axis=0)  # Remove position from array
-            self.exact_positions = np.delete(self.exact_positions, index, axis=0)
-            self.remove(ufo)
+        self.remove(ufo)
 
     def clear_all(self):
         """
         Remove all ufos from the group.
         """
         self.empty()
-        self.rect_positions = np.zeros((100, 2), dtype=np.int32)
-        self.exact_positions = np.zeros((100, 2), dtype=np.float32)
+        self._reset_store(self.initial_capacity)
+        self.pursuit_speed = 0
 
-class BlueUfoFleet(Group):
-    """A class o represent a single blue ufo in the fleet."""
+class BlinkingUfoFleet(UfoFleet):
+    """A fleet of still ufos turning left and right every second."""
 
     def __init__(self, game_instance):
-        """Initializes the ufo and set its starting position."""
-        super().__init__()
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.game_instance = game_instance
-        self.pg = game_instance.pg
-        self.settings = game_instance.settings
-        self.positions = np.zeros((100, 2), dtype=np.int32)
+        """Initializes the fleet and its two-frame timeline."""
+        super().__init__(game_instance)
+        self.animator = Animator(FrameTimeline(self.pg, (self.image_right, self.image_left)))
+
+    def _create_ufo(self, ufo_position):
+        """Creates a ufo in step with the rest of the fleet."""
+        ufo = super()._create_ufo(ufo_position)
+        self.animator.start(ufo, 0)
+
+        return ufo
+
+    def remove_internal(self, sprite):
+        """Removes the ufo's row and its animation."""
+        super().remove_internal(sprite)
+        self.animator.stop(sprite)
+
+    def _update_images(self):
+        """Flips the images only when the countdown ticks."""
+        #The countdown goes down once a second, so its negation is a rising tick
+        self.animator.advance(-self.settings.counter)
+
+    def clear_all(self):
+        """Removes all ufos and their animations."""
+        super().clear_all()
+        self.animator.clear()
+
+class RedUfoFleet(BlinkingUfoFleet):
+    """A class to represent the red ufo fleet."""
+
+    kind = "red"
+    image_right_path = 'resources/images/red_ufo_right.bmp'
+    image_left_path = 'resources/images/red_ufo_left.bmp'
+    limit_setting = "red_ufo_limit"
+
+class BlueUfoFleet(BlinkingUfoFleet):
+    """A class to represent the blue ufo fleet."""
 
-        self.blue_image_right, self.blue_image_left, self.blue_rect_right, self.blue_rect_left = self.preload_images()
+    kind = "blue"
+    image_right_path = 'resources/images/blue_ufo_right.bmp'
+    image_left_path = 'resources/images/blue_ufo_left.bmp'
+    limit_setting = "blue_ufo_limit"
 
-        self.size = self.blue_rect_right.size
+class GreenUfoFleet(UfoFleet):
+    """A class to represent the green ufo fleet, shuttling along one axis."""
+
+    kind = "green"
+    image_right_path = 'resources/images/green_ufo_right.bmp'
+    image_left_path = 'resources/images/green_ufo_left.bmp'
+    limit_setting = "green_ufo_limit"
 
     def preload_images(self):
-        """
-        Preloads images to prevent repeated slow disk access.
-        """
-        self.blue_image_right = pygame.image.load('resources/images/blue_ufo_right.bmp')
-        self.blue_rect_right = self.blue_image_right.get_rect()
+        """Preloads both images and builds their collision masks once."""
+        super().preload_images()
 
-        self.blue_image_left = pygame.image.load('resources/images/blue_ufo_left.bmp')
-        self.blue_rect_left = self.blue_image_left.get_rect()
+        #Sprites only ever show one of the two images, so they share these masks
+        self.masks = {
+            self.image_right: pygame.mask.from_surface(self.image_right),
+            self.image_left: pygame.mask.from_surface(self.image_left),
+            }
 
-        return self.blue_image_right, self.blue_image_left, self.blue_rect_right, self.blue_rect_left
+        return self.image_right, self.image_left, self.rect_right, self.rect_left
 
-    def create_fleet(self, planets_positions, planets_sizes):
-        """
-        Create a specified number of ufos and add them to the group.
-        """
-        n = 0
-        while n < self.settings.blue_ufo_limit:
-            ufo_position = random.randrange(0, self.screen_rect.width - self.blue_rect_right.width), random.randrange(250, self.screen_rect.height - self.blue_rect_right.height)
-            if not check_overlap(ufo_position=ufo_position, ufo_size=self.size, planets_positions=planets_positions, planets_sizes=planets_sizes):
-                self.positions[n] = ufo_position
-                self.add(self._create_ufo(ufo_position))
-                n += 1
-            else:
-                continue
+    def _reset_store(self, capacity):
+        """Allocates the fleet columns plus the facing of each ufo."""
+        super()._reset_store(capacity)
+        self.facings = np.ones(capacity, dtype=np.float32)
+
+    def _grow_store(self):
+        """Doubles the fleet columns plus the facings."""
+        extra = self.capacity
+        super()._grow_store()
+        self.facings = np.concatenate((self.facings, np.ones(extra, dtype=np.float32)))
+
+    def _columns(self):
+        """Green ufos also carry the direction their image is facing."""
+        return super()._columns() + (self.facings,)
 
     def _create_ufo(self, ufo_position):
-        """
-        Create a single ufo sprite.
-        """
-        blue_ufo = self.pg.sprite.Sprite()
-        blue_ufo.blue_image_right = self.blue_image_right
-        blue_ufo.blue_rect_right = self.blue_rect_right
-        blue_ufo.blue_image_left = self.blue_image_left
-        blue_ufo.blue_rect_left = self.blue_rect_left
-
-        for rect in (blue_ufo.blue_rect_right, blue_ufo.blue_rect_left):
-            rect.x, rect.y = ufo_position
-
-        blue_ufo.image = blue_ufo.blue_image_right
-        blue_ufo.rect = blue_ufo.blue_rect_right
-
-        return blue_ufo
-
-    def update(self):
-        """Updates the image and position of each UFO."""
-        for i, sprite in enumerate(self.sprites()):
-            # Update the sprite image and rect based on the counter
-            if self.game_instance.settings.counter % 2 == 0:
-                sprite.image = sprite.blue_image_right
-                sprite.rect = sprite.blue_rect_right.copy()  # Use a copy to avoid shablue reference issues
-            else:
-                sprite.image = sprite.blue_image_left
-                sprite.rect = sprite.blue_rect_left.copy()
-
-            # Update the rect position from self.positions
-            sprite.rect.topleft = (int(self.positions[i][0]), int(self.positions[i][1]))
+        """Creates a green ufo with a collision mask."""
+        green_ufo = super()._create_ufo(ufo_position)
+        self.facings[green_ufo.index] = 1
+        green_ufo.mask = self.masks[green_ufo.image]
 
-    def remove_ufo(self, ufo):
+        return green_ufo
+
+    def _speed(self):
+        """Green ufos move at the speed in the settings."""
+        return self.settings.green_ufo_speed
+
+    def set_axis(self, horizontal):
+        """Makes every green ufo move horizontally or vertically."""
+        self.velocities[:self.count] = (1, 0) if horizontal else (0, 1)
+
+    def flock(self, dt):
         """
-        Remove a specific ufo from the group.
+        Makes the fleet move as a swarm: one kernel call steers every ufo with its neighbours.
         """
-        try:
-            index = self.sprites().index(ufo)  # Find the index of the UFO in the group
-        except ValueError:
-            pass
-        else:
-            self.positions = np.delete(self.positions, index, axis=0)  # Remove position from array
-            self.remove(ufo)
-
-    def clear_all(self):
+        if not self.count:
+            return
+
+        #A heading is the velocity times the direction, kept as velocity and sign of x so
+        #the images keep facing where the ufos go and bounces still flip them
+        headings = self.velocities[:self.count] * self.directions[:self.count, np.newaxis]
+        headings = calculate_flock_headings(
+            self.exact_positions, headings, self.count, self.settings.swarm_radius, self.settings.swarm_separation,
+            self.settings.swarm_alignment, self.settings.swarm_cohesion, self.screen_rect.width, self.screen_rect.height, dt
+            )
+        self.directions[:self.count] = np.where(headings[:, 0] < 0, -1, 1)
+        self.velocities[:self.count] = headings * self.directions[:self.count, np.newaxis]
+
+    def bounce(self, spatial_hash, *layer_names):
         """
-        Remove all ufos from the group.
+        Bounces the whole fleet off the boxes of the given spatial hash layers and the
+        screen edges: one hash query, then one kernel call.
         """
-        self.empty()
-        self.positions = np.zeros((100, 2), dtype=np.int32)
\ No newline at end of file
+        if not self.count:
+            return
+
+        #First obstacle each ufo overlaps, if any
+        ufo_indices, entry_indices = spatial_hash.query(self.boxes(), *layer_names)
+        hit_obstacles = np.full(self.count, -1, dtype=np.int64)
+        ufo_indices, first_pairs = np.unique(ufo_indices, return_index=True)
+        hit_obstacles[ufo_indices] = entry_indices[first_pairs]
+
+        resolve_green_bounces(
+            self.exact_positions, self.velocities, self.directions, self.count, self.size[0], self.size[1],
+            spatial_hash.boxes, hit_obstacles, self.screen_rect.width, self.screen_rect.height
+            )
+
+    def _update_images(self):
+        """Turns the ufos whose direction changed since the last frame."""
+        turned_rows = np.flatnonzero(self.directions[:self.count] != self.facings[:self.count])
+        for index in turned_rows.tolist():
+            sprite = self.row_sprites[index]
+            sprite.image = self.image_right if self.directions[index] == 1 else self.image_left
+            sprite.mask = self.masks[sprite.image]
+        self.facings[turned_rows] = self.directions[turned_rows]
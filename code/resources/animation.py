@@ -0,0 +1,116 @@
+import numpy as np
+
+class FrameTimeline:
+    """An ordered list of frames, each shown for a fixed number of ticks."""
+
+    def __init__(self, pg, frames, ticks_per_frame=1, loop=True, with_masks=False):
+        """Stores the frames and, if asked, builds their collision masks once."""
+        self.frames = list(frames)
+        self.ticks_per_frame = ticks_per_frame
+        self.loop = loop
+        self.masks = [pg.mask.from_surface(frame) for frame in self.frames] if with_masks else None
+
+    def frame_indices(self, elapsed_ticks):
+        """
+        Maps an array of elapsed ticks to frame indices.
+        Finished one-shot instances get len(frames).
+        """
+        indices = elapsed_ticks // self.ticks_per_frame
+        if self.loop:
+            return indices % len(self.frames)
+        return np.minimum(indices, len(self.frames))
+
+class Animator:
+    """
+    Plays one timeline for many sprites. Start ticks and shown frames live in arrays,
+    so advancing every instance is a single array operation and only the sprites whose
+    frame changed are touched.
+    """
+
+    #Number of rows the store starts with, doubled whenever it runs out
+    initial_capacity = 16
+
+    def __init__(self, timeline):
+        """Initializes an empty store for the timeline."""
+        self.timeline = timeline
+        self._reset_store(self.initial_capacity)
+
+    def _reset_store(self, capacity):
+        """Allocates the instance columns, all rows empty."""
+        self.capacity = capacity
+        self.count = 0
+        self.start_ticks = np.zeros(capacity, dtype=np.int64)
+        self.shown_frames = np.full(capacity, -1, dtype=np.int64)
+        self.row_sprites = [None] * capacity
+
+        #Tick of the last advance, so idle frames return straight away
+        self.last_tick = None
+
+    def _grow_store(self):
+        """Doubles the instance columns when every row is taken."""
+        extra = self.capacity
+        self.capacity *= 2
+        self.start_ticks = np.concatenate((self.start_ticks, np.zeros(extra, dtype=np.int64)))
+        self.shown_frames = np.concatenate((self.shown_frames, np.full(extra, -1, dtype=np.int64)))
+        self.row_sprites.extend([None] * extra)
+
+    def start(self, sprite, tick):
+        """Starts playing the timeline for a sprite from the given tick."""
+        if self.count == self.capacity:
+            self._grow_store()
+
+        sprite.animation_row = self.count
+        self.start_ticks[self.count] = tick
+        self.shown_frames[self.count] = -1
+        self.row_sprites[self.count] = sprite
+        self.count += 1
+
+        #A new instance must get its first frame even if the tick did not change
+        self.last_tick = None
+
+    def stop(self, sprite):
+        """Stops animating a sprite, swapping the last row into its place."""
+        last = self.count - 1
+        row = sprite.animation_row
+        if row != last:
+            self.start_ticks[row] = self.start_ticks[last]
+            self.shown_frames[row] = self.shown_frames[last]
+            moved_sprite = self.row_sprites[last]
+            moved_sprite.animation_row = row
+            self.row_sprites[row] = moved_sprite
+
+        self.row_sprites[last] = None
+        self.count = last
+
+    def advance(self, tick):
+        """
+        Shows the current frame of every instance at the given tick.
+        Returns the sprites whose one-shot timeline has finished.
+        """
+        if tick == self.last_tick or not self.count:
+            return []
+        self.last_tick = tick
+
+        frames = self.timeline.frame_indices(tick - self.start_ticks[:self.count])
+        changed_rows = np.flatnonzero(frames != self.shown_frames[:self.count])
+        if not changed_rows.size:
+            return []
+        self.shown_frames[changed_rows] = frames[changed_rows]
+
+        finished = []
+        images = self.timeline.frames
+        masks = self.timeline.masks
+        for row, frame in zip(changed_rows.tolist(), frames[changed_rows].tolist()):
+            sprite = self.row_sprites[row]
+            if frame == len(images):
+                finished.append(sprite)
+                continue
+            sprite.image = images[frame]
+            if masks is not None:
+                sprite.mask = masks[frame]
+
+        return finished
+
+    def clear(self):
+        """Forgets every instance."""
+        self._reset_store(self.initial_capacity)
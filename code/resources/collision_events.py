@@ -0,0 +1,34 @@
+class CollisionEvents:
+    """
+    The collisions found in one frame, bucketed by kind as (a, b) pairs while they are added.
+    Detection only appends to it, gameplay reads it back kind by kind once every query has run.
+    """
+
+    def __init__(self, kinds):
+        """Initializes an empty bucket per kind. kinds names every kind of event the game can emit."""
+        self.kinds = tuple(kinds)
+        self.clear()
+
+    def clear(self):
+        """Forgets the events of the previous frame."""
+        self.buckets = {kind: ([], []) for kind in self.kinds}
+        self.count = 0
+
+    def add(self, kind, firsts, seconds):
+        """Appends one event of the given kind for each pair of firsts and seconds."""
+        bucket_firsts, bucket_seconds = self.buckets[kind]
+        added = len(bucket_firsts)
+        bucket_firsts.extend(firsts)
+        bucket_seconds.extend(seconds)
+        self.count += len(bucket_firsts) - added
+
+    def __len__(self):
+        """Returns the number of events."""
+        return self.count
+
+    def of(self, kind):
+        """
+        Returns the a and b sides of every event of the given kind, in the order they were added.
+        The lists are the bucket itself, so reading a kind several times costs nothing.
+        """
+        return self.buckets[kind]
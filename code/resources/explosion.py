@@ -1,17 +1,24 @@
 from pygame.sprite import Group
 
+from .animation import FrameTimeline, Animator
+
 class ExplosionGroup(Group):
     """A class to manage the explosion animation."""
 
+    #Number of game frames each explosion image stays on screen
+    explosion_speed = 5
+
     def __init__(self, game_instance):
         """Initializes the attributes and loads the images."""
         super().__init__()
         self.pg = game_instance.pg
         self.images = self.preload_images()
-        self.index = 0
-        self.image = self.images[self.index]
+        self.image = self.images[0]
         self.rect = self.image.get_rect()
-        self.counter = 0
+
+        #Explosions play once, then leave the group
+        self.animator = Animator(FrameTimeline(self.pg, self.images, self.explosion_speed, loop=False))
+        self.tick = 0
 
     def preload_images(self):
         """Preloads images to prevent repeated slow disk access."""
@@ -21,34 +28,34 @@ class ExplosionGroup(Group):
             img = self.pg.transform.scale(img, (60, 60))
             images.append(img)
         return images
-    
-    def create_explosion(self, obj_center): 
+
+    def create_explosion(self, obj_center):
         """
         Creates and adds a new explosion to the group.
         """
         explosion = self.pg.sprite.Sprite()
 
-        explosion.index = 0
-        explosion.counter = 0
-        explosion.images = self.images
-        explosion.image = self.images[explosion.index]
+        explosion.image = self.images[0]
         explosion.rect = self.rect.copy()
         explosion.rect.center = obj_center
-        
+
         return explosion
 
+    def add_internal(self, sprite, layer=None):
+        """Starts the explosion's timeline when it joins the group."""
+        super().add_internal(sprite, layer)
+        self.animator.start(sprite, self.tick)
+
+    def remove_internal(self, sprite):
+        """Stops the explosion's timeline when it leaves the group (remove, kill or empty)."""
+        super().remove_internal(sprite)
+        self.animator.stop(sprite)
+
     def update(self):
         """
         Changes explosions images.
         """
-        for explosion in self.sprites():
-            explosion_speed = 5
-            explosion.counter += 1
-
-            if explosion.counter >= explosion_speed and explosion.index < len(explosion.images) - 1:
-                explosion.counter = 0
-                explosion.index += 1
-                explosion.image = explosion.images[explosion.index]
-
-            if explosion.index >= len(explosion.images) - 1 and explosion.counter >= explosion_speed:
-                explosion.kill()
\ No newline at end of file
+        self.tick += 1
+        finished = self.animator.advance(self.tick)
+        if finished:
+            self.remove(*finished)
@@ -0,0 +1,34 @@
+import time
+import numpy as np
+
+class FrameProfiler:
+    """Keeps a rolling average of the time each subsystem takes per frame."""
+
+    def __init__(self, sections, window=60):
+        """Initializes one column of samples per section, window frames deep."""
+        self.sections = tuple(sections)
+        self.window = window
+        self.samples = np.zeros((window, len(self.sections)), dtype=np.float64)
+        self.frame = 0
+        self.lap_start = time.perf_counter()
+
+    def start_frame(self):
+        """Starts timing a new frame."""
+        self.samples[self.frame % self.window] = 0
+        self.lap_start = time.perf_counter()
+
+    def lap(self, section):
+        """Charges the time since the last lap to a section."""
+        now = time.perf_counter()
+        self.samples[self.frame % self.window, self.sections.index(section)] += now - self.lap_start
+        self.lap_start = now
+
+    def end_frame(self):
+        """Closes the current frame."""
+        self.frame += 1
+
+    def averages(self):
+        """Returns the average time of each section in milliseconds per frame."""
+        frames = max(min(self.frame, self.window), 1)
+        totals = self.samples[:frames].sum(axis=0)
+        return {section: total / frames * 1000 for section, total in zip(self.sections, totals.tolist())}
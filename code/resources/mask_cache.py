@@ -0,0 +1,16 @@
+from weakref import WeakKeyDictionary
+import pygame
+
+#Masks of the images seen so far, forgotten together with their image
+_masks = WeakKeyDictionary()
+
+def cached_mask(image):
+    """
+    Returns the collision mask of an image, building it only the first time.
+    Images are never drawn on once loaded, so a mask stays valid as long as its image lives.
+    """
+    mask = _masks.get(image)
+    if mask is None:
+        mask = _masks[image] = pygame.mask.from_surface(image)
+
+    return mask
@@ -1,5 +1,3 @@
-from pygame.sprite import Group
-from .ship import Ship
 from ..button import Button
 
 class ScoreBoard:
@@ -24,25 +22,16 @@ class ScoreBoard:
     def draw_board(self):
         """Draws the buttons of the scoreboard."""
         #Player 1 ships left
-        self.player_1_ships = Group()
-        for player_1_number in range(self.stats.player_1_ship_left):
-            player_1_ship = Ship(self.game_instance, self.game_instance.player_1_ship.right_image,
-                self.game_instance.player_1_ship.left_image, self.game_instance.player_1_ship.up_image,
-                self.game_instance.player_1_ship.down_image, 0)
-            player_1_ship.image = self.game_instance.player_1_ship.up_image
-            player_1_ship.rect = player_1_ship.image.get_rect()
-            player_1_ship.rect.x = 20 + player_1_number * player_1_ship.rect.width
-            self.player_1_ships.add(player_1_ship)
-            self.player_1_ships.draw(self.screen)
+        player_1_icon = self.game_instance.player_1_ship.up_image
+        icon_width = player_1_icon.get_width()
+        self.screen.blits(
+            [(player_1_icon, (20 + player_1_number * icon_width, 0)) for player_1_number in range(self.stats.player_1_ship_left)],
+            doreturn=False)
 
         #Player 2 ships left
-        self.player_2_ships = Group()
-        for player_2_number in range(self.stats.player_2_ship_left):
-            player_2_ship = Ship(self.game_instance, self.game_instance.player_2_ship.right_image,
-                self.game_instance.player_2_ship.left_image, self.game_instance.player_2_ship.up_image,
-                self.game_instance.player_2_ship.down_image, 0)
-            player_2_ship.image = self.game_instance.player_2_ship.up_image
-            player_2_ship.rect = player_2_ship.image.get_rect()
-            player_2_ship.rect.x = self.screen_rect.width - player_2_ship.rect.width - player_2_number * player_2_ship.rect.width
-            self.player_2_ships.add(player_2_ship)
-            self.player_2_ships.draw(self.screen)
\ No newline at end of file
+        player_2_icon = self.game_instance.player_2_ship.up_image
+        icon_width = player_2_icon.get_width()
+        self.screen.blits(
+            [(player_2_icon, (self.screen_rect.width - icon_width - player_2_number * icon_width, 0))
+             for player_2_number in range(self.stats.player_2_ship_left)],
+            doreturn=False)
\ No newline at end of file
@@ -10,6 +10,8 @@ from .mu_gamestats import GameStats
 from ..explosion import ExplosionGroup
 from .mu_scoreboard import ScoreBoard
 from ..planet import PlanetGroup
+from ..spatial_hash import SpatialHash
+from ..collision_events import CollisionEvents
 
 class Multiplayer:
     """A class to manage the alien hunt mode."""
@@ -69,6 +71,15 @@ class Multiplayer:
         #Explosion animations
         self.explosions = ExplosionGroup(self)
 
+        #Preloaded sounds
+        self.explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
+
+        #Broadphase for the projectile checks, rebuilt once per frame
+        self.spatial_hash = SpatialHash(self.screen_rect)
+
+        #What the collision queries found this frame, consumed in bulk once they are all done
+        self.collision_events = CollisionEvents(("ship_planet", "projectile_ship", "projectile_planet"))
+
     def _create_planets_group(self):
         """Creates a group of planets randomly placed over the screen."""
         #Empty the group of previous elems
@@ -258,22 +269,14 @@ class Multiplayer:
         """Creates a new projectile and adds it to the projectile's group."""
         fire_sound = self.pg.mixer.Sound('resources/sounds/hit_sound.mp3')
         self.pg.mixer.Sound.play(fire_sound)
-        new_projectile_1 = group.create_projectile(obj.rect.center)
-        if double_fire:
-            if direction_flag in ("fire_right", "fire_left"):
-                new_projectile_1.y = float(obj.rect.top)
-            else:
-                new_projectile_1.x = float(obj.rect.left)
-        setattr(new_projectile_1, direction_flag, True)
-        group.add(new_projectile_1)
-        if double_fire:
-            new_projectile_2 = group.create_projectile(obj.rect.center)
-            setattr(new_projectile_2, direction_flag, True)
-            if direction_flag in ("fire_right", "fire_left"):
-                new_projectile_2.y = float(obj.rect.bottom)
-            else:
-                new_projectile_2.x = float(obj.rect.right)
-            group.add(new_projectile_2)
+        if not double_fire:
+            group.add(group.create_projectile(obj.rect.center, direction_flag))
+        elif direction_flag in ("fire_right", "fire_left"):
+            group.add(group.create_projectile((obj.rect.centerx, obj.rect.top), direction_flag))
+            group.add(group.create_projectile((obj.rect.centerx, obj.rect.bottom), direction_flag))
+        else:
+            group.add(group.create_projectile((obj.rect.left, obj.rect.centery), direction_flag))
+            group.add(group.create_projectile((obj.rect.right, obj.rect.centery), direction_flag))
 
     def _check_keyup_events(self, event):
         """Manages key releases."""
@@ -394,11 +397,12 @@ class Multiplayer:
                 #Update the two ships' positions
                 self.player_1_ship.update(self.dt)
                 self.player_2_ship.update(self.dt)
-                self._check_ship_planet_collisions()
 
                 #Update projectiles
                 self._update_projectiles()
 
+                self._check_collisions()
+
             #Draw the two ships on the screen
             self.player_1_ship.blit_ship()
             self.player_2_ship.blit_ship()
@@ -434,84 +438,17 @@ class Multiplayer:
             self.sb.win_instruction_button._prep_text("You overwhelmed your enemy thanks to your superior skills. You saved the stars from their doom!", 16)
             self.sb.win_instruction_button.draw_button()
 
-    def _check_ship_planet_collisions(self):
-        """Manages collisions between rocket and planets."""
-        planets = self.pg.sprite.spritecollide(self.player_1_ship, self.planets, False, self.pg.sprite.collide_mask)
-        if planets:
-            for planet in planets:
-                if self.player_1_ship.moving_right:
-                    self.player_1_ship.moving_right = False
-                if self.player_1_ship.moving_left:
-                    self.player_1_ship.moving_left = False
-                if self.player_1_ship.moving_up:
-                    self.player_1_ship.moving_up = False
-                if self.player_1_ship.moving_down:
-                    self.player_1_ship.moving_down = False
-
-        planets = self.pg.sprite.spritecollide(self.player_2_ship, self.planets, False, self.pg.sprite.collide_mask)
-        if planets:
-            for planet in planets:
-                if self.player_2_ship.moving_right:
-                    self.player_2_ship.moving_right = False
-                if self.player_2_ship.moving_left:
-                    self.player_2_ship.moving_left = False
-                if self.player_2_ship.moving_up:
-                    self.player_2_ship.moving_up = False
-                if self.player_2_ship.moving_down:
-                    self.player_2_ship.moving_down = False
-
     def _update_projectiles(self):
         """Updates the position, gets rid of the old ones and draws projectiles."""
         #Update projectile's position
         self.player_1_projectiles.update(self.dt, self.settings.projectile_speed)
         self.player_2_projectiles.update(self.dt, self.settings.projectile_speed)
 
-        #Remove projectiles out of the screen from the Group
-        for projectile in self.player_1_projectiles:
-            if (projectile.rect.bottom <= 0 or projectile.rect.left >= self.screen_rect.width or
-                projectile.rect.top >= self.screen_rect.height or projectile.rect.right <= 0):
-                self.player_1_projectiles.remove_projectile(projectile)
-            else:
-                self.screen.blit(projectile.image, projectile.rect)
-        for projectile in self.player_2_projectiles:
-            if (projectile.rect.bottom <= 0 or projectile.rect.left >= self.screen_rect.width or
-                projectile.rect.top >= self.screen_rect.height or projectile.rect.right <= 0):
-                self.player_2_projectiles.remove_projectile(projectile)
-            else:
-                self.screen.blit(projectile.image, projectile.rect)
-
-        #Check for collisions
-        try:
-            if not player_1_collision_thread.is_alive():
-                player_1_collision = self.pg.sprite.spritecollide(self.player_1_ship, self.player_2_projectiles, True)
-                if player_1_collision:
-                    player_1_collision_thread = threading.Thread(target=self._manage_player_1_ship_collisions)
-                    player_1_collision_thread.daemon = True
-                    player_1_collision_thread.start()
-        except UnboundLocalError:
-            player_1_collision = self.pg.sprite.spritecollide(self.player_1_ship, self.player_2_projectiles, True)
-            if player_1_collision:
-                player_1_collision_thread = threading.Thread(target=self._manage_player_1_ship_collisions)
-                player_1_collision_thread.daemon = True
-                player_1_collision_thread.start()
-        else:
-            pass
-
-        try:
-            if not player_2_collision_thread.is_alive():
-                player_2_collision = self.pg.sprite.spritecollide(self.player_2_ship, self.player_1_projectiles, True)
-                if player_2_collision:
-                    player_2_collision_thread = threading.Thread(target=self._manage_player_2_ship_collisions)
-                    player_2_collision_thread.daemon = True
-                    player_2_collision_thread.start()
-        except UnboundLocalError:
-            player_2_collision = self.pg.sprite.spritecollide(self.player_2_ship, self.player_1_projectiles, True)
-            if player_2_collision:
-                player_2_collision_thread = threading.Thread(target=self._manage_player_2_ship_collisions)
-                player_2_collision_thread.daemon = True
-                player_2_collision_thread.start()
-        else:
-            pass
+        #Retire projectiles that flew past their exit time and blit the survivors
+        self.player_1_projectiles.retire_expired()
+        self.player_1_projectiles.blit_projectile()
+        self.player_2_projectiles.retire_expired()
+        self.player_2_projectiles.blit_projectile()
 
         if not self.stats.player_1_ship_left:
             player_2_win_thread = threading.Thread(target=self._manage_player_2_win)
@@ -523,14 +460,69 @@ class Multiplayer:
             player_1_win_thread.daemon = True
             player_1_win_thread.start()
 
-        self._check_projectile_planet_collisions(self.player_1_projectiles)
-        self._check_projectile_planet_collisions(self.player_2_projectiles)
+    def _check_collisions(self):
+        """Runs every collision query of the frame, then resolves what they found in one go."""
+        self._detect_collisions()
+        self._resolve_collisions()
+
+    def _detect_collisions(self):
+        """Runs every collision query and records what they found as events, without acting on them."""
+        events = self.collision_events
+        events.clear()
+
+        for ship in (self.player_1_ship, self.player_2_ship):
+            planet = self.planets.planet_under(ship.mask, ship.rect.topleft)
+            if planet:
+                events.add("ship_planet", [ship], [planet])
+
+        #Each player's projectiles only hurt the other player
+        self.spatial_hash.rebuild({
+            "player_1_ship": ([self._box(self.player_1_ship.rect)], [self.player_1_ship]),
+            "player_2_ship": ([self._box(self.player_2_ship.rect)], [self.player_2_ship]),
+            })
+        events.add("projectile_ship", *self.player_2_projectiles.swept_pairs(self.spatial_hash, "player_1_ship"))
+        events.add("projectile_ship", *self.player_1_projectiles.swept_pairs(self.spatial_hash, "player_2_ship"))
+
+        for projectiles in (self.player_1_projectiles, self.player_2_projectiles):
+            events.add("projectile_planet", *projectiles.planet_pairs(self.planets))
+
+    def _box(self, rect):
+        """Returns a rect as a (left, top, right, bottom) box."""
+        return rect.left, rect.top, rect.right, rect.bottom
+
+    def _resolve_collisions(self):
+        """Applies the events of the frame in bulk, so each side effect happens once."""
+        events = self.collision_events
+        if not events:
+            return
+
+        #Ships stop against the planets
+        for ship in dict.fromkeys(events.of("ship_planet")[0]):
+            ship.moving_right = False
+            ship.moving_left = False
+            ship.moving_up = False
+            ship.moving_down = False
+
+        #Projectiles stop on whatever they hit
+        projectiles = events.of("projectile_ship")[0] + events.of("projectile_planet")[0]
+        self.player_1_projectiles.remove(*projectiles)
+        self.player_2_projectiles.remove(*projectiles)
+
+        #A ship hit by several projectiles still loses a single life
+        hit_ships = dict.fromkeys(events.of("projectile_ship")[1])
+        if hit_ships:
+            self.explosion_sound.play()
+        for ship in hit_ships:
+            if ship is self.player_1_ship:
+                collision_thread = threading.Thread(target=self._manage_player_1_ship_collisions)
+            else:
+                collision_thread = threading.Thread(target=self._manage_player_2_ship_collisions)
+            collision_thread.daemon = True
+            collision_thread.start()
 
     def _manage_player_1_ship_collisions(self):
         """Manages the Player 1 being hit by a projectile fired by Player 2."""
         self.player_1_hit = True
-        explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-        self.pg.mixer.Sound.play(explosion_sound)
         explosion = self.explosions.create_explosion(self.player_1_ship.rect.center)
         self.explosions.add(explosion)
             
@@ -553,8 +545,6 @@ class Multiplayer:
     def _manage_player_2_ship_collisions(self):
         """Manages the Player 2 being hit by a projectile fired by Player 1."""
         self.player_2_hit = True
-        explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-        self.pg.mixer.Sound.play(explosion_sound)
         explosion = self.explosions.create_explosion(self.player_2_ship.rect.center)
         self.explosions.add(explosion)
             
@@ -574,12 +564,6 @@ class Multiplayer:
             self.player_1_ship.place_initial(self.screen_rect.left)
             self.player_2_ship.place_initial(self.screen_rect.right-self.player2menu.ship_2_up_image.get_width())
 
-    def _check_projectile_planet_collisions(self, group):
-        """Deletes the projectile if it hits a planet"""
-        projectiles = self.pg.sprite.groupcollide(group, self.planets, False, False)
-        for projectile in projectiles:
-            group.remove_projectile(projectile)
-
     def _manage_player_2_win(self):
         """Handles the end of the game in favour of player 2. Updates the game state and flags for main thread."""
         print("Game over triggered in thread.")
@@ -1,8 +1,9 @@
-import pygame
 from pygame.sprite import Sprite
 from numba import njit
 import numpy as np
 
+from ..mask_cache import cached_mask
+
 @njit
 def calculate_new_position(position, moving_right, moving_left, moving_up, moving_down, speed, dt):
     """Calculate the new position based on movement flags and elapsed time."""
@@ -84,7 +85,7 @@ class Ship(Sprite):
 
         #Start with the ship pointing up
         self.image = self.up_image
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = cached_mask(self.image)
         self.rect = self.up_image_rect
         self.position = np.array([self.screen_rect.width/2, x_pos], dtype=np.float32)
 
@@ -119,7 +120,7 @@ class Ship(Sprite):
             
             self.rect.x, self.rect.y = new_rect_x, new_rect_y
 
-            self.mask = pygame.mask.from_surface(self.image)
+            self.mask = cached_mask(self.image)
             
             # Update all image rects
             for img_rect in [self.right_image_rect, self.left_image_rect, self.up_image_rect, self.down_image_rect]:
@@ -46,6 +46,9 @@ class PlanetGroup(Group):
         # Usage
         self.preloaded_images = self.preload_images()
 
+        # Screen-sized bitmap of the planets, empty until they are created
+        self.rasterise()
+
     def preload_images(self):
         """
         Preloads images to prevent repeated slow disk access.
@@ -79,6 +82,8 @@ class PlanetGroup(Group):
             else:
                 continue
 
+        self.rasterise()
+
     def _create_planet(self, planet_image, planet_position):
         """
         Create a single planet sprite.
@@ -92,16 +97,76 @@ class PlanetGroup(Group):
         # Add a collision mask
         planet.mask = self.pg.mask.from_surface(planet.image)
 
+        # Box around the visible pixels, tighter than the image rect
+        visible_rects = planet.mask.get_bounding_rects() or [planet.mask.get_rect()]
+        visible_rect = visible_rects[0].unionall(visible_rects[1:])
+        visible_rect.move_ip(planet.rect.topleft)
+        planet.box = visible_rect.left, visible_rect.top, visible_rect.right, visible_rect.bottom
+
         return planet
 
+    def boxes(self):
+        """Returns the (left, top, right, bottom) box of the visible part of every planet."""
+        return np.array([planet.box for planet in self.sprites()], dtype=np.int32).reshape(-1, 4)
+
+    def rasterise(self):
+        """
+        Draws every planet mask into one screen-sized bitmap. Planets never move within a level,
+        so this runs when they change and every collision test is then a lookup into it:
+        occupancy_mask for sprite masks, occupancy (planet number + 1 per pixel, 0 where free) for points.
+        """
+        occupants = self.sprites()
+        occupancy_mask = self.pg.mask.Mask(self.screen_rect.size)
+        occupancy = np.zeros((self.screen_rect.height, self.screen_rect.width), dtype=np.int16)
+        for number, planet in enumerate(occupants, 1):
+            occupancy_mask.draw(planet.mask, planet.rect.topleft)
+
+            # Planets are always placed fully on screen
+            pixels = self.pg.surfarray.array_red(planet.mask.to_surface()).T > 0
+            occupancy[planet.rect.top:planet.rect.bottom, planet.rect.left:planet.rect.right][pixels] = number
+
+        self.occupants, self.occupancy_mask, self.occupancy = occupants, occupancy_mask, occupancy
+
+    def planets_at(self, points):
+        """
+        Looks (x, y) points up in the bitmap. Returns the indices of the points
+        lying on a planet and, in the same order, the planets they lie on.
+        """
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        x, y = points[:, 0], points[:, 1]
+        inside = (x >= 0) & (x < self.screen_rect.width) & (y >= 0) & (y < self.screen_rect.height)
+
+        numbers = np.zeros(len(points), dtype=np.int16)
+        numbers[inside] = self.occupancy[y[inside], x[inside]]
+        indices = np.flatnonzero(numbers)
+
+        return indices, [self.occupants[number - 1] for number in numbers[indices].tolist()]
+
+    def planet_under(self, mask, topleft):
+        """
+        Tests a sprite mask placed at topleft against the bitmap in one go, whatever the number
+        of planets. Returns a planet it overlaps, or None.
+        """
+        point = self.occupancy_mask.overlap(mask, topleft)
+        if point is None:
+            return None
+
+        return self.occupants[self.occupancy[point[1], point[0]] - 1]
+
     def remove_planet(self, planet):
         """
         Remove a specific planet from the group.
         """
         self.remove(planet)
+        self.rasterise()
+
+    def draw(self, surface):
+        """Draws every planet with a single blits call."""
+        surface.blits([(sprite.image, sprite.rect) for sprite in self.sprites()], doreturn=False)
 
     def clear_all(self):
         """
         Remove all planets from the group.
         """
-        self.empty()
\ No newline at end of file
+        self.empty()
+        self.rasterise()
\ No newline at end of file
@@ -1,64 +1,159 @@
+import heapq
 import pygame
 from pygame.sprite import Group
 from numba import njit
 import numpy as np
 from typing import Literal
 
+#Unit vectors of the eight firing directions
+DIAGONAL = np.float32(1 / np.sqrt(2))
+DIRECTIONS = {
+    "fire_right": (1.0, 0.0),
+    "fire_left": (-1.0, 0.0),
+    "fire_up": (0.0, -1.0),
+    "fire_down": (0.0, 1.0),
+    "fire_northwest": (-DIAGONAL, -DIAGONAL),
+    "fire_northeast": (DIAGONAL, -DIAGONAL),
+    "fire_southwest": (-DIAGONAL, DIAGONAL),
+    "fire_southeast": (DIAGONAL, DIAGONAL),
+}
+
+#The same directions as arrays, for firing in bulk with direction codes
+DIRECTION_NAMES = tuple(DIRECTIONS)
+DIRECTION_VECTORS = np.array([DIRECTIONS[name] for name in DIRECTION_NAMES], dtype=np.float32)
+
 @njit
-def calculate_new_position(
-    x, y, moving_right, moving_left, moving_up, moving_down, moving_northwest, moving_northeast, moving_southwest, moving_southeast,
-    speed, dt
-    ):
-    """Calculate the new position based on movement flags and elapsed time."""
-    direction = np.array([0.0, 0.0])
-    if moving_right:
-        direction[0] += 1
-    if moving_left:
-        direction[0] -= 1
-    if moving_up:
-        direction[1] -= 1
-    if moving_down:
-        direction[1] += 1
-    if moving_northwest:
-        direction[0] -= 1
-        direction[1] -= 1
-    if moving_northeast:
-        direction[0] += 1
-        direction[1] -= 1
-    if moving_southwest:
-        direction[0] -= 1
-        direction[1] += 1
-    if moving_southeast:
-        direction[0] += 1
-        direction[1] += 1
-    
-    # Normalize the direction vector and scale by speed
-    if np.linalg.norm(direction) > 0:
-        direction = direction / np.linalg.norm(direction) * speed
-    
-    # Calculate new position based on direction and delta time
-    new_x = x + direction[0] * dt
-    new_y = y + direction[1] * dt
-    
-    return new_x, new_y
+def advance_projectiles(exact_positions, previous_positions, rect_positions, velocities, active, dt):
+    """
+    Moves every active projectile of the pool in a single pass.
+    Returns a mask of the slots whose rect position changed.
+    """
+    moved = np.zeros(active.shape[0], dtype=np.bool_)
+    dt = np.float32(dt)
+    for i in range(active.shape[0]):
+        if active[i]:
+            previous_positions[i, 0] = exact_positions[i, 0]
+            previous_positions[i, 1] = exact_positions[i, 1]
+            exact_positions[i, 0] += velocities[i, 0] * dt
+            exact_positions[i, 1] += velocities[i, 1] * dt
+
+            new_rect_x = np.int32(round(exact_positions[i, 0]))
+            new_rect_y = np.int32(round(exact_positions[i, 1]))
+            if rect_positions[i, 0] != new_rect_x or rect_positions[i, 1] != new_rect_y:
+                rect_positions[i, 0] = new_rect_x
+                rect_positions[i, 1] = new_rect_y
+                moved[i] = True
+
+    return moved
+
+@njit
+def calculate_exit_time(x, y, velocity_x, velocity_y, width, height, screen_width, screen_height):
+    """
+    Calculates how long a projectile flying in a straight line takes to leave the screen.
+    """
+    exit_time = np.inf
+    if velocity_x > 0:
+        exit_time = min(exit_time, (screen_width - x) / velocity_x)
+    elif velocity_x < 0:
+        exit_time = min(exit_time, (x + width) / -velocity_x)
+    if velocity_y > 0:
+        exit_time = min(exit_time, (screen_height - y) / velocity_y)
+    elif velocity_y < 0:
+        exit_time = min(exit_time, (y + height) / -velocity_y)
+
+    return max(exit_time, 0.0)
+
+@njit
+def calculate_exit_times(positions, velocities, width, height, screen_width, screen_height):
+    """
+    Calculates the exit time of a batch of projectiles.
+    """
+    exit_times = np.empty(positions.shape[0], dtype=np.float64)
+    for i in range(positions.shape[0]):
+        exit_times[i] = calculate_exit_time(
+            positions[i, 0], positions[i, 1], velocities[i, 0], velocities[i, 1], width, height, screen_width, screen_height
+            )
+
+    return exit_times
+
+@njit
+def segment_hits_box(x0, y0, dx, dy, left, top, right, bottom):
+    """
+    Slab test between the segment (x0, y0) + t * (dx, dy), t in [0, 1], and a box.
+    Like colliderect, a segment that only touches the box edges or corners does not hit it.
+    """
+    t_enter, t_exit = 0.0, 1.0
+    for start, delta, low, high in ((x0, dx, left, right), (y0, dy, top, bottom)):
+        if delta == 0.0:
+            if start <= low or start >= high:
+                return False
+        else:
+            t_low = (low - start) / delta
+            t_high = (high - start) / delta
+            if t_low > t_high:
+                t_low, t_high = t_high, t_low
+            t_enter = max(t_enter, t_low)
+            t_exit = min(t_exit, t_high)
+            if t_enter >= t_exit:
+                return False
+
+    return True
+
+@njit
+def calculate_swept_boxes(previous_positions, exact_positions, active, width, height):
+    """
+    Returns the active slots and the box (left, top, right, bottom) each one swept since the
+    last update, grown by a pixel so touching paths are still candidates.
+    """
+    slots = np.flatnonzero(active)
+    boxes = np.empty((slots.shape[0], 4), dtype=np.int64)
+    for k in range(slots.shape[0]):
+        i = slots[k]
+        boxes[k, 0] = np.int64(np.floor(min(previous_positions[i, 0], exact_positions[i, 0]))) - 1
+        boxes[k, 1] = np.int64(np.floor(min(previous_positions[i, 1], exact_positions[i, 1]))) - 1
+        boxes[k, 2] = np.int64(np.ceil(max(previous_positions[i, 0], exact_positions[i, 0]))) + width + 1
+        boxes[k, 3] = np.int64(np.ceil(max(previous_positions[i, 1], exact_positions[i, 1]))) + height + 1
+
+    return slots, boxes
+
+@njit
+def confirm_swept_hits(previous_positions, exact_positions, width, height, slots, target_boxes):
+    """
+    Runs the exact swept test on candidate (slot, target box) pairs from the broadphase.
+    Returns a mask of the pairs that really hit.
+    """
+    hits = np.zeros(slots.shape[0], dtype=np.bool_)
+    for k in range(slots.shape[0]):
+        i = slots[k]
+        x0, y0 = previous_positions[i, 0], previous_positions[i, 1]
+        dx, dy = exact_positions[i, 0] - x0, exact_positions[i, 1] - y0
+        hits[k] = segment_hits_box(
+            x0, y0, dx, dy, target_boxes[k, 0] - width, target_boxes[k, 1] - height, target_boxes[k, 2], target_boxes[k, 3]
+            )
+
+    return hits
 
 class ProjectileGroup(Group):
     """A class to manage the projectiles fired from the ship."""
+
+    #Number of slots the pool starts with, doubled whenever it runs out
+    initial_capacity = 100
     
     def __init__(self, game_instance, image_path):
         """Creates a projectile object at the rocket's current position."""
         super().__init__()
         self.screen = game_instance.screen
+        self.screen_rect = self.screen.get_rect()
         self.settings = game_instance.settings
         self.pg = game_instance.pg
         self.image_path = image_path
-        self.rect_positions = np.zeros((100, 2), dtype=np.int32)
-        self.exact_positions = np.zeros((100, 2), dtype=np.float32)
-        
+
         self.game_instance = game_instance
         
         self.image, self.rect = self.preload_images()
 
+        self._reset_pool(self.initial_capacity)
+
     def preload_images(self):
         """
         Preloads images to prevent repeated slow disk access.
@@ -68,67 +163,244 @@ class ProjectileGroup(Group):
         self.rect = self.image.get_rect()
 
         return self.image, self.rect
+
+    def _reset_pool(self, capacity):
+        """
+        Allocates the slot arrays and marks every slot as free.
+        """
+        self.capacity = capacity
+        self.rect_positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.exact_positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.previous_positions = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float32)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        self.slot_sprites = [None] * capacity
+
+        #Bumped on every release so stale expiries of a reused slot are ignored
+        self.generations = [0] * capacity
+
+        #Speed the stored velocities were built with
+        self.speed = self.settings.projectile_speed
+
+        #Min-heap of (expiry time, slot, generation), on the pool's own clock
+        self.clock_time = 0.0
+        self.expiries = []
+
+        #Stack of free slots, lowest index on top
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    def _grow_pool(self):
+        """
+        Doubles the slot arrays when every slot is taken.
+        """
+        old_capacity = self.capacity
+        self.capacity *= 2
+        extra = self.capacity - old_capacity
+
+        self.rect_positions = np.concatenate((self.rect_positions, np.zeros((extra, 2), dtype=np.int32)))
+        self.exact_positions = np.concatenate((self.exact_positions, np.zeros((extra, 2), dtype=np.float32)))
+        self.previous_positions = np.concatenate((self.previous_positions, np.zeros((extra, 2), dtype=np.float32)))
+        self.velocities = np.concatenate((self.velocities, np.zeros((extra, 2), dtype=np.float32)))
+        self.active = np.concatenate((self.active, np.zeros(extra, dtype=np.bool_)))
+        self.slot_sprites.extend([None] * extra)
+        self.generations.extend([0] * extra)
+
+        self.free_slots.extend(range(self.capacity - 1, old_capacity - 1, -1))
+
+    def _acquire_slot(self):
+        """
+        Pops a free slot from the pool in O(1).
+        """
+        if not self.free_slots:
+            self._grow_pool()
+        index = self.free_slots.pop()
+        self.active[index] = True
+
+        return index
+
+    def _release_slot(self, index):
+        """
+        Gives a slot back to the pool in O(1).
+        """
+        self.active[index] = False
+        self.rect_positions[index] = 0
+        self.exact_positions[index] = 0
+        self.previous_positions[index] = 0
+        self.velocities[index] = 0
+        self.slot_sprites[index] = None
+        self.generations[index] += 1
+        self.free_slots.append(index)
     
-    def create_projectile(self, obj_center):
+    def create_projectile(self, position, direction):
         """
-        Creates and adds a new projectile to the group.
+        Creates a new projectile at the given position, flying in one of the DIRECTIONS.
         """
         projectile = self.pg.sprite.Sprite()
 
-        projectile.index = np.where((self.rect_positions == [0, 0]).all(axis=1))[0][0]
+        #The slot is the projectile's handle into the position arrays until it leaves the group
+        projectile.index = self._acquire_slot()
+        self.slot_sprites[projectile.index] = projectile
 
-        self.rect_positions[projectile.index] = obj_center
-        self.exact_positions[projectile.index] = np.float32(obj_center)
+        self.rect_positions[projectile.index] = position
+        self.exact_positions[projectile.index] = np.float32(position)
+        self.previous_positions[projectile.index] = np.float32(position)
+
+        #Velocity is fixed for the whole flight
+        self.velocities[projectile.index] = DIRECTIONS[direction]
+        self.velocities[projectile.index] *= np.float32(self.speed)
+
+        #The flight is a straight line, so the moment it leaves the screen is known now
+        exit_time = calculate_exit_time(
+            float(position[0]), float(position[1]), float(self.velocities[projectile.index, 0]), float(self.velocities[projectile.index, 1]),
+            self.rect.width, self.rect.height, self.screen_rect.width, self.screen_rect.height
+            )
+        heapq.heappush(self.expiries, (self.clock_time + exit_time, projectile.index, self.generations[projectile.index]))
 
         projectile.image = self.image
         projectile.rect = self.rect.copy()
+        projectile.rect.topleft = position
+
+        return projectile
+
+    def create_projectiles(self, positions, direction_codes):
+        """
+        Creates and adds a batch of projectiles in one go.
+        direction_codes index DIRECTION_NAMES, one per row of positions.
+        """
+        positions = np.asarray(positions, dtype=np.int32).reshape(-1, 2)
+        count = positions.shape[0]
+        if not count:
+            return []
 
-        projectile.rect.center = obj_center
-        projectile.x, projectile.y = float(obj_center[0]), float(obj_center[1])
+        while len(self.free_slots) < count:
+            self._grow_pool()
+        indices = np.array([self.free_slots.pop() for _ in range(count)], dtype=np.int64)
 
-        projectile.fire_right = False
-        projectile.fire_left = False
-        projectile.fire_up = False
-        projectile.fire_down = False
-        projectile.fire_northwest = False
-        projectile.fire_northeast = False
-        projectile.fire_southwest = False
-        projectile.fire_southeast = False
+        #Fill every new row with one array operation per column
+        velocities = DIRECTION_VECTORS[direction_codes] * np.float32(self.speed)
+        self.active[indices] = True
+        self.rect_positions[indices] = positions
+        self.exact_positions[indices] = positions
+        self.previous_positions[indices] = positions
+        self.velocities[indices] = velocities
 
-        return projectile
+        exit_times = calculate_exit_times(
+            positions.astype(np.float64), velocities.astype(np.float64),
+            self.rect.width, self.rect.height, self.screen_rect.width, self.screen_rect.height
+            )
+        for index, exit_time in zip(indices.tolist(), exit_times.tolist()):
+            heapq.heappush(self.expiries, (self.clock_time + exit_time, index, self.generations[index]))
+
+        projectiles = []
+        for index, topleft in zip(indices.tolist(), positions.tolist()):
+            projectile = self.pg.sprite.Sprite()
+            projectile.index = index
+            projectile.image = self.image
+            projectile.rect = self.rect.copy()
+            projectile.rect.topleft = topleft
+            self.slot_sprites[index] = projectile
+            projectiles.append(projectile)
+
+        self.add(*projectiles)
+
+        return projectiles
+
+    def remove_internal(self, sprite):
+        """
+        Frees the projectile's slot whenever it leaves the group (remove, kill or empty).
+        """
+        super().remove_internal(sprite)
+        self._release_slot(sprite.index)
 
     def update(self, dt, projectile_speed):
         """
-        Updates the projectile's position based on the movement flags.
+        Moves all projectiles with one kernel call and syncs the rects that changed.
         """
-        for projectile in self.sprites():
-            self.exact_positions[projectile.index] = calculate_new_position(
-                projectile.x, projectile.y, projectile.fire_right, projectile.fire_left, projectile.fire_up, projectile.fire_down,
-                projectile.fire_northwest, projectile.fire_northeast, projectile.fire_southwest, projectile.fire_southeast, projectile_speed, dt
-                )
-            
-            self.rect_positions[projectile.index] = np.round(self.exact_positions[projectile.index]).astype(np.int32)
-            
-            projectile.x, projectile.y = self.exact_positions[projectile.index]
+        if projectile_speed != self.speed:
+            self._rescale_speed(projectile_speed)
+
+        self.clock_time += dt
+        moved = advance_projectiles(self.exact_positions, self.previous_positions, self.rect_positions, self.velocities, self.active, dt)
+
+        #Bulk rect sync, only for the projectiles that crossed a pixel
+        moved_slots = np.flatnonzero(moved)
+        for index, topleft in zip(moved_slots.tolist(), self.rect_positions[moved_slots].tolist()):
+            self.slot_sprites[index].rect.topleft = topleft
+
+    def _rescale_speed(self, projectile_speed):
+        """
+        Rescales velocities and the remaining flight times after a speed change.
+        """
+        ratio = self.speed / projectile_speed
+        self.velocities *= np.float32(projectile_speed / self.speed)
+        self.speed = projectile_speed
+
+        #Every remaining time shrinks by the same factor, so the heap order still holds
+        self.expiries = [
+            (self.clock_time + (expiry - self.clock_time) * ratio, index, generation)
+            for expiry, index, generation in self.expiries
+            ]
+
+    def retire_expired(self):
+        """
+        Removes the projectiles whose exit time has passed.
+        """
+        expired = []
+        while self.expiries and self.expiries[0][0] <= self.clock_time:
+            _, index, generation = heapq.heappop(self.expiries)
+            if self.generations[index] == generation:
+                expired.append(self.slot_sprites[index])
+
+        if expired:
+            self.remove(*expired)
+
+    def swept_pairs(self, spatial_hash, *layer_names):
+        """
+        Swept collisions against layers of a spatial hash: the hash picks the candidate
+        targets near each path, the exact swept test confirms them.
+        Returns two lists of the same length, the projectiles and the sprites their paths crossed.
+        """
+        if not self:
+            return [], []
+
+        slots, boxes = calculate_swept_boxes(self.previous_positions, self.exact_positions, self.active, self.rect.width, self.rect.height)
+        query_indices, entry_indices = spatial_hash.query(boxes, *layer_names)
+        candidate_slots = slots[query_indices]
+        hits = confirm_swept_hits(
+            self.previous_positions, self.exact_positions, self.rect.width, self.rect.height,
+            candidate_slots, spatial_hash.boxes[entry_indices]
+            )
+
+        projectiles = [self.slot_sprites[index] for index in candidate_slots[hits].tolist()]
+        targets = [spatial_hash.sprites[entry] for entry in entry_indices[hits].tolist()]
+
+        return projectiles, targets
+
+    def planet_pairs(self, planets):
+        """
+        Returns two lists of the same length, the projectiles whose center lies on a planet
+        and the planets they lie on, read straight from the planets' bitmap.
+        """
+        if not self:
+            return [], []
+
+        slots = np.flatnonzero(self.active)
+        centers = self.rect_positions[slots] + np.array(self.rect.size, dtype=np.int32) // 2
+        indices, hit_planets = planets.planets_at(centers)
 
-            new_rect_x, new_rect_y = round(projectile.x), round(projectile.y)
-            if projectile.rect.x != new_rect_x or projectile.rect.y != new_rect_y:
-                projectile.rect.x, projectile.rect.y = new_rect_x, new_rect_y
+        return [self.slot_sprites[index] for index in slots[indices].tolist()], hit_planets
 
     def blit_projectile(self):
-        """Draws the projectile at its current position."""
-        for projectile in self.sprites():
-            self.screen.blit(projectile.image, projectile.rect)
+        """Draws every projectile with one blits call straight from the position arrays."""
+        image = self.image
+        self.screen.blits([(image, topleft) for topleft in self.rect_positions[self.active].tolist()], doreturn=False)
 
     def remove_projectile(self, projectile):
         """Removes the projectile from the group."""
+        #The slot is released by remove_internal, found through the projectile's own handle
         self.remove(projectile)
-        index = np.where((self.rect_positions == [projectile.rect.x, projectile.rect.y]).all(axis=1))[0][0]
-        self.rect_positions[index] = [0, 0]
-        self.exact_positions[index] = [0, 0]
 
     def clear_projectiles(self):
         """Clears all projectiles from the group."""
         self.empty()
-        self.rect_positions = np.zeros((100, 2), dtype=np.int32)
-        self.exact_positions = np.zeros((100, 2), dtype=np.float32)
\ No newline at end of file
+        self._reset_pool(self.initial_capacity)
\ No newline at end of file
@@ -0,0 +1,117 @@
+from numba import njit
+import numpy as np
+
+@njit
+def calculate_cell_range(box, cell_size, columns, rows):
+    """Returns the first and last (column, row) of the cells a box (left, top, right, bottom) touches."""
+    first_column = min(max(box[0] // cell_size, 0), columns - 1)
+    first_row = min(max(box[1] // cell_size, 0), rows - 1)
+    last_column = min(max((box[2] - 1) // cell_size, first_column), columns - 1)
+    last_row = min(max((box[3] - 1) // cell_size, first_row), rows - 1)
+
+    return first_column, first_row, last_column, last_row
+
+@njit
+def build_spatial_hash(boxes, cell_size, columns, rows):
+    """
+    Counting sort of the boxes into every cell they touch.
+    Returns the start of each cell's run in entries, and the entries themselves.
+    """
+    cell_starts = np.zeros(columns * rows + 1, dtype=np.int64)
+    for i in range(boxes.shape[0]):
+        first_column, first_row, last_column, last_row = calculate_cell_range(boxes[i], cell_size, columns, rows)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell_starts[row * columns + column + 1] += 1
+    for cell in range(columns * rows):
+        cell_starts[cell + 1] += cell_starts[cell]
+
+    entries = np.empty(cell_starts[-1], dtype=np.int64)
+    fill = cell_starts[:-1].copy()
+    for i in range(boxes.shape[0]):
+        first_column, first_row, last_column, last_row = calculate_cell_range(boxes[i], cell_size, columns, rows)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell = row * columns + column
+                entries[fill[cell]] = i
+                fill[cell] += 1
+
+    return cell_starts, entries
+
+@njit
+def query_spatial_hash(cell_starts, entries, boxes, layers, layer_mask, cell_size, columns, rows, query_boxes):
+    """
+    Finds every (query box, stored box) pair that overlaps, among the stored boxes of the masked layers.
+    Each pair is reported once, from the first cell both boxes share.
+    """
+    query_indices = []
+    entry_indices = []
+    for q in range(query_boxes.shape[0]):
+        box = query_boxes[q]
+        first_column, first_row, last_column, last_row = calculate_cell_range(box, cell_size, columns, rows)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell = row * columns + column
+                for k in range(cell_starts[cell], cell_starts[cell + 1]):
+                    e = entries[k]
+                    if not layers[e] & layer_mask:
+                        continue
+                    other = boxes[e]
+                    if not (box[0] < other[2] and box[2] > other[0] and box[1] < other[3] and box[3] > other[1]):
+                        continue
+                    other_first_column, other_first_row, _, _ = calculate_cell_range(other, cell_size, columns, rows)
+                    if column == max(first_column, other_first_column) and row == max(first_row, other_first_row):
+                        query_indices.append(q)
+                        entry_indices.append(e)
+
+    return np.array(query_indices, dtype=np.int64), np.array(entry_indices, dtype=np.int64)
+
+class SpatialHash:
+    """
+    A uniform grid over the screen holding the boxes of several named layers.
+    It is rebuilt once per frame, then any number of box queries run against it.
+    """
+
+    def __init__(self, screen_rect, cell_size=64):
+        """Initializes an empty grid covering the screen."""
+        self.cell_size = cell_size
+        self.columns = -(-screen_rect.width // cell_size)
+        self.rows = -(-screen_rect.height // cell_size)
+
+        self.layer_bits = {}
+        self.rebuild({})
+
+    def rebuild(self, layers):
+        """
+        Replaces the content of the grid. layers maps each layer name to its
+        (left, top, right, bottom) boxes and the sprites they belong to, in the same order.
+        """
+        boxes, layer_ids, self.sprites = [], [], []
+        for name, (layer_boxes, layer_sprites) in layers.items():
+            bit = self.layer_bits.setdefault(name, 1 << len(self.layer_bits))
+            layer_boxes = np.asarray(layer_boxes, dtype=np.int64).reshape(-1, 4)
+            boxes.append(layer_boxes)
+            layer_ids.append(np.full(layer_boxes.shape[0], bit, dtype=np.int64))
+            self.sprites.extend(layer_sprites)
+
+        self.boxes = np.concatenate(boxes) if boxes else np.zeros((0, 4), dtype=np.int64)
+        self.layers = np.concatenate(layer_ids) if layer_ids else np.zeros(0, dtype=np.int64)
+        self.cell_starts, self.entries = build_spatial_hash(self.boxes, self.cell_size, self.columns, self.rows)
+
+    def query(self, query_boxes, *layer_names):
+        """
+        Returns the overlapping pairs as two arrays: the index of the query box and
+        the index of the stored box, which also indexes self.sprites and self.boxes.
+        """
+        layer_mask = 0
+        for name in layer_names:
+            layer_mask |= self.layer_bits.get(name, 0)
+
+        query_boxes = np.asarray(query_boxes, dtype=np.int64).reshape(-1, 4)
+        if not layer_mask or not query_boxes.shape[0]:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        return query_spatial_hash(
+            self.cell_starts, self.entries, self.boxes, self.layers, layer_mask,
+            self.cell_size, self.columns, self.rows, query_boxes
+            )
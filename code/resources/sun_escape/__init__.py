@@ -4,5 +4,5 @@ from .se_menu import SunEscapeStaticMenu, SunEscapeDynamicMenu
 from .se_settings import SESettings
 from .sun import Sun
 from .wave import WaveGroup
-from .fuel_tank import FuelTank
+from .fuel_tank import FuelTankGroup
 from .sun_escape import SunEscape
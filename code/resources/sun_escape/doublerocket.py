@@ -2,6 +2,8 @@ from pygame.sprite import Sprite
 from numba import njit
 import numpy as np
 
+from ..mask_cache import cached_mask
+
 @njit
 def calculate_new_position(position, moving_right, moving_left, moving_up, moving_down, speed, dt):
     """Calculate the new position based on movement flags and elapsed time."""
@@ -80,7 +82,7 @@ class Doublerocket(Sprite):
 
         #Start with the doublerocket pointing right at the right of the screen
         self.image = self.right_image
-        self.mask = self.pg.mask.from_surface(self.image)
+        self.mask = cached_mask(self.image)
         self.rect = self.right_image_rect
         self.position = np.array([0, self.screen_rect.height/2], dtype=np.float32)
 
@@ -114,7 +116,7 @@ class Doublerocket(Sprite):
             
             self.rect.x, self.rect.y = new_rect_x, new_rect_y
 
-            self.mask = self.pg.mask.from_surface(self.image)
+            self.mask = cached_mask(self.image)
             
             # Update all image rects
             for img_rect in [self.right_image_rect, self.left_image_rect, self.up_image_rect, self.down_image_rect]:
@@ -1,9 +1,11 @@
 import pygame
-from pygame.sprite import Sprite
+from pygame.sprite import Group
 import random
 
-class FuelTank(Sprite):
-    """A class to manage the fuel tank of the doublerocket."""
+from ..animation import FrameTimeline, Animator
+
+class FuelTankGroup(Group):
+    """A class to manage the fuel tanks of the doublerocket."""
 
     def __init__(self, game_instance):
         """Initializes the main attributes and loads the images."""
@@ -11,35 +13,56 @@ class FuelTank(Sprite):
         self.screen = game_instance.screen
         self.screen_rect = game_instance.screen_rect
         self.settings = game_instance.settings
+        self.pg = game_instance.pg
 
-        self.right_image = pygame.image.load('resources/images/fuel_tank_right.bmp')
-        self.right_image = pygame.transform.scale(self.right_image, (70, 50))
-        self.right_image_rect = self.right_image.get_rect()
+        self.left_image, self.right_image, self.rect = self.preload_images()
+
+        #Tanks turn left and right every second, masks are built once per image
+        self.animator = Animator(FrameTimeline(self.pg, (self.left_image, self.right_image), with_masks=True))
 
+    def preload_images(self):
+        """
+        Preloads images to prevent repeated slow disk access.
+        """
         self.left_image = pygame.image.load('resources/images/fuel_tank_left.bmp')
         self.left_image = pygame.transform.scale(self.left_image, (70, 50))
-        self.left_image_rect = self.left_image.get_rect()
+
+        self.right_image = pygame.image.load('resources/images/fuel_tank_right.bmp')
+        self.right_image = pygame.transform.scale(self.right_image, (70, 50))
+
+        #Both images have the same size, so a tank keeps one rect
+        self.rect = self.left_image.get_rect()
+
+        return self.left_image, self.right_image, self.rect
+
+    def create_fuel_tank(self):
+        """
+        Creates a fuel tank at the center of the screen, at a random height.
+        """
+        fuel_tank = self.pg.sprite.Sprite()
 
         #Let's start with the left image at the center of the screen
-        self.image = self.left_image
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.left_image_rect
-        self.rect.centerx = self.screen_rect.centerx
-        self.rect.y = random.randrange(70, self.screen_rect.height - 70)
-        self.right_image_rect.center = self.left_image_rect.center
+        fuel_tank.image = self.left_image
+        fuel_tank.mask = self.animator.timeline.masks[0]
+        fuel_tank.rect = self.rect.copy()
+        fuel_tank.rect.centerx = self.screen_rect.centerx
+        fuel_tank.rect.y = random.randrange(70, self.screen_rect.height - 70)
+
+        return fuel_tank
+
+    def add_internal(self, sprite, layer=None):
+        """Puts the tank in step with the fuel countdown when it joins the group."""
+        super().add_internal(sprite, layer)
+        self.animator.start(sprite, 0)
+
+    def remove_internal(self, sprite):
+        """Stops the tank's animation when it leaves the group (remove, kill or empty)."""
+        super().remove_internal(sprite)
+        self.animator.stop(sprite)
 
     def update(self):
-        """Updates the image"""
-        if self.settings.fuel_counter % 2 == 0:
-            self.image = self.left_image
-            self.rect = self.left_image_rect
-            self.mask = pygame.mask.from_surface(self.image)
-        elif self.settings.fuel_counter % 2 == 1:
-            self.image = self.right_image
-            self.rect = self.right_image_rect
-            self.mask = pygame.mask.from_surface(self.image)
-        
-        self.right_image_rect.center = self.rect.center
-        self.left_image_rect.center = self.rect.center
-        
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
+        """Updates the images and draws the tanks."""
+        #The countdown goes down once a second, so its negation is a rising tick
+        self.animator.advance(-self.settings.fuel_counter)
+
+        self.draw(self.screen)
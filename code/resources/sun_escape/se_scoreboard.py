@@ -1,10 +1,8 @@
 import pygame
-from pygame.sprite import Group
 from pathlib import Path
 import json
 
 from resources.button import Button
-from resources.sun_escape.fuel_tank import FuelTank
 
 class ScoreBoard:
     """A class to report scoring information."""
@@ -29,6 +27,10 @@ class ScoreBoard:
         self.win_instruction_button.rect.midbottom = self.game_instance.screen_rect.midbottom
         self.win_instruction_button.rect.y = self.game_instance.screen_rect.height*3/4
 
+        #Icon for the backup fuel tanks left
+        self.fuel_tank_icon = pygame.image.load('resources/images/fuel_tank_left.bmp')
+        self.fuel_tank_icon = pygame.transform.scale(self.fuel_tank_icon, (70, 50))
+
     def draw_board(self):
         """Draws the buttons of the scoreboard."""
         #Button for level
@@ -41,12 +43,6 @@ class ScoreBoard:
         self.screen.blit(self.text_image, self.text_image_rect)
 
         #Fuel tanks left
-        self.backup_fuel_tanks = Group()
-        for fuel_tank_number in range(self.stats.backup_fuel_tank_left):
-            backup_fuel_tank = FuelTank(self.game_instance)
-            backup_fuel_tank.image = backup_fuel_tank.left_image
-            backup_fuel_tank.rect = backup_fuel_tank.left_image_rect
-            backup_fuel_tank.rect.x = fuel_tank_number * 40
-            backup_fuel_tank.rect.y = 0
-            self.backup_fuel_tanks.add(backup_fuel_tank)
-            self.backup_fuel_tanks.draw(self.screen)
\ No newline at end of file
+        self.screen.blits(
+            [(self.fuel_tank_icon, (fuel_tank_number * 40, 0)) for fuel_tank_number in range(self.stats.backup_fuel_tank_left)],
+            doreturn=False)
\ No newline at end of file
@@ -9,8 +9,9 @@ from .se_settings import SESettings
 from .se_gamestats import GameStats
 from .sun import Sun
 from .wave import WaveGroup
-from .fuel_tank import FuelTank
+from .fuel_tank import FuelTankGroup
 from ..explosion import ExplosionGroup
+from ..collision_events import CollisionEvents
 from .se_scoreboard import ScoreBoard
 
 class SunEscape:
@@ -66,7 +67,7 @@ class SunEscape:
         self.doublerocket_waves = WaveGroup(self)
 
         #Fuel tanks
-        self.fuel_tanks = self.pg.sprite.Group()
+        self.fuel_tanks = FuelTankGroup(self)
 
         #Menu
         self.static_menu = SunEscapeStaticMenu(self)
@@ -78,6 +79,15 @@ class SunEscape:
         #Explosion animations
         self.explosions = ExplosionGroup(self)
 
+        #Preloaded sounds
+        self.explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
+
+        #What the collision queries found this frame, consumed in bulk once they are all done
+        self.collision_events = CollisionEvents((
+            "doublerocket_sun", "doublerocket_fuel_tank", "wave_doublerocket", "wave_fuel_tank",
+            "doublerocket_wave_black_hole", "doublerocket_wave_wave",
+            ))
+
         #Scoreboard
         self.sb = ScoreBoard(self)
 
@@ -214,6 +224,8 @@ class SunEscape:
 
             self._update_waves()
 
+            self._check_collisions()
+
             #Draw explosions
             self.explosions.draw(self.screen)
             self.explosions.update()
@@ -248,7 +260,6 @@ class SunEscape:
         """Takes care of all methods concerning the doublerocket in the game"""
         self.doublerocket.update(self.dt)
         #self._check_doublerocket_fuel_level()
-        self._check_doublerocket_sun_collisions()
         self.doublerocket.blit_doublerocket()
 
     def _check_doublerocket_fuel_level(self):
@@ -259,13 +270,6 @@ class SunEscape:
             self._remove_backup_fuel_tank()
             self.settings.doublerocket_fuel = 50
 
-    def _check_doublerocket_sun_collisions(self):
-        """Removes a backup fuel tank in case the rocket hits the star."""
-        if self.doublerocket.rect.colliderect(self.sun):
-            game_over_thread = threading.Thread(target=self._manage_game_over)
-            game_over_thread.daemon = True
-            game_over_thread.start()
-
     def _update_sun(self): 
         """Takes care of all methods concerning the sun in the game"""
         self.sun.update(self.dt)
@@ -286,129 +290,109 @@ class SunEscape:
             self.fuel_tanks.update()
         except AttributeError:
             pass
-        else:
-            self._check_doublerocket_fuel_tank_collisions()
-
-    def _check_doublerocket_fuel_tank_collisions(self):
-        """Refills the doublerocket fuel tank."""
-        fuel_tank = self.pg.sprite.spritecollideany(self.doublerocket, self.fuel_tanks)
-        if fuel_tank:
-            self.fuel_tanks.remove(fuel_tank)
-            self.settings.doublerocket_fuel += 25
 
     def _update_waves(self):
         """Takes care of all methods concerning the waves in the game"""
         if self._check_level():
             self._generate_wave()
-        for wave in self.waves:
-            self.waves.update(self.dt, wave)
-            if wave.point_0[0] < 0:
-                self.waves.remove(wave)
-            else:
-                self.waves._draw(wave)
-
-            try:
-                self._check_wave_doublerocket_collisions(wave)
-            except UnboundLocalError:
-                pass
-
-            try:
-                self._check_wave_fuel_tank_collisions(wave)
-            except UnboundLocalError:
-                pass
-        
-        for dr_wave in self.doublerocket_waves:
-            self.doublerocket_waves.update(self.dt, dr_wave)
-            if dr_wave.point_0[0] > self.screen_rect.width:
-                self.doublerocket_waves.remove(dr_wave)
-            else:
-                self.doublerocket_waves._draw(dr_wave)
-
-            try:
-                self._check_wave_fuel_tank_collisions(dr_wave)
-            except UnboundLocalError:
-                pass
-
-            try:
-                self._check_doublerocket_waves_black_hole_collisions(dr_wave)
-            except UnboundLocalError:
-                pass
-
-            try:
-                self._check_doublerocket_waves_other_waves_collisions(dr_wave)
-            except UnboundLocalError:
-                pass
-
-    def _check_wave_doublerocket_collisions(self, wave):
-        """Manages collisions between the doublerocket and a wave."""
-        #bezier_points = wave._bezier_curve()
-        wave_points = wave.points.astype(np.int32).tolist()
-        num_points = len(wave_points)
-        for i in range(0, num_points - 1, 2):
-            point1 = wave_points[i]
-            point2 = wave_points[i + 1]
-            if self.doublerocket.rect.clipline((point1[0], point1[1]), (point2[0], point2[1])):
-                clipped_line = True  # Collision detected
-                break
-        if (clipped_line and self.settings.collision_counter == self.settings.collision_pause):
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            explosion = self.explosions.create_explosion(self.doublerocket.rect.center)
-            self.explosions.add(explosion)
+
+        #Each group moves all its waves in one kernel call, then drops the ones that left the screen
+        for waves in (self.waves, self.doublerocket_waves):
+            waves.update(self.dt)
+            waves.retire_expired()
+            waves.draw(self.screen)
+
+    def _check_collisions(self):
+        """Runs every collision query of the frame, then resolves what they found in one go."""
+        self._detect_collisions()
+        self._resolve_collisions()
+
+    def _detect_collisions(self):
+        """Runs every collision query and records what they found as events, without acting on them."""
+        events = self.collision_events
+        events.clear()
+
+        if self.doublerocket.rect.colliderect(self.sun):
+            events.add("doublerocket_sun", [self.doublerocket], [self.sun])
+
+        fuel_tanks = self.pg.sprite.spritecollide(self.doublerocket, self.fuel_tanks, False)
+        events.add("doublerocket_fuel_tank", [self.doublerocket] * len(fuel_tanks), fuel_tanks)
+
+        #Every wave is tested against the doublerocket, the black hole and the fuel tanks in one call per group
+        fuel_tanks = self.fuel_tanks.sprites()
+        targets = [self.doublerocket.rect, self.sun.rect] + [fuel_tank.rect for fuel_tank in fuel_tanks]
+        waves, hits = self.waves.rect_hits([(rect.left, rect.top, rect.right, rect.bottom) for rect in targets])
+
+        doublerocket_waves = [waves[i] for i in np.flatnonzero(hits[:, 0]).tolist()]
+        events.add("wave_doublerocket", doublerocket_waves, [self.doublerocket] * len(doublerocket_waves))
+        self._add_fuel_tank_events(waves, hits[:, 2:], fuel_tanks)
+
+        dr_waves, hits = self.doublerocket_waves.rect_hits([(rect.left, rect.top, rect.right, rect.bottom) for rect in targets])
+
+        black_hole_waves = [dr_waves[i] for i in np.flatnonzero(hits[:, 1]).tolist()]
+        events.add("doublerocket_wave_black_hole", black_hole_waves, [self.sun] * len(black_hole_waves))
+        self._add_fuel_tank_events(dr_waves, hits[:, 2:], fuel_tanks)
+
+        #Doublerocket waves also stop where their path crosses the path of a star's wave
+        dr_waves, waves, crossings = self.doublerocket_waves.wave_crossings(self.waves)
+        dr_wave_indices, wave_indices = np.nonzero(crossings)
+        events.add("doublerocket_wave_wave", [dr_waves[i] for i in dr_wave_indices.tolist()], [waves[i] for i in wave_indices.tolist()])
+
+    def _add_fuel_tank_events(self, waves, hits, fuel_tanks):
+        """Records a wave-fuel tank event for each hit flag set in a (waves, fuel tanks) array."""
+        wave_indices, fuel_tank_indices = np.nonzero(hits)
+        self.collision_events.add(
+            "wave_fuel_tank", [waves[i] for i in wave_indices.tolist()], [fuel_tanks[i] for i in fuel_tank_indices.tolist()]
+            )
+
+    def _resolve_collisions(self):
+        """Applies the events of the frame in bulk, so each side effect happens once."""
+        events = self.collision_events
+        if not events:
+            return
+
+        explosion_centers = []
+
+        #Flying into the star ends the game
+        if events.of("doublerocket_sun")[0]:
+            game_over_thread = threading.Thread(target=self._manage_game_over)
+            game_over_thread.daemon = True
+            game_over_thread.start()
+
+        #Refill the doublerocket fuel tank with every tank it reached
+        picked_up_fuel_tanks = list(dict.fromkeys(events.of("doublerocket_fuel_tank")[1]))
+        self.fuel_tanks.remove(*picked_up_fuel_tanks)
+        self.settings.doublerocket_fuel += 25 * len(picked_up_fuel_tanks)
+
+        #However many waves hit the doublerocket, it loses a single backup fuel tank
+        if events.of("wave_doublerocket")[0] and self.settings.collision_counter == self.settings.collision_pause:
+            explosion_centers.append(self.doublerocket.rect.center)
             self._remove_backup_fuel_tank()
             self.settings.collision_counter = 0
 
-    def _check_wave_fuel_tank_collisions(self, wave):
-        """Removes the spawned fuel tank if hit by the wave."""
-        clipped_line = False
-        #bezier_points = wave._bezier_curve()
-        wave_points = wave.points.astype(np.int32).tolist()
-        num_points = len(wave_points)
-        for i in range(0, num_points - 1, 2):
-            point1 = wave_points[i]
-            point2 = wave_points[i + 1]
-            for fuel_tank in self.fuel_tanks:
-                if fuel_tank.rect.clipline(point1, point2):
-                    clipped_line = True  # Collision detected
-                    break
-        if clipped_line:
-            explosion_sound = self.pg.mixer.Sound('resources/sounds/explosion_sound.mp3')
-            self.pg.mixer.Sound.play(explosion_sound)
-            explosion = self.explosions.create_explosion(fuel_tank.rect.center)
-            self.explosions.add(explosion)
-            self.fuel_tanks.remove(fuel_tank)
-
-    def _check_doublerocket_waves_black_hole_collisions(self, dr_wave):
-        """Reduces the life of the black hole if hit by a doublerocket wave."""
-        wave_points = dr_wave.points.astype(np.int32).tolist()
-        num_points = len(wave_points)
-        for i in range(0, num_points - 1, 2):
-            point1 = wave_points[i]
-            point2 = wave_points[i + 1]
-            if self.sun.rect.clipline((point1[0], point1[1]), (point2[0], point2[1])):
-                clipped_line = True  # Collision detected
-                break
-        if clipped_line:
+        #Waves blow up the fuel tanks the doublerocket did not reach first
+        picked_up = set(picked_up_fuel_tanks)
+        hit_fuel_tanks = [fuel_tank for fuel_tank in dict.fromkeys(events.of("wave_fuel_tank")[1]) if fuel_tank not in picked_up]
+        self.fuel_tanks.remove(*hit_fuel_tanks)
+        explosion_centers.extend(fuel_tank.rect.center for fuel_tank in hit_fuel_tanks)
+
+        #Each doublerocket wave reaching the black hole hurts it once
+        black_hole_waves = list(dict.fromkeys(events.of("doublerocket_wave_black_hole")[0]))
+        for _ in black_hole_waves:
             self.sun.black_hole_hit()
             self.settings.black_hole_life -= 50
-            self.doublerocket_waves.remove(dr_wave)
             if self.settings.black_hole_life == 0:
                 game_win_thread = threading.Thread(target=self._manage_game_win)
                 game_win_thread.daemon = True
                 game_win_thread.start()
 
-    def _check_doublerocket_waves_other_waves_collisions(self, dr_wave):
-        wave_points = dr_wave.points.astype(np.int32).tolist()
-        num_points = len(wave_points)
-        for i in range(0, num_points - 1, 2):
-            point1 = wave_points[i]
-            point2 = wave_points[i + 1]
-            for wave in self.waves:
-                if wave.rect.clipline((point1[0], point1[1]), (point2[0], point2[1])):
-                    clipped_line = True  # Collision detected
-                    break
-        if clipped_line:
-            self.doublerocket_waves.remove(dr_wave)
+        #Doublerocket waves stop on the black hole and on the star's waves
+        self.doublerocket_waves.remove(*black_hole_waves, *events.of("doublerocket_wave_wave")[0])
+
+        #One explosion per object destroyed, but a single sound for the whole frame
+        if explosion_centers:
+            self.explosions.add(*[self.explosions.create_explosion(center) for center in explosion_centers])
+            self.explosion_sound.play()
 
     def _remove_backup_fuel_tank(self):
         """Removes a backup fuel tank"""
@@ -422,18 +406,18 @@ class SunEscape:
         """Makes a fuel tank spawn when generating a new wave"""
         if self.settings.fuel_counter == 0:
             if self.stats.level <= 3:
-                fuel_tank = FuelTank(self)
+                fuel_tank = self.fuel_tanks.create_fuel_tank()
                 fuel_tank.rect.centerx = self.screen_rect.centerx
                 self.fuel_tanks.add(fuel_tank)
             elif self.stats.level == 4:
                 #Make a fuel tank spawn randomly at the left or right side of the screen
                 number = random.randrange(1, 3)
                 if number == 1:
-                    fuel_tank = FuelTank(self)
+                    fuel_tank = self.fuel_tanks.create_fuel_tank()
                     fuel_tank.rect.centerx = 70
                     self.fuel_tanks.add(fuel_tank)
                 elif number == 2:
-                    fuel_tank = FuelTank(self)
+                    fuel_tank = self.fuel_tanks.create_fuel_tank()
                     fuel_tank.rect.centerx = self.screen_rect.centerx
                     self.fuel_tanks.add(fuel_tank)
             
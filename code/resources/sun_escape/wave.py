@@ -6,26 +6,19 @@ import math
 from numba import njit
 import numpy as np
 
-@njit
-def calculate_sin_points(width, centerx, amplitude, frequency, phase, starting_height):
-    """Calculate the initial points of the sine wave."""
-    num_points = round(centerx - width)
-    points = np.empty((num_points, 2), dtype=np.float32)
-    x = np.linspace(width, width + num_points, num_points)
-    y = starting_height + np.sin(x * frequency + phase) * amplitude
-    points = np.stack((x, y), axis=1)
+from ..projectile import segment_hits_box
+from ..spatial_hash import calculate_cell_range, build_spatial_hash
 
-    return points
+@njit
+def calculate_bounding_box(points):
+    """Returns the (left, top, right, bottom) box around all the points."""
+    left, top = points[0, 0], points[0, 1]
+    right, bottom = left, top
+    for i in range(1, points.shape[0]):
+        left, right = min(left, points[i, 0]), max(right, points[i, 0])
+        top, bottom = min(top, points[i, 1]), max(bottom, points[i, 1])
 
-@njit	
-def update_sin_points(points, speed, frequency, phase, starting_height, amplitude):
-    """Update points for the sine wave path with optimized calculations."""
-    num_points = points.shape[0]
-    for i in range(num_points):
-        # Move left by the speed
-        points[i, 0] -=  speed
-        # Update the y-coordinate based on sine function
-        points[i, 1] = starting_height + np.sin(points[i, 0] * frequency + phase) * amplitude
+    return left, top, right, bottom
 
 @njit
 def cubic_bezier(t, p0, p1, p2, p3):
@@ -48,24 +41,182 @@ def bezier_curve_points(p0, control_1, control_2, p3, num_points=101):
     return points
 
 @njit
-def update_wave_points(points, speed):
-    """Move each point in the wave to the left by a given speed."""
-    points[:, 0] -= speed
+def calculate_wave_point(points, sine, curves, i, k):
+    """
+    Returns point k of wave i. Sine waves keep no points, theirs is evaluated from the curve
+    (x of the first point, x step, phase, frequency, amplitude, starting height).
+    """
+    if not sine[i]:
+        return points[i, k, 0], points[i, k, 1]
+    x = curves[i, 0] + k * curves[i, 1]
+
+    return x, curves[i, 5] + math.sin(x * curves[i, 3] + curves[i, 2]) * curves[i, 4]
+
+@njit
+def calculate_wave_points(points, point_counts, sine, curves, i):
+    """Returns the points of wave i as an array, evaluating them for a sine wave."""
+    wave_points = np.empty((point_counts[i], 2), dtype=np.float64)
+    for k in range(point_counts[i]):
+        wave_points[k, 0], wave_points[k, 1] = calculate_wave_point(points, sine, curves, i, k)
+
+    return wave_points
+
+@njit
+def update_all_wave_points(points, point_counts, count, directions, sine, curves, speed, boxes):
+    """
+    Moves the first count waves of a store by speed along their direction, in one pass.
+    A sine wave only shifts its first x and its phase, whatever its length; the others move every point.
+    Writes the new (left, top, right, bottom) box of each wave into boxes.
+    """
+    for i in range(count):
+        step = directions[i] * speed
+        if sine[i]:
+            curves[i, 0] += step
+            curves[i, 2] += curves[i, 3]
+            boxes[i, 0], boxes[i, 2] = curves[i, 0], curves[i, 0] + (point_counts[i] - 1) * curves[i, 1]
+            continue
+
+        left, top, right, bottom = np.inf, np.inf, -np.inf, -np.inf
+        for k in range(point_counts[i]):
+            points[i, k, 0] += step
+            left, right = min(left, points[i, k, 0]), max(right, points[i, k, 0])
+            top, bottom = min(top, points[i, k, 1]), max(bottom, points[i, k, 1])
+        boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3] = left, top, right, bottom
+
+@njit
+def calculate_wave_hits(points, point_counts, sine, curves, rects, near):
+    """
+    Tests every segment of every wave against every rect (left, top, right, bottom).
+    Wave i is points[i, :point_counts[i]] in the padded point buffer of a store, or its curve for a sine wave,
+    where only the segments within the x range of the rect are evaluated.
+    Only the (wave, rect) pairs flagged in near get segment tests.
+    Returns a (waves, rects) array of hit flags. Empty rects are never hit, like with Rect.clipline.
+    """
+    num_waves = near.shape[0]
+    hits = np.zeros((num_waves, rects.shape[0]), dtype=np.bool_)
+    for i in range(num_waves):
+        for j in range(rects.shape[0]):
+            left, top, right, bottom = rects[j, 0], rects[j, 1], rects[j, 2], rects[j, 3]
+            if not near[i, j] or right <= left or bottom <= top:
+                continue
+            first, last = 0, point_counts[i] - 2
+            if sine[i]:
+                #One segment of margin on each side keeps rounding from skipping the edge segments
+                first = max(int((left - curves[i, 0]) // curves[i, 1]) - 1, first)
+                last = min(int((right - curves[i, 0]) // curves[i, 1]) + 1, last)
+            x1, y1 = calculate_wave_point(points, sine, curves, i, first)
+            for k in range(first, last + 1):
+                x0, y0 = x1, y1
+                x1, y1 = calculate_wave_point(points, sine, curves, i, k + 1)
+                if segment_hits_box(x0, y0, x1 - x0, y1 - y0, left, top, right, bottom):
+                    hits[i, j] = True
+                    break
+
+    return hits
+
+@njit
+def calculate_orientation(ax, ay, bx, by, cx, cy):
+    """Returns 1 if a, b, c turn one way, -1 if they turn the other, 0 if they are aligned."""
+    value = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    if value > 0:
+        return 1
+    if value < 0:
+        return -1
+    return 0
+
+@njit
+def segments_intersect(x0, y0, x1, y1, x2, y2, x3, y3):
+    """Tells whether the segments (x0, y0)-(x1, y1) and (x2, y2)-(x3, y3) share a point."""
+    o1 = calculate_orientation(x0, y0, x1, y1, x2, y2)
+    o2 = calculate_orientation(x0, y0, x1, y1, x3, y3)
+    o3 = calculate_orientation(x2, y2, x3, y3, x0, y0)
+    o4 = calculate_orientation(x2, y2, x3, y3, x1, y1)
+    if o1 != o2 and o3 != o4:
+        return True
+
+    #Aligned segments only meet if one of them has an end on the other
+    for ox, oy, ax, ay, bx, by, orientation in (
+        (x2, y2, x0, y0, x1, y1, o1), (x3, y3, x0, y0, x1, y1, o2),
+        (x0, y0, x2, y2, x3, y3, o3), (x1, y1, x2, y2, x3, y3, o4),
+        ):
+        if orientation == 0 and min(ax, bx) <= ox <= max(ax, bx) and min(ay, by) <= oy <= max(ay, by):
+            return True
+
+    return False
 
 @njit
-def update_right_points(points, speed, frequency, phase, starting_height, amplitude):
-    """Update points for the sine wave path with optimized calculations."""
-    num_points = points.shape[0]
-    for i in range(num_points):
-        # Move left by the speed
-        points[i, 0] += speed
-        # Update the y-coordinate based on sine function
-        points[i, 1] = starting_height + math.sin(points[i, 0] * frequency + phase) * amplitude
+def calculate_segment_boxes(points, point_counts, sine, curves, rows):
+    """
+    Splits the given waves of a store into their segments.
+    Returns each segment as (x0, y0, x1, y1), the position of its wave in rows,
+    and its (left, top, right, bottom) box in whole pixels.
+    """
+    num_segments = 0
+    for i in range(rows.shape[0]):
+        num_segments += point_counts[rows[i]] - 1
+    segments = np.empty((num_segments, 4), dtype=np.float64)
+    owners = np.empty(num_segments, dtype=np.int64)
+    boxes = np.empty((num_segments, 4), dtype=np.int64)
+    segment = 0
+    for i in range(rows.shape[0]):
+        row = rows[i]
+        x1, y1 = calculate_wave_point(points, sine, curves, row, 0)
+        for k in range(point_counts[row] - 1):
+            x0, y0 = x1, y1
+            x1, y1 = calculate_wave_point(points, sine, curves, row, k + 1)
+            segments[segment, 0], segments[segment, 1], segments[segment, 2], segments[segment, 3] = x0, y0, x1, y1
+            owners[segment] = i
+            boxes[segment, 0] = np.floor(min(x0, x1))
+            boxes[segment, 1] = np.floor(min(y0, y1))
+            boxes[segment, 2] = np.floor(max(x0, x1)) + 1
+            boxes[segment, 3] = np.floor(max(y0, y1)) + 1
+            segment += 1
+
+    return segments, owners, boxes
+
+@njit
+def calculate_wave_crossings(segments, owners, boxes, other_segments, other_owners, other_boxes,
+                             cell_starts, entries, cell_size, columns, rows, num_waves, num_other_waves):
+    """
+    Walks the grid cells each segment touches and runs the exact segment test against the other
+    segments bucketed there, skipping the pairs of waves already known to cross.
+    Returns a (waves, other waves) array of flags, set where two paths cross.
+    """
+    hits = np.zeros((num_waves, num_other_waves), dtype=np.bool_)
+    for s in range(segments.shape[0]):
+        i = owners[s]
+        box = boxes[s]
+        first_column, first_row, last_column, last_row = calculate_cell_range(box, cell_size, columns, rows)
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell = row * columns + column
+                for k in range(cell_starts[cell], cell_starts[cell + 1]):
+                    o = entries[k]
+                    j = other_owners[o]
+                    if hits[i, j]:
+                        continue
+                    other = other_boxes[o]
+                    if not (box[0] <= other[2] and box[2] >= other[0] and box[1] <= other[3] and box[3] >= other[1]):
+                        continue
+                    if segments_intersect(
+                        segments[s, 0], segments[s, 1], segments[s, 2], segments[s, 3],
+                        other_segments[o, 0], other_segments[o, 1], other_segments[o, 2], other_segments[o, 3],
+                        ):
+                        hits[i, j] = True
+
+    return hits
 
 class WaveGroup(Group):
     """
-    A class to manage waves
+    A class to manage waves.
+    Every wave is a row of one store, so the whole group moves in a single kernel call.
+    Bezier waves keep their points in a padded buffer, sine waves only keep their curve
+    and are evaluated where they are drawn or tested.
     """
+    #Rows and points per row the store starts with, both grow on demand
+    initial_capacity = 8
+    initial_width = 128
+
     def __init__(self, game_instance):
         super().__init__()
         self.game_instance = game_instance
@@ -74,6 +225,114 @@ class WaveGroup(Group):
         self.screen_rect = game_instance.screen_rect
         self.settings = game_instance.settings
 
+        #Grid used to bucket wave segments when two groups are tested against each other
+        self.cell_size = 32
+        self.columns = -(-self.screen_rect.width // self.cell_size)
+        self.rows = -(-self.screen_rect.height // self.cell_size)
+
+        self._reset_store(self.initial_capacity, self.initial_width)
+
+    def _reset_store(self, capacity, width):
+        """
+        Allocates the wave columns, all rows empty.
+        """
+        self.capacity = capacity
+        self.width = width
+        self.count = 0
+        self.points = np.zeros((capacity, width, 2), dtype=np.float64)
+        self.point_counts = np.zeros(capacity, dtype=np.int64)
+        self.boxes = np.zeros((capacity, 4), dtype=np.float64)
+        self.directions = np.zeros(capacity, dtype=np.float64)
+        self.sine = np.zeros(capacity, dtype=np.bool_)
+        #x of the first point, x step, phase, frequency, amplitude and starting height of the sine waves
+        self.curves = np.zeros((capacity, 6), dtype=np.float64)
+        self.row_sprites = [None] * capacity
+
+    def _grow_store(self):
+        """
+        Doubles the wave columns when every row is taken.
+        """
+        extra = self.capacity
+        self.capacity *= 2
+
+        self.points = np.concatenate((self.points, np.zeros((extra, self.width, 2), dtype=np.float64)))
+        self.point_counts = np.concatenate((self.point_counts, np.zeros(extra, dtype=np.int64)))
+        self.boxes = np.concatenate((self.boxes, np.zeros((extra, 4), dtype=np.float64)))
+        self.directions = np.concatenate((self.directions, np.zeros(extra, dtype=np.float64)))
+        self.sine = np.concatenate((self.sine, np.zeros(extra, dtype=np.bool_)))
+        self.curves = np.concatenate((self.curves, np.zeros((extra, 6), dtype=np.float64)))
+        self.row_sprites.extend([None] * extra)
+
+    def _widen_store(self, width):
+        """
+        Pads every row of the point buffer up to width points, for a bezier wave longer than the others.
+        """
+        extra = width - self.width
+        self.width = width
+        self.points = np.concatenate((self.points, np.zeros((self.capacity, extra, 2), dtype=np.float64)), axis=1)
+
+    def _columns(self):
+        """
+        Returns the per-row columns that move together on a swap-remove.
+        """
+        return (self.points, self.point_counts, self.boxes, self.directions, self.sine, self.curves)
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Copies a joining wave into a new row of the store: its curve for a sine wave, its points otherwise.
+        """
+        super().add_internal(sprite, layer)
+
+        if self.count == self.capacity:
+            self._grow_store()
+
+        index = sprite.index = self.count
+        self.count += 1
+        self.row_sprites[index] = sprite
+        self.directions[index] = 1 if sprite.form == "right" else -1
+
+        #Sine waves move along their curve, bezier waves slide to the left and keep their shape
+        if sprite.form in ("sin", "right"):
+            self.sine[index] = True
+            self.point_counts[index] = sprite.num_points
+            self.curves[index] = (
+                sprite.first_x, sprite.step, sprite.phase, sprite.frequency, sprite.amplitude, sprite.starting_height
+                )
+            self.boxes[index] = (
+                sprite.first_x, sprite.starting_height - sprite.amplitude,
+                sprite.first_x + (sprite.num_points - 1) * sprite.step, sprite.starting_height + sprite.amplitude,
+                )
+            return
+
+        num_points = len(sprite.points)
+        if num_points > self.width:
+            self._widen_store(num_points)
+        self.sine[index] = False
+        self.points[index, :num_points] = sprite.points
+        self.point_counts[index] = num_points
+        self.boxes[index] = calculate_bounding_box(sprite.points)
+
+        #From now on the store owns the wave's points
+        del sprite.points
+
+    def remove_internal(self, sprite):
+        """
+        Swaps the last row into the removed wave's row in O(1) (remove, kill or empty).
+        """
+        super().remove_internal(sprite)
+
+        last = self.count - 1
+        index = sprite.index
+        if index != last:
+            for column in self._columns():
+                column[index] = column[last]
+            moved_wave = self.row_sprites[last]
+            moved_wave.index = index
+            self.row_sprites[index] = moved_wave
+
+        self.row_sprites[last] = None
+        self.count = last
+
     def _calculate_control_point(self, p1, p2):
         return [(p1[0] + p2[0]) / 2, p1[1] + random.randrange(-50, 50)]
     
@@ -89,36 +348,15 @@ class WaveGroup(Group):
             int(self.screen_rect.height / 2) - 200,
             int(self.screen_rect.height / 2) + 200
         )
-        sin_wave.points = calculate_sin_points(
-            self.screen_rect.width - 450, self.game_instance.sun.rect.centerx,
-            sin_wave.amplitude, sin_wave.frequency, sin_wave.phase, sin_wave.starting_height
-        )
-        sin_wave.point_0 = sin_wave.points[-1]
-        sin_wave.left_point = sin_wave.points[0]
-        sin_wave.right_point = sin_wave.point_0
-        sin_wave.rect = self.pg.Rect(0, 0, 0, 0)
+        self._set_span(sin_wave, self.screen_rect.width - 450, self.game_instance.sun.rect.centerx)
 
         return sin_wave
-    
-    def update_sin_wave(self, dt, sin_wave):
-        """
-        Update the sine wave's points and position.
-        """
-        sin_wave.phase += sin_wave.frequency  # Increment phase
-        speed = self.settings.wave_speed * dt
-
-        # Use Numba-optimized update function
-        update_sin_points(
-            sin_wave.points, speed, sin_wave.frequency, sin_wave.phase, sin_wave.starting_height, sin_wave.amplitude
-        )
 
-        # Update position of the sin_wave's bounding rectangle
-        sin_wave.left_point = sin_wave.points[0]
-        sin_wave.right_point = sin_wave.points[-1]
-        sin_wave.rect.x = int(sin_wave.points[0, 0])
-        sin_wave.rect.y = int(sin_wave.points[0, 1])
-        sin_wave.rect.width = int(abs(sin_wave.points[0, 0] - sin_wave.points[-1, 0]))
-        sin_wave.rect.height = int(abs(sin_wave.points[0, 1] - sin_wave.points[-1, 1]))
+    def _set_span(self, wave, left, right):
+        """Spreads the points of a sine wave about a pixel apart from left to right."""
+        wave.num_points = round(right - left)
+        wave.first_x = float(left)
+        wave.step = wave.num_points / (wave.num_points - 1)
 
     def create_long_wave(self, colour):
         """Create a new wave and add it to the group."""
@@ -138,24 +376,9 @@ class WaveGroup(Group):
             np.array(long_wave.point_0), np.array(long_wave.control_1),
             np.array(long_wave.control_2), np.array(long_wave.point_3)
         )
-        long_wave.left_point = long_wave.points[0]
-        long_wave.right_point = long_wave.point_0
-        long_wave.rect = self.pg.Rect(0, 0, 0, 0)
 
         return long_wave
     
-    def update_bezier_wave(self, dt, wave):
-        """Update the wave position based on elapsed time."""
-        speed = self.settings.wave_speed * dt
-        update_wave_points(wave.points, speed)
-        wave.left_point = wave.points[0]
-        wave.right_point = wave.points[-1]
-        wave.rect.x = int(wave.points[0, 0])
-        wave.rect.y = int(wave.points[0, 1])
-        wave.rect.width = int(abs(wave.points[0, 0] - wave.points[-1, 0])
-        )
-        wave.rect.height = int(abs(wave.points[0, 1] - wave.points[-1, 1]))
-
     def create_up_wave(self, colour):
         """Create a new wave and add it to the group."""
         up_wave = self.pg.sprite.Sprite()
@@ -176,11 +399,6 @@ class WaveGroup(Group):
             np.array(up_wave.control_2), np.array(up_wave.point_3)
         )
 
-        up_wave.left_point = up_wave.points[0]
-        up_wave.right_point = up_wave.point_0
-
-        up_wave.rect = self.pg.Rect(0, 0, 0, 0)
-
         return up_wave
     
     def create_down_wave(self, colour):
@@ -203,11 +421,6 @@ class WaveGroup(Group):
             np.array(down_wave.control_2), np.array(down_wave.point_3)
         )
 
-        down_wave.left_point = down_wave.points[0]
-        down_wave.right_point = down_wave.point_0
-
-        down_wave.rect = self.pg.Rect(0, 0, 0, 0)
-
         return down_wave
     
     def create_right_wave(self, colour):
@@ -219,322 +432,84 @@ class WaveGroup(Group):
         right_wave.frequency = 0.10
         right_wave.phase = 0
         right_wave.starting_height = float(self.game_instance.doublerocket.rect.centery)
-        right_wave.points = calculate_sin_points(
-            self.game_instance.doublerocket.rect.centerx, self.game_instance.doublerocket.rect.centerx + 100,
-            right_wave.amplitude, right_wave.frequency, right_wave.phase, right_wave.starting_height
-        )
-        right_wave.point_0 = right_wave.points[-1]
-        right_wave.left_point = right_wave.points[0]
-        right_wave.right_point = right_wave.point_0
-        right_wave.rect = self.pg.Rect(0, 0, 0, 0)
+        self._set_span(right_wave, self.game_instance.doublerocket.rect.centerx, self.game_instance.doublerocket.rect.centerx + 100)
 
         return right_wave
     
-    def update_right_wave(self, dt, right_wave):
-        """Update the sine wave's points and position."""
-        for right_wave in self.sprites():
-            right_wave.phase += right_wave.frequency  # Increment phase
-            speed = self.settings.wave_speed * dt
-
-            # Use Numba-optimized update function
-            update_right_points(
-                right_wave.points, speed, right_wave.frequency, right_wave.phase, right_wave.starting_height, right_wave.amplitude
-            )
-
-            # Update position of the right_wave's bounding rectangle
-            right_wave.left_point = right_wave.points[0]
-            right_wave.right_point = right_wave.points[-1]
-    
-    def update(self, dt, wave):
+    def update(self, dt):
         """
-        Update the wave position based on elapsed time.
+        Moves every wave of the group, in one kernel call.
         """
-        if wave.form == "sin":
-            self.update_sin_wave(dt, wave)
-        elif wave.form == "long" or wave.form == "up" or wave.form == "down":
-            self.update_bezier_wave(dt, wave)
-        elif wave.form == "right":
-            self.update_right_wave(dt, wave)
-    
-    def _draw(self, wave):
+        update_all_wave_points(
+            self.points, self.point_counts, self.count, self.directions, self.sine, self.curves,
+            self.settings.wave_speed * dt, self.boxes
+        )
+
+    def retire_expired(self):
         """
-        Draw the waves
+        Removes the waves that left the screen: the whole path of a wave moving left is
+        past the left edge, the front of a wave moving right is past the right edge.
         """
-        self.pg.draw.lines(self.screen, wave.colour, False, wave.points.astype(np.int32).tolist(), 3)
+        rights = self.boxes[:self.count, 2]
+        expired = np.where(self.directions[:self.count] < 0, rights < 0, rights > self.screen_rect.width)
+        self.remove(*[self.row_sprites[i] for i in np.flatnonzero(expired).tolist()])
 
-class SinWaveGroup(Group):
-    """A class to manage a single wave emitted which changes during its path."""
-    def __init__(self, game_instance):
-        super().__init__()
-        self.game_instance = game_instance
-        self.pg = game_instance.pg
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.settings = game_instance.settings
+    def rect_hits(self, rects):
+        """
+        Tests the whole path of every wave against rects given as (left, top, right, bottom), in one call.
+        Returns the waves and a (waves, rects) array of hit flags.
+        """
+        waves = self.row_sprites[:self.count]
+        rects = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
 
-    def create_sinwave(self, colour):
-        """Create a new wave and add it to the group."""
-        wave = self.pg.sprites.Sprite()
-        wave.colour = colour
-        wave.amplitude = float(random.randrange(20, 140))
-        wave.frequency = 0.10
-        wave.phase = 0
-        wave.starting_height = random.randrange(
-            int(self.screen_rect.height / 2) - 200,
-            int(self.screen_rect.height / 2) + 200
-        )
-        wave.points = calculate_sin_points(
-            self.screen_rect.width - 450, self.game_instance.sun.rect.centerx,
-            wave.amplitude, wave.frequency, wave.phase, wave.starting_height
-        )
-        wave.point_0 = wave.points[-1]
-        wave.left_point = wave.points[0]
-        wave.right_point = wave.point_0
-        wave.rect = self.pg.Rect(0, 0, 0, 0)
+        #Broadphase: only the rects overlapping a wave's bounding box are worth a segment test
+        near = self._overlaps(self.boxes[:self.count], rects)
+        if not near.any():
+            return waves, near
 
-        return wave
+        return waves, calculate_wave_hits(self.points, self.point_counts, self.sine, self.curves, rects, near)
 
-    def update_sinwave(self, dt):
+    def wave_crossings(self, other):
         """
-        Update the sine wave's points and position.
+        Exact intersection between the path of every wave of the group and of every wave of another group.
+        The other group's segments are bucketed in a uniform grid, so a segment is only tested
+        against the few segments sharing its cells.
+        Returns the waves of both groups and a (waves, other waves) array of hit flags.
         """
-        for wave in self.sprites():
-            wave.phase += wave.frequency  # Increment phase
-            speed = self.settings.wave_speed * dt
-
-            # Use Numba-optimized update function
-            update_sinpoints(
-                wave.points, speed, wave.frequency, wave.phase, wave.starting_height, wave.amplitude
+        waves, other_waves = self.row_sprites[:self.count], other.row_sprites[:other.count]
+        hits = np.zeros((len(waves), len(other_waves)), dtype=np.bool_)
+
+        #Broadphase: waves whose bounding boxes meet no box of the other group are left out
+        near = self._overlaps(self.boxes[:self.count], other.boxes[:other.count])
+        if not near.any():
+            return waves, other_waves, hits
+        wave_indices = np.flatnonzero(near.any(axis=1))
+        other_indices = np.flatnonzero(near.any(axis=0))
+
+        segments, owners, boxes = calculate_segment_boxes(self.points, self.point_counts, self.sine, self.curves, wave_indices)
+        other_segments, other_owners, other_boxes = calculate_segment_boxes(
+            other.points, other.point_counts, other.sine, other.curves, other_indices
             )
 
-            # Update position of the wave's bounding rectangle
-            wave.left_point = wave.points[0]
-            wave.right_point = wave.points[-1]
-            wave.rect.x = int(wave.points[0, 0])
-            wave.rect.y = int(wave.points[0, 1])
-            wave.rect.width = int(abs(wave.points[0, 0] - wave.points[-1, 0]))
-            wave.rect.height = int(abs(wave.points[0, 1] - wave.points[-1, 1]))
-
-    def _draw(self):
-        for wave in self.sprites():
-            self.pg.draw.lines(self.screen, wave.colour, False, wave.points.astype(np.int32).tolist(), 3)
-
-class LongWaveGroup(Group):
-    """A class to manage a single wave emitted from the center."""
-
-    def __init__(self, game_instance):
-        super().__init__()
-        self.game_instance = game_instance
-        self.pg = game_instance.pg
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.settings = game_instance.settings
-
-    def create_long_wave(self, colour):
-        """Create a new wave and add it to the group."""
-        wave = self.pg.sprite.Sprite()
-        wave.colour = colour
-        wave.point_0 = [float(self.game_instance.sun.rect.centerx), float(self.game_instance.sun.rect.centery)]
-        wave.point_1 = [float(random.randrange(self.screen_rect.width - 250, self.screen_rect.width - 210)),
-                        float(random.randrange(70, self.screen_rect.height - 70))]
-        wave.point_2 = [float(random.randrange(self.screen_rect.width - 350, self.screen_rect.width - 250)),
-                        float(random.randrange(70, self.screen_rect.height - 70))]
-        wave.point_3 = [float(random.randrange(self.screen_rect.width - 450, self.screen_rect.width - 350)),
-                        float(random.randrange(70, self.screen_rect.height - 70))]
-        wave.control_1 = self._calculate_control_point(wave.point_0, wave.point_1)
-        wave.control_2 = self._calculate_control_point(wave.point_2, wave.point_3)
-        wave.points = bezier_curve_points(
-            np.array(wave.point_0), np.array(wave.control_1),
-            np.array(wave.control_2), np.array(wave.point_3)
-        )
-        wave.left_point = wave.points[0]
-        wave.right_point = wave.point_0
-        wave.rect = self.pg.Rect(0, 0, 0, 0)
-
-        return wave
-
-    def _calculate_control_point(self, p1, p2):
-        return [(p1[0] + p2[0]) / 2, p1[1] + random.randrange(-50, 50)]
-
-    def update_long_wave(self, dt):
-        """Update the wave position based on elapsed time."""
-        for wave in self.sprites():
-            speed = self.settings.wave_speed * dt
-            update_wave_points(wave.points, speed)
-            wave.left_point = wave.points[0]
-            wave.right_point = wave.points[-1]
-            wave.rect.x = int(wave.points[0, 0])
-            wave.rect.y = int(wave.points[0, 1])
-            wave.rect.width = int(abs(wave.points[0, 0] - wave.points[-1, 0])
+        cell_starts, entries = build_spatial_hash(other_boxes, self.cell_size, self.columns, self.rows)
+        hits[np.ix_(wave_indices, other_indices)] = calculate_wave_crossings(
+            segments, owners, boxes, other_segments, other_owners, other_boxes,
+            cell_starts, entries, self.cell_size, self.columns, self.rows, len(wave_indices), len(other_indices)
             )
-            wave.rect.height = int(abs(wave.points[0, 1] - wave.points[-1, 1]))
-
-    def _draw(self):
-        """Draws the wave using the computed Bezier curve points."""
-        for wave in self.sprites():
-            self.pg.draw.lines(self.screen, wave.colour, False, wave.points.astype(np.int32).tolist(), 3)
 
-class UpWaveGroup(Group):
-    """A class to manage a single up wave emitted from the top."""
+        return waves, other_waves, hits
 
-    def __init__(self, game_instance):
-        super().__init__()
-        self.game_instance = game_instance
-        self.pg = game_instance.pg
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.settings = game_instance.settings
-
-    def create_up_wave(self, colour):
-        """Create a new wave and add it to the group."""
-        wave = self.pg.sprite.Sprite()
-        wave.colour = colour
-        wave.point_0 = [float(self.game_instance.sun.rect.centerx), float(self.game_instance.sun.rect.centery - 40)]
-        wave.point_1 = [float(random.randrange(self.screen_rect.width - 250, self.screen_rect.width - 210)),
-                        float(random.randrange(70, int(self.screen_rect.height / 2) - 70))]
-        wave.point_2 = [float(random.randrange(self.screen_rect.width - 350, self.screen_rect.width - 250)),
-                        float(random.randrange(70, int(self.screen_rect.height / 2) - 70))]
-        wave.point_3 = [float(random.randrange(self.screen_rect.width - 450, self.screen_rect.width - 350)),
-                        float(random.randrange(70, int(self.screen_rect.height / 2) - 70))]
-
-        wave.control_1 = self._calculate_control_point(wave.point_0, wave.point_1)
-        wave.control_2 = self._calculate_control_point(wave.point_2, wave.point_3)
-        wave.points = bezier_curve_points(
-            np.array(wave.point_0), np.array(wave.control_1),
-            np.array(wave.control_2), np.array(wave.point_3)
-        )
-
-        wave.left_point = wave.points[0]
-        wave.right_point = wave.point_0
-
-        wave.rect = self.pg.Rect(0, 0, 0, 0)
-
-        return wave
-
-    def _calculate_control_point(self, p1, p2):
-        """Calculate the midpoint control point with a slight random offset."""
-        return [(p1[0] + p2[0]) / 2, p1[1] + random.randrange(-50, 50)]
-
-    def update(self, dt):
-        """Update the wave position based on elapsed time."""
-        for wave in self.sprites():
-            speed = self.settings.wave_speed * dt
-            update_wave_points(wave.points, speed)
-            wave.left_point = wave.points[0]
-            wave.right_point = wave.points[-1]
-            wave.rect.x = int(wave.points[0, 0])
-            wave.rect.y = int(wave.points[0, 1])
-            wave.rect.width = int(abs(wave.points[0, 0] - wave.points[-1, 0]))
-            wave.rect.height = int(abs(wave.points[0, 1] - wave.points[-1, 1]))
-
-    def _draw(self):
-        """Draw the wave using the computed Bezier curve points."""
-        for wave in self.sprites():
-            self.pg.draw.lines(self.screen, wave.colour, False, wave.points.astype(np.int32).tolist(), 3)
-        
-class DownWaveGroup(Group):
-    """A class to manage a single down wave emitted from the bottom."""
-
-    def __init__(self, game_instance):
-        super().__init__()
-        self.game_instance = game_instance
-        self.pg = game_instance.pg
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.settings = game_instance.settings
-
-    def create_wave(self, colour):
-        """Create a new wave and add it to the group."""
-        wave = self.pg.sprite.Sprite()
-        wave.colour = colour
-        wave.point_0 = [float(self.game_instance.sun.rect.centerx), float(self.game_instance.sun.rect.centery + 40)]
-        wave.point_1 = [float(random.randrange(self.screen_rect.width - 250, self.screen_rect.width - 210)),
-                        float(random.randrange(int(self.screen_rect.height / 2) + 70, self.screen_rect.height))]
-        wave.point_2 = [float(random.randrange(self.screen_rect.width - 350, self.screen_rect.width - 250)),
-                        float(random.randrange(int(self.screen_rect.height / 2) + 70, self.screen_rect.height))]
-        wave.point_3 = [float(random.randrange(self.screen_rect.width - 450, self.screen_rect.width - 350)),
-                        float(random.randrange(int(self.screen_rect.height / 2) + 70, self.screen_rect.height))]
-
-        wave.control_1 = self._calculate_control_point(wave.point_0, wave.point_1)
-        wave.control_2 = self._calculate_control_point(wave.point_2, wave.point_3)
-        wave.points = bezier_curve_points(
-            np.array(wave.point_0), np.array(wave.control_1),
-            np.array(wave.control_2), np.array(wave.point_3)
-        )
-
-        wave.left_point = wave.points[0]
-        wave.right_point = wave.point_0
-
-        wave.rect = self.pg.Rect(0, 0, 0, 0)
-
-        return wave
-
-    def _calculate_control_point(self, p1, p2):
-        """Calculate the midpoint control point with a slight random offset."""
-        return [(p1[0] + p2[0]) / 2, p1[1] + random.randrange(-50, 50)]
-
-    def update(self, dt):
-        """Update the wave position based on elapsed time."""
-        for wave in self.sprites():
-            speed = self.settings.wave_speed * dt
-            update_wave_points(wave.points, speed)
-            wave.left_point = wave.points[0]
-            wave.right_point = wave.points[-1]
-            wave.rect.x = int(wave.points[0, 0])
-            wave.rect.y = int(wave.points[0, 1])
-            wave.rect.width = int(abs(wave.points[0, 0] - wave.points[-1, 0]))
-            wave.rect.height = int(abs(wave.points[0, 1] - wave.points[-1, 1]))
-
-    def _draw(self):
-        """Draw the wave using the computed Bezier curve points."""
-        for wave in self.sprites():
-            self.pg.draw.lines(self.screen, wave.colour, False, wave.points.astype(np.int32).tolist(), 3)
-
-class RightWaveGroup(Group):
-    """A class to manage a single wave fired by the doublerocket."""
-    def __init__(self, game_instance):
-        super().__init__()
-        self.pg = game_instance.pg
-        self.game_instance = game_instance
-        self.screen = game_instance.screen
-        self.screen_rect = game_instance.screen_rect
-        self.settings = game_instance.settings
-
-    def create_wave(self, colour):
-        """Create a new wave and add it to the group."""
-        wave = self.pg.sprite.Sprite()
-        wave.colour = colour
-        wave.amplitude = float(20)
-        wave.frequency = 0.10
-        wave.phase = 0
-        wave.starting_height = float(self.game_instance.doublerocket.rect.centery)
-        wave.points = calculate_points(
-            self.game_instance.doublerocket.rect.centerx, self.game_instance.doublerocket.rect.centerx + 100,
-            wave.amplitude, wave.frequency, wave.phase, wave.starting_height
-        )
-        wave.point_0 = wave.points[-1]
-        wave.left_point = wave.points[0]
-        wave.right_point = wave.point_0
-        wave.rect = self.pg.Rect(0, 0, 0, 0)
-
-        return wave
-
-    def update(self, dt):
-        """Update the sine wave's points and position."""
-        for wave in self.sprites():
-            wave.phase += wave.frequency  # Increment phase
-            speed = self.settings.wave_speed * dt
-
-            # Use Numba-optimized update function
-            update_right_points(
-                wave.points, speed, wave.frequency, wave.phase, wave.starting_height, wave.amplitude
+    def _overlaps(self, boxes, other_boxes):
+        """Returns a (boxes, other boxes) array of flags, set where two boxes overlap."""
+        return (
+            (boxes[:, None, 0] <= other_boxes[None, :, 2]) & (boxes[:, None, 2] >= other_boxes[None, :, 0])
+            & (boxes[:, None, 1] <= other_boxes[None, :, 3]) & (boxes[:, None, 3] >= other_boxes[None, :, 1])
             )
 
-            # Update position of the wave's bounding rectangle
-            wave.left_point = wave.points[0]
-            wave.right_point = wave.points[-1]
-
-    def _draw(self):
-        """Draw the wave using the computed Bezier curve points."""
-        for wave in self.sprites():
-            self.pg.draw.lines(self.screen, wave.colour, False, wave.points.astype(np.int32).tolist(), 3)
\ No newline at end of file
+    def draw(self, surface):
+        """
+        Draws every wave, sine waves being evaluated along their curve.
+        """
+        for index in range(self.count):
+            points = calculate_wave_points(self.points, self.point_counts, self.sine, self.curves, index).astype(np.int32).tolist()
+            self.pg.draw.lines(surface, self.row_sprites[index].colour, False, points, 3)
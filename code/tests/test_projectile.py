@@ -0,0 +1,99 @@
+from fractions import Fraction
+from pathlib import Path
+import random
+
+import pygame
+import pytest
+
+from resources.projectile import ProjectileGroup, segment_hits_box
+from resources.spatial_hash import SpatialHash
+
+IMAGES = Path(__file__).resolve().parent.parent / "resources" / "images"
+
+def reference_hit(x0, y0, x1, y1, left, top, right, bottom):
+    """
+    Exact brute-force answer: clips the segment to the closed box with fractions, then
+    checks the middle of what is left lies strictly inside the box.
+    """
+    t_enter, t_exit = Fraction(0), Fraction(1)
+    for start, end, low, high in ((x0, x1, left, right), (y0, y1, top, bottom)):
+        delta = end - start
+        if delta == 0:
+            if not low <= start <= high:
+                return False
+            continue
+        t_low, t_high = sorted((Fraction(low - start, delta), Fraction(high - start, delta)))
+        t_enter, t_exit = max(t_enter, t_low), min(t_exit, t_high)
+        if t_enter > t_exit:
+            return False
+
+    t = (t_enter + t_exit) / 2
+    x, y = x0 + t * (x1 - x0), y0 + t * (y1 - y0)
+    return left < x < right and top < y < bottom
+
+def hits(x0, y0, x1, y1, box):
+    return segment_hits_box(x0, y0, x1 - x0, y1 - y0, *box)
+
+BOX = (10, 10, 20, 20)
+
+@pytest.mark.parametrize("segment, expected", [
+    ((0, 15, 30, 15), True),     #Straight through
+    ((15, 15, 15, 15), True),    #Resting inside
+    ((0, 0, 30, 30), True),      #Through both corners
+    ((0, 20, 20, 0), False),     #Grazing the top-left corner only
+    ((10, 30, 30, 10), False),   #Grazing the bottom-right corner only
+    ((0, 10, 30, 10), False),    #Sliding along the top edge
+    ((20, 0, 20, 30), False),    #Sliding along the right edge
+    ((0, 15, 10, 15), False),    #Stopping on the left edge
+    ((0, 15, 11, 15), True),     #Stopping just inside
+    ((0, 0, 5, 5), False),       #Far away
+    ])
+def test_touch_cases(segment, expected):
+    assert hits(*segment, BOX) == expected
+    assert reference_hit(*segment, *BOX) == expected
+
+def test_matches_brute_force():
+    rng = random.Random(5)
+    for _ in range(5000):
+        #Small integer coordinates make edge and corner touches common
+        x0, y0, x1, y1 = (rng.randint(0, 30) for _ in range(4))
+        assert hits(x0, y0, x1, y1, BOX) == reference_hit(x0, y0, x1, y1, *BOX), (x0, y0, x1, y1)
+
+class Settings:
+    projectile_speed = 600
+
+class Game:
+    def __init__(self):
+        pygame.display.init()
+        self.pg = pygame
+        self.screen = pygame.display.set_mode((640, 480))
+        self.settings = Settings()
+
+def test_swept_pairs_matches_brute_force():
+    projectiles = ProjectileGroup(Game(), str(IMAGES / "star_red.bmp"))
+    width, height = projectiles.rect.size
+    spatial_hash = SpatialHash(projectiles.screen_rect)
+    rng = random.Random(7)
+
+    targets = [pygame.Rect(rng.randint(0, 600), rng.randint(0, 440), rng.randint(1, 60), rng.randint(1, 60)) for _ in range(15)]
+    spatial_hash.rebuild({"targets": ([(t.left, t.top, t.right, t.bottom) for t in targets], list(range(len(targets))))})
+    for _ in range(60):
+        projectiles.add(projectiles.create_projectile((rng.randint(0, 620), rng.randint(0, 460)), "fire_right"))
+
+    #Whole-pixel paths, so the reference can work exactly
+    for projectile in projectiles:
+        start = rng.randint(0, 620), rng.randint(0, 460)
+        projectiles.previous_positions[projectile.index] = start
+        projectiles.exact_positions[projectile.index] = start[0] + rng.randint(-80, 80), start[1] + rng.randint(-80, 80)
+
+    found = set(zip(*projectiles.swept_pairs(spatial_hash, "targets")))
+    expected = set()
+    for projectile in projectiles:
+        x0, y0 = projectiles.previous_positions[projectile.index].astype(int).tolist()
+        x1, y1 = projectiles.exact_positions[projectile.index].astype(int).tolist()
+        for j, target in enumerate(targets):
+            #The projectile's top-left corner against the target grown by the projectile size
+            if reference_hit(x0, y0, x1, y1, target.left - width, target.top - height, target.right, target.bottom):
+                expected.add((projectile, j))
+    assert found == expected
+    assert expected
@@ -0,0 +1,36 @@
+import numpy as np
+import pygame
+
+from resources.spatial_hash import SpatialHash
+
+SCREEN_RECT = pygame.Rect(0, 0, 640, 480)
+
+def random_boxes(rng, count):
+    """Boxes (left, top, right, bottom) of up to 150 pixels, some of them poking out of the screen."""
+    lefts_tops = rng.integers(-50, 600, (count, 2))
+    return np.hstack((lefts_tops, lefts_tops + rng.integers(0, 150, (count, 2))))
+
+def overlap(box, other):
+    return box[0] < other[2] and box[2] > other[0] and box[1] < other[3] and box[3] > other[1]
+
+def test_query_matches_brute_force():
+    rng = np.random.default_rng(3)
+    spatial_hash = SpatialHash(SCREEN_RECT)
+    for _ in range(20):
+        red, blue = random_boxes(rng, 40), random_boxes(rng, 25)
+        spatial_hash.rebuild({"red": (red, ["red"] * 40), "blue": (blue, ["blue"] * 25)})
+        query_boxes = random_boxes(rng, 30)
+
+        query_indices, entry_indices = spatial_hash.query(query_boxes, "blue")
+        pairs = list(zip(query_indices.tolist(), entry_indices.tolist()))
+
+        #Each pair comes once, and only from the queried layer
+        expected = {(q, 40 + e) for q in range(30) for e in range(25) if overlap(query_boxes[q], blue[e])}
+        assert len(pairs) == len(set(pairs))
+        assert set(pairs) == expected
+
+def test_query_of_unknown_layer_is_empty():
+    spatial_hash = SpatialHash(SCREEN_RECT)
+    spatial_hash.rebuild({"red": ([(0, 0, 100, 100)], ["red"])})
+    query_indices, entry_indices = spatial_hash.query([(10, 10, 20, 20)], "green")
+    assert query_indices.size == 0 and entry_indices.size == 0
@@ -0,0 +1,39 @@
+import numpy as np
+
+from resources.alien_hunt.ufo import resolve_green_bounces
+
+WIDTH, HEIGHT = 50, 30
+SCREEN_WIDTH, SCREEN_HEIGHT = 800, 600
+
+def bounce(position, velocity, obstacles, hit_obstacle):
+    """Runs the kernel on a single ufo and returns its position, direction and bounce flag."""
+    exact_positions = np.array([position], dtype=np.float32)
+    velocities = np.array([velocity], dtype=np.float32)
+    directions = np.ones(1, dtype=np.float32)
+    bounced = resolve_green_bounces(
+        exact_positions, velocities, directions, 1, WIDTH, HEIGHT,
+        np.array(obstacles, dtype=np.int64).reshape(-1, 4), np.array([hit_obstacle], dtype=np.int64),
+        SCREEN_WIDTH, SCREEN_HEIGHT
+        )
+    return exact_positions[0], directions[0], bounced[0]
+
+def test_obstacle_pushes_ufo_out_and_flips_it():
+    position, direction, bounced = bounce((370, 100), (1, 0), [(400, 80, 500, 200)], 0)
+    assert position[0] == 400 - WIDTH - 1
+    assert direction == -1 and bounced
+
+def test_screen_edge_flips_ufo():
+    position, direction, bounced = bounce((SCREEN_WIDTH - 10, 100), (1, 0), [(0, 0, 0, 0)], -1)
+    assert position[0] == SCREEN_WIDTH - WIDTH - 1
+    assert direction == -1 and bounced
+
+def test_obstacle_against_screen_edge_still_flips_ufo():
+    #Pushed out of the right side of the obstacle, the ufo would land past the right edge
+    position, direction, bounced = bounce((765, 100), (-1, 0), [(760, 80, SCREEN_WIDTH, 200)], 0)
+    assert 0 < position[0] <= SCREEN_WIDTH - WIDTH - 1
+    assert direction == -1 and bounced
+
+def test_ufo_clear_of_everything_keeps_going():
+    position, direction, bounced = bounce((300, 300), (1, 0), [(0, 0, 0, 0)], -1)
+    assert tuple(position) == (300, 300)
+    assert direction == 1 and not bounced
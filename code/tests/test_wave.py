@@ -0,0 +1,171 @@
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+from resources.projectile import segment_hits_box
+from resources.sun_escape.wave import WaveGroup, calculate_wave_points, segments_intersect
+
+class Settings:
+    wave_speed = 120
+
+class Game:
+    def __init__(self):
+        pygame.display.init()
+        self.pg = pygame
+        self.screen = pygame.display.set_mode((1600, 900))
+        self.screen_rect = self.screen.get_rect()
+        self.settings = Settings()
+
+@pytest.fixture
+def game():
+    return Game()
+
+def sine_wave(group, form, left, right, amplitude=60.0, starting_height=450.0):
+    """Builds a sine wave sprite the way create_sin_wave and create_right_wave do."""
+    wave = pygame.sprite.Sprite()
+    wave.form, wave.colour = form, "yellow"
+    wave.amplitude, wave.frequency, wave.phase, wave.starting_height = amplitude, 0.10, 0, starting_height
+    group._set_span(wave, left, right)
+    return wave
+
+def path_wave(points):
+    """Builds a bezier-like wave sprite from explicit points."""
+    wave = pygame.sprite.Sprite()
+    wave.form, wave.colour = "long", "red"
+    wave.points = np.asarray(points, dtype=np.float32)
+    return wave
+
+def random_waves(group, rng):
+    """Fills a group with random walks and sine waves spread over the screen."""
+    for _ in range(4):
+        steps = rng.normal(0, 6, (int(rng.integers(2, 200)), 2))
+        group.add(path_wave(np.cumsum(steps, axis=0) + rng.uniform((100, 100), (1500, 800))))
+    for _ in range(3):
+        left = rng.uniform(0, 1300)
+        group.add(sine_wave(group, "sin", left, left + rng.uniform(20, 300), rng.uniform(20, 140), rng.uniform(200, 700)))
+    for _ in range(int(rng.integers(0, 30))):
+        group.update(1 / 60)
+
+def points_of(group, wave):
+    return calculate_wave_points(group.points, group.point_counts, group.sine, group.curves, wave.index)
+
+@pytest.mark.parametrize("form, direction", [("sin", -1), ("right", 1)])
+def test_sine_curve_matches_moving_every_point(game, form, direction):
+    group = WaveGroup(game)
+    wave = sine_wave(group, form, 1150, 1500)
+    group.add(wave)
+
+    #The original update: move every point, advance the phase, recompute every y
+    x = np.linspace(1150, 1150 + wave.num_points, wave.num_points)
+    phase = 0.0
+    for _ in range(200):
+        group.update(1 / 60)
+        x += direction * Settings.wave_speed / 60
+        phase += wave.frequency
+        y = wave.starting_height + np.sin(x * wave.frequency + phase) * wave.amplitude
+
+    np.testing.assert_allclose(points_of(group, wave), np.stack((x, y), axis=1), atol=1e-9)
+    box = group.boxes[wave.index]
+    assert box[0] == pytest.approx(x[0]) and box[2] == pytest.approx(x[-1])
+    assert box[1] <= y.min() and box[3] >= y.max()
+
+def test_sine_waves_keep_no_points(game):
+    group = WaveGroup(game)
+    group.add(sine_wave(group, "sin", 100, 1500))
+    assert group.width == WaveGroup.initial_width
+
+def brute_rect_hit(points, rect):
+    """Tests every segment of a path against a rect."""
+    return any(
+        segment_hits_box(x0, y0, x1 - x0, y1 - y0, *rect)
+        for (x0, y0), (x1, y1) in zip(points[:-1].tolist(), points[1:].tolist())
+        )
+
+def test_rect_hits_match_brute_force(game):
+    rng = np.random.default_rng(11)
+    found = 0
+    for _ in range(30):
+        group = WaveGroup(game)
+        random_waves(group, rng)
+        lefts_tops = rng.uniform(0, 1500, (20, 2))
+        rects = np.hstack((lefts_tops, lefts_tops + rng.uniform(0, 120, (20, 2))))
+
+        waves, hits = group.rect_hits(rects)
+        for i, wave in enumerate(waves):
+            points = points_of(group, wave)
+            for j, rect in enumerate(rects.tolist()):
+                assert hits[i, j] == brute_rect_hit(points, rect)
+        found += hits.sum()
+    assert found
+
+def test_rect_touching_a_wave_is_not_hit(game):
+    group = WaveGroup(game)
+    group.add(path_wave([(100, 300), (200, 300), (300, 300)]))
+    _, hits = group.rect_hits([(150, 300, 250, 350), (150, 250, 250, 300), (150, 290, 250, 310), (150, 290, 150, 310)])
+    assert hits.tolist() == [[False, False, True, False]]
+
+def reference_intersect(a, b, c, d):
+    """Exact brute-force answer for integer points: do segments ab and cd share a point?"""
+    def cross(o, p, q):
+        return (p[0] - o[0]) * (q[1] - o[1]) - (p[1] - o[1]) * (q[0] - o[0])
+
+    def on_segment(p, q, r):
+        return min(p[0], q[0]) <= r[0] <= max(p[0], q[0]) and min(p[1], q[1]) <= r[1] <= max(p[1], q[1])
+
+    if a == b or c == d:
+        #A segment reduced to a point meets the other if the point lies on it
+        point, p, q = (a, c, d) if a == b else (c, a, b)
+        return cross(p, q, point) == 0 and on_segment(p, q, point)
+    d1, d2, d3, d4 = cross(c, d, a), cross(c, d, b), cross(a, b, c), cross(a, b, d)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return True
+    return (
+        (d1 == 0 and on_segment(c, d, a)) or (d2 == 0 and on_segment(c, d, b))
+        or (d3 == 0 and on_segment(a, b, c)) or (d4 == 0 and on_segment(a, b, d))
+        )
+
+@pytest.mark.parametrize("segments, expected", [
+    (((0, 0), (10, 10), (0, 10), (10, 0)), True),   #Crossing
+    (((0, 0), (10, 0), (10, 0), (20, 5)), True),    #Sharing an end
+    (((0, 0), (10, 0), (5, 0), (5, 5)), True),      #One end on the other segment
+    (((0, 0), (10, 0), (5, 0), (15, 0)), True),     #Overlapping on the same line
+    (((0, 0), (10, 0), (11, 0), (15, 0)), False),   #Same line, apart
+    (((0, 0), (10, 0), (0, 1), (10, 1)), False),    #Parallel
+    (((0, 0), (10, 10), (6, 5), (20, 5)), False),   #Stopping just short
+    ])
+def test_segments_intersect_cases(segments, expected):
+    assert segments_intersect(*[value for point in segments for value in point]) == expected
+    assert reference_intersect(*segments) == expected
+
+def test_segments_intersect_matches_brute_force():
+    rng = random.Random(13)
+    for _ in range(5000):
+        #A small grid makes shared ends and aligned segments common
+        a, b, c, d = ((rng.randint(0, 6), rng.randint(0, 6)) for _ in range(4))
+        assert segments_intersect(*a, *b, *c, *d) == reference_intersect(a, b, c, d), (a, b, c, d)
+
+def brute_crossing(points, other_points):
+    return any(
+        segments_intersect(*points[k], *points[k + 1], *other_points[m], *other_points[m + 1])
+        for k in range(len(points) - 1) for m in range(len(other_points) - 1)
+        )
+
+def test_wave_crossings_match_brute_force(game):
+    rng = np.random.default_rng(17)
+    found = 0
+    for _ in range(15):
+        group, other = WaveGroup(game), WaveGroup(game)
+        random_waves(group, rng)
+        random_waves(other, rng)
+        #Removing rows swaps others into their place
+        other.remove(*other.row_sprites[:other.count:3])
+
+        waves, other_waves, hits = group.wave_crossings(other)
+        for i, wave in enumerate(waves):
+            points = points_of(group, wave).tolist()
+            for j, other_wave in enumerate(other_waves):
+                assert hits[i, j] == brute_crossing(points, points_of(other, other_wave).tolist())
+        found += hits.sum()
+    assert found